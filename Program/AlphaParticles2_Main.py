@@ -25,8 +25,8 @@ from datetime import datetime # We are going to use the local date and time to n
 import os # We need this module to make a directory for all of the data files that are going to be generated.
 import sys # We need this module in case the user inputs a value outside the range of floating point numbers that Python can deal with.
 import random # Import the "random" module of Python. We are going to use it to generate random numbers. We want to generate a randomised 3x3 matrix for taking each alpha particle from one simulation step to the next. And we want to have some control over its elements. However, the parts of the matrix that stay constant shall be defined globally while the parts that change for each particle and simulation step shall be put into a method in the AlphaParticles class, namely update_AlphaParticleMomentum().
-import multiprocessing as mp # ... for parallelising the execution class methods and thus reduce their overall execution time.
 import time # ... for timing the execution of code without outputting the clutter that is outputted by pprofile's deterministic profiling.
+import traceback # ... for showing what went wrong in a job of a job spec file without stopping the jobs after it.
 
 # External modules ...
 import numpy as np # We are going to deal with arrays because they are more useful than lists of lists. The indexing in lists of lists is not quite what I want. For example, if List = [[1,0,0]] * 3 and then I say List[1][1] = 2, I would get [[1,2,0],[1,2,0],[1,2,0]] instead of [[1,0,0],[1,2,0],[1,0,0]], which is what numpy gives me when I use numpy.array().
@@ -36,6 +36,20 @@ import psutil # ... for counting the number of physical cores rather than logica
 
 # My script files ...
 import TimerAdmin # TimerAdmin is a profiler administrator specifically for my program. The TimerAdmin.py file has only class and method definitions, so no code is executed from it when it is imported.
+import RandomNumberAdmin # RandomNumberAdmin makes the numpy random number generator that each simulation instance uses. Like TimerAdmin.py, it has only class and method definitions.
+import TrajectoryAdmin # TrajectoryAdmin keeps the x-positions of the alpha particles at each simulation step without concatenating arrays at every simulation step.
+import RangeEstimator # RangeEstimator calculates the maximum range, the mean range and the thickness of medium that transmits a given number of alpha particles from the furthest x-position of each alpha particle.
+import ResultAdmin # ResultAdmin defines the small results object that each simulation instance of the beam analysis sends back from its pooled process.
+import SharedMemoryAdmin # SharedMemoryAdmin lets the pooled processes of the radiotherapy game write their results into shared memory instead of pickling them.
+import EnergyDepositAdmin # EnergyDepositAdmin adds up the momentum that the alpha particles lose in the radiotherapy game during the simulation.
+import PoolAdmin # PoolAdmin keeps one pool of processes that every mode of the program uses, instead of each mode making its own pool.
+import ConvergenceAdmin # ConvergenceAdmin decides when the beam analysis has run enough simulation instances for its results to have converged.
+import BatchAdmin # BatchAdmin reads the command-line arguments and the job spec files for running the program without asking any questions.
+import SweepAdmin # SweepAdmin makes the points of a parameter sweep of the beam analysis and keeps the checkpoint file and table of their results.
+import CacheAdmin # CacheAdmin keeps the results of seeded simulations on the disk so that the same inputs are not simulated again.
+import ParticleAdmin # ParticleAdmin keeps the state of the alpha particles in the beam as one named array per field instead of one array with numbered columns.
+import MediumAdmin # MediumAdmin calculates the quantities of each medium that are needed at each simulation step once per medium.
+import ProgressAdmin # ProgressAdmin lets the pooled processes publish their progress through shared memory, and the main process print it.
 
 # REFERENCES: 
     # Python Software Foundation (2020). math — Mathematical functions, https://docs.python.org/3/library/math.html.
@@ -210,6 +224,10 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
     def __init__(self):
         super().__init__() # Inherit the MinimumAlphaEnergy_eV variable.
 
+        self.Seed = None # The random number generators are not seeded unless the user provides a seed.
+        self.TargetRelativeUncertainty = None # This variable is only given a value if the user wants the beam analysis to run simulation instances until its results converge, rather than a fixed number of simulation instances.
+        self.AmountOfNumbers = None # This variable is only given a value if the user chooses the discrete probability density function. It must be known *before* the simulation starts because the user cannot be asked for inputs inside the pooled processes.
+
     
     def show_AboutTheProgram(self): # Tell the user basic information about the program.
         print("The program has loaded.")
@@ -287,6 +305,9 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
         except:
             print("Error: You did not type the name of one of the probability density functions that were specified in the list above. The program will now exit")
             exit() # Do not continue running the program because the user did not specify a valid value for the variable. The RETURN keyword may still let the program run.
+
+        if self.RandomDistribution == "discrete": # Ask for the discretisation now rather than in the middle of the simulation.
+            self.get_AmountOfNumbersForDiscreteDistribution()
         
         print()
 
@@ -304,13 +325,20 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
         if self.ToSeed in set(["y", "Y"]):
             try:
                 self.Seed = int(self.check_FloatingPointInput(float(input("\tPlease input an integer seed number for the random number generators of the program: "))))
+
+                while self.Seed < 0: # numpy's random number generators only accept seeds that are 0 or greater.
+                    print("Error: The seed must be an integer that is 0 or greater. Please try again.")
+                    self.Seed = int(self.check_FloatingPointInput(float(input("\tPlease input an integer seed number for the random number generators of the program: "))))
+
                 print()
             
             except:
                 print("You did not provide an integer for the seed. The program will now exit.")
                 exit()
 
-            random.seed(a = self.Seed, version = 2) # Initialise the random number generators of the random standard library.
+            # NOTE: Before the RandomNumberAdmin.py script was made ...
+            # random.seed(a = self.Seed, version = 2) # Initialise the random number generators of the random standard library.
+            # Now the seed is passed to the random number generator of each simulation instance via the make_RandomNumberGenerator() method of the AlphaParticles class.
         
         elif self.ToSeed in set(["n", "N"]):
             print("Ok. The random number generators will *not* be seeded.")
@@ -323,6 +351,48 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
         return self.InitialKineticEnergy, self.InitialParticleNumber, self.RandomDistribution # This sequence of values exits the function and can be used elsewhere in the program. When the get_Inputs() function is executed, the rest of the program sees a sequence of the numbers that are in the RETURN statement. This is why InitialKineticEnergy, InitialParticleNumber = get_Inputs() in the main() function is valid.
 
     
+    def get_AmountOfNumbersForDiscreteDistribution(self, NumberOfRandomNumbers = None): # This method was moved here from the randomNum_0to1() method of the AlphaParticles class so that the user is not asked for an input in the middle of the simulation. NumberOfRandomNumbers is the answer to the question if it is already known, e.g., from a job of a job spec file.
+        if NumberOfRandomNumbers is not None:
+            self.AmountOfNumbers = int(NumberOfRandomNumbers) - 1
+            return self.AmountOfNumbers
+
+        try: # Approach the error handling for the AmountOfNumbers variable in the same way as the error-handling for the InitialParticleNumber variable was approached because both these variables must be an integer greater than 0.
+            self.AmountOfNumbers = int(self.check_FloatingPointInput(float(input("\tOption: discrete\n\t\tHow many random numbers between 0 and 1 inclusive should be possible to be generated? "))) - 1)
+
+        except:
+            print("Error: You did not input an integer greater than 0 for the number of numbers that can be randomly generated. The program will now exit.")
+            exit() # This is what I want the program to do in this case.
+
+        while self.AmountOfNumbers <= 0: # ... if the user specified an integer value but it is negative.
+            print("Error: You must input an integer greater than 1 for the number of numbers to be randomly generated. Please try again.")
+
+            try:
+                self.AmountOfNumbers = int(self.check_FloatingPointInput(float(input("\tOption: discrete\n\t\tHow many random numbers between 0 and 1 inclusive should be possible to be generated? "))) - 1)
+
+            except: # ... if the user gave an input that would raise an error.
+                print("You did not input an integer greater than 0. The program will now exit.")
+                exit() # This is what I want the program to do in this case.
+
+        return self.AmountOfNumbers
+
+        # REFERENCE: Python Software Foundation. (2013, 1 August 2013). PEP 8 -- Style Guide for Python Code. Retrieved from https://www.python.org/dev/peps/pep-0008/
+
+
+    def get_TargetRelativeUncertainty(self): # This method is for the beam analysis when the user chooses 0 simulation instances, i.e., to run simulation instances until the results converge.
+        try:
+            self.TargetRelativeUncertainty = self.check_FloatingPointInput(float(input("\tWhat is the largest uncertainty (3 standard errors of the mean) that the mean range and maximum range may have, as a fraction of their values? (e.g., 0.01 for 1%) ")))
+
+            while self.TargetRelativeUncertainty <= 0.0:
+                print("Error: The uncertainty must be greater than 0. Please try again.")
+                self.TargetRelativeUncertainty = self.check_FloatingPointInput(float(input("\tWhat is the largest uncertainty (3 standard errors of the mean) that the mean range and maximum range may have, as a fraction of their values? (e.g., 0.01 for 1%) ")))
+
+        except:
+            print("Error: You did not provide a valid answer. The program will now exit.")
+            exit()
+
+        return self.TargetRelativeUncertainty
+
+
     def get_InputsForAlphaBeam_CrossSectionalArea(self): # This method is for the Alpha Radiotherapy Game.
         self.BeamHeight = self.check_FloatingPointInput(float(input("What is the height of the alpha beam, in cm? ")))
         self.BeamWidth = self.check_FloatingPointInput(float(input("What is the width of the alpha beam, in cm? ")))
@@ -434,7 +504,7 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
         print("You may specify the number of materials you would like to consider, but the program will select them.")
     
     
-    def choose_MediaForAttenuationQuiz(self):
+    def read_MaterialLibrary(self): # This code was moved here from the choose_MediaForAttenuationQuiz() method so that the parameter sweeps can use the same materials.
         ### Define the media/materials from which a medium will be randomly sampled.
         ## Order of the elements in the list: Material name, Atomic number, Atomic weight (g/mol), Mass density (g/cm^3).
         # NOTE: Mass densities are at 20 degrees C unless otherwise stated.
@@ -489,10 +559,19 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
                 print("Error: The 'AttenuationQuiz_MaterialLibrary.csv' file is not formatted correctly at row {}. All entries in the fourth column, Mass density (g/cm^3), must be floating point numbers between {} and {}.".format(row + 1, FloatMin, FloatMax))
                 print("Please fix the formatting of the file and restart the program. The program will now exit.")
                 exit()
-        
-        
+
+        return self.MaterialLibrary_DF
+
+
+    def choose_MediaForAttenuationQuiz(self, NumberOfMediaToConsider = None, random_number_generator = None): # NumberOfMediaToConsider is the answer to the question if it is already known, e.g., from a job of a job spec file. random_number_generator is a RandomNumberGenerator object from the RandomNumberAdmin.py script when the quiz is seeded, e.g., by a job of a job spec file. Otherwise, the random standard library is used.
+        self.read_MaterialLibrary()
+
         try:
-            self.NumberOfMediaToConsider = int(self.check_FloatingPointInput(float(input("How many media would you like to the quiz to consider? "))))
+            if NumberOfMediaToConsider is not None:
+                self.NumberOfMediaToConsider = int(NumberOfMediaToConsider)
+
+            else:
+                self.NumberOfMediaToConsider = int(self.check_FloatingPointInput(float(input("How many media would you like to the quiz to consider? "))))
         
             while self.NumberOfMediaToConsider <= 0:
                 print("Error: You must specify a positive integer for the number of media to consider. Please try again.")
@@ -506,7 +585,8 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
 
         ### Choose a material from the library at random.
         for medium in range(0, self.NumberOfMediaToConsider):
-            self.ChosenMaterials_DF = pd.concat([self.ChosenMaterials_DF, self.MaterialLibrary_DF.iloc[random.randint(0, self.MaterialLibrary_DF.shape[0] - 1)].T], axis = 1) # Randomly select a material to ask about in the attenuation quiz. For some reason, the inputs from the file would be read in transpose of what we expect. So we transpose the result later.
+            MaterialIndex = random.randint(0, self.MaterialLibrary_DF.shape[0] - 1) if random_number_generator is None else int(random_number_generator.randomNum_0to1() * self.MaterialLibrary_DF.shape[0]) # The "basic" random numbers of the RandomNumberGenerator object are less than 1, so the index is never out of range.
+            self.ChosenMaterials_DF = pd.concat([self.ChosenMaterials_DF, self.MaterialLibrary_DF.iloc[MaterialIndex].T], axis = 1) # Randomly select a material to ask about in the attenuation quiz. For some reason, the inputs from the file would be read in transpose of what we expect. So we transpose the result later.
         
         self.ChosenMaterials_DF = self.ChosenMaterials_DF.T.reset_index(drop = True) # It is not necessary to transpose this DataFrame back to its original orientation.
 
@@ -526,14 +606,14 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
         return self.ChosenMaterials_DF # This DataFrame is going to be used in the AttenuationQuiz class for the attenuation quiz.
 
     
-    def choose_AlphaBeamCharacteristicsForAttenuationQuiz(self):
+    def choose_AlphaBeamCharacteristicsForAttenuationQuiz(self, random_number_generator = None): # random_number_generator is the same as for the choose_MediaForAttenuationQuiz() method.
         self.MaximumAlphaEnergy_Quiz = 1e-3 # Units: MeV.
         
         # Randomly choose a *valid* initial kinetic energy for the alpha particles. For this value to be valid, it must be larger than the minimum kinetic energy that will be simulated.
-        self.InitialKineticEnergy_Quiz = random.uniform(a = 0.0, b = 1.0) * self.MaximumAlphaEnergy_Quiz # Units: MeV.
+        self.InitialKineticEnergy_Quiz = (random.uniform(a = 0.0, b = 1.0) if random_number_generator is None else random_number_generator.randomNum_0to1()) * self.MaximumAlphaEnergy_Quiz # Units: MeV.
         
         while self.InitialKineticEnergy_Quiz <= (self.MinimumAlphaEnergy_eV * 1e-6): # We do not want the initial kinetic energy being less than or equal to the minimum kinetic energy that will be simulated. The units for the energies here are MeV.
-            self.InitialKineticEnergy_Quiz = random.uniform(a = 0.0, b = 1.0) * self.MaximumAlphaEnergy_Quiz # Recalculate the initial kinetic energy of the alpha particles.
+            self.InitialKineticEnergy_Quiz = (random.uniform(a = 0.0, b = 1.0) if random_number_generator is None else random_number_generator.randomNum_0to1()) * self.MaximumAlphaEnergy_Quiz # Recalculate the initial kinetic energy of the alpha particles.
 
         self.InitialParticleNumber_Quiz = 100 # Let it be a number that would not lead to computation times being too long.
         self.RandomDistribution_Quiz = "basic" # ... for now.
@@ -541,11 +621,15 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
         return self.InitialKineticEnergy_Quiz, self.InitialParticleNumber_Quiz, self.RandomDistribution_Quiz
     
 
-    def get_InputsForBeamAnalysisFromFile(self): # Read the inputs from a file so that I do not have to input them every time when I do a timing experiment.
+    def get_InputsForBeamAnalysisFromFile(self, InputFileLines = None): # Read the inputs from a file so that I do not have to input them every time when I do a timing experiment. InputFileLines are the lines of the file if they did not come from the file, e.g., from a job of a job spec file.
         try:
-            self.InputFile_BeamAnalysis = open("InputsForBeamAnalysis.txt", "r")
-            self.InputFileLines_BeamAnalysis = self.InputFile_BeamAnalysis.readlines()
-            self.InputFile_BeamAnalysis.close()
+            if InputFileLines is not None:
+                self.InputFileLines_BeamAnalysis = InputFileLines
+
+            else:
+                self.InputFile_BeamAnalysis = open("InputsForBeamAnalysis.txt", "r")
+                self.InputFileLines_BeamAnalysis = self.InputFile_BeamAnalysis.readlines()
+                self.InputFile_BeamAnalysis.close()
         
         except FileNotFoundError:
             print("Error: The text file named 'InputsForBeamAnalysis' was not found. Please make sure that there is such a file in the same directory as the script file of this program and try again. The program will now exit.")
@@ -565,6 +649,9 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
             self.AtomicWeight_FileInput = int(self.check_FloatingPointInput(float(self.InputFileLines_BeamAnalysis[6].replace("Atomic weight of the medium = ", "").replace(" g/mol", ""))))
             self.MassDensity_FileInput = int(self.check_FloatingPointInput(float(self.InputFileLines_BeamAnalysis[7].replace("Mass density of the medium = ", "").replace(" g/cm^3", ""))))
             self.SimInstances_FileInput = int(self.check_FloatingPointInput(float(self.InputFileLines_BeamAnalysis[8].replace("Number of simulation instances = ", ""))))
+
+            if (len(self.InputFileLines_BeamAnalysis) > 9) and (self.InputFileLines_BeamAnalysis[9].strip() != ""): # This line is optional. It is only used when the number of simulation instances is 0.
+                self.TargetRelativeUncertainty = self.check_FloatingPointInput(float(self.InputFileLines_BeamAnalysis[9].replace("Target relative uncertainty = ", "")))
         
         except:
             print("Error when reading the input file: Please make sure that the file's contents are formatted as follows. Then try running the program again. Alternatively, provide the inputs manually.")
@@ -580,6 +667,7 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
             print("Number of simulation instances = 2")
             print("#" * 10, "End of input file: Ignore this line", "#" * 10)
             print("You may provide any valid input after the '= ' that you would otherwise provide manually via the command terminal. The inputs shown here are an example.")
+            print("If the number of simulation instances is 0, simulation instances are run until the results converge. The file then needs one more line, e.g., 'Target relative uncertainty = 0.01'.")
             exit()
 
         return self.InitialKineticEnergy_FileInput, self.InitialParticleNumber_FileInput, self.RandomDistribution_FileInput, self.WhetherOrNotToSeed_FileInput, self.AtomicNumber_FileInput, self.AtomicWeight_FileInput, self.MassDensity_FileInput, self.SimInstances_FileInput
@@ -588,11 +676,15 @@ class ProgramAdmin(ErrorChecking): # I am using a class for defining the functio
             # Programiz Python Exception Handling Using try, except and finally statement, https://www.programiz.com/python-programming/exception-handling.
 
     
-    def get_InputsForRTGameFromFile(self): # Read the inputs from a file so that I do not have to input them every time when I do a timing experiment.
+    def get_InputsForRTGameFromFile(self, InputFileLines = None): # Read the inputs from a file so that I do not have to input them every time when I do a timing experiment. InputFileLines are the lines of the file if they did not come from the file, e.g., from a job of a job spec file.
         try:
-            self.InputFile_RTGame = open("InputsForRTGame.txt", "r")
-            self.InputFileLines_RTGame = self.InputFile_RTGame.readlines()
-            self.InputFile_RTGame.close()
+            if InputFileLines is not None:
+                self.InputFileLines_RTGame = InputFileLines
+
+            else:
+                self.InputFile_RTGame = open("InputsForRTGame.txt", "r")
+                self.InputFileLines_RTGame = self.InputFile_RTGame.readlines()
+                self.InputFile_RTGame.close()
 
         except FileNotFoundError:
             print("Error: The text file named 'InputsForRTGame' was not found. Please make sure that there is such a file in the same directory as the script file of this program and try again. The program will now exit.")
@@ -675,6 +767,8 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         self.ElectronMass_kg = (self.ElectronMass / self.AvogadrosNum) * 1e-3 # ... in units of kg. Expressing the mass of a subatomic particle in kg is necessary for working with momentum vectors in SI units.
 
         # Initialise conditions for alpha particles to stay in the beam.
+        self.CrossSectionConstant = 2 * math.pi * self.AlphaMass_kg * (self.ClassicalElectronRadius_m) ** 2 # The cross-section of an alpha particle is CrossSectionConstant / (its momentum magnitude) ** 2. The constant is calculated once here so that the update_MomentumDependentQuantities() method does not calculate it at each simulation step.
+        self.KineticEnergyFactor_MeV = 1e-6 / (2 * self.AlphaMass_kg * self.J_eV_ConversionFactor) # The kinetic energy of an alpha particle in MeV is KineticEnergyFactor_MeV * (its momentum magnitude) ** 2, from E_alpha = p_alpha ** 2 / (2 * AlphaMass).
         self.MinimumAlphaMomentum = (2 * self.AlphaMass_kg * self.MinimumAlphaEnergy_eV * self.J_eV_ConversionFactor) ** (1/2) # ... in units of kg m/s. The program keeps track of the alpha particles' energy by their momentum. Thus, it must calculate the momentum-equivalent of the minimum energy.
         
         # Diagonal elements of the randomised 3x3 matrix, RandomMatrix. They are constant.
@@ -686,6 +780,37 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         self.C_yy = (1 - 4 * self.ElectronMass / self.AlphaMass) ** (1/2)
         self.C_zz = (1 - 4 * self.ElectronMass / self.AlphaMass) ** (1/2)
 
+        self.SignArray = np.array([-1.0, 1.0]) # This is the numpy-array version of the SignList variable in the generate_RandomMatrix_Momentum() method. It is used for randomly assigning signs to a whole array of off-diagonal elements at once.
+
+        # Choose how the collisions of the alpha particles with the electrons are simulated in the update_AlphaParticleMomentum() method.
+        #   > "vectorised": a stack of randomised 3x3 matrices is generated for all of the alpha particles in the beam at once and applied to all of their momentum vectors in one matrix operation. This is the default because it is much faster for large beams.
+        #   > "legacy": a randomised 3x3 matrix is generated and applied to one alpha particle at a time in a FOR loop. This option is kept for validating the results of the "vectorised" option.
+        self.CollisionKernel = "vectorised"
+
+        # Choose how the cross-sections and mean free paths of the alpha particles are kept up to date in the update_MomentumDependentQuantities() method.
+        #   > "per-step": the cross-section and mean free path of each alpha particle are recalculated from its momentum magnitude at each simulation step, so an alpha particle that has slowed down collides with electrons more often.
+        #   > "initial": the cross-sections and mean free paths keep the values that they had at the start of the simulation. This is how the program worked before they were updated, and is kept for comparing with earlier results.
+        self.MeanFreePathUpdate = "per-step"
+
+        # Choose how the x-positions of the alpha particles are recorded in the record_AlphaParticlePosition() method.
+        #   > "summary": only the furthest x-position of each alpha particle is kept. This is all that the calculate_Data() and calculate_MaximumRange() methods need, and the memory it uses does not grow with the number of simulation steps. This is the default.
+        #   > "full": the x-position of each alpha particle at each simulation step is kept, for when the full trajectories are wanted.
+        self.TrajectoryRecording = "summary"
+        self.RecordRemovals = False # If True, the ID, depth and simulation step of each alpha particle that leaves the beam are recorded in the removal event log of the trajectory store (see trajectory_store.get_RemovalEvents()).
+
+        self.ProgressStepInterval = 64 # The show_Progress() method only works out the progress of the simulation once every this many simulation steps.
+        self.progress_counter = None # The ProgressCounter (see the ProgressAdmin.py script) that a pooled process writes the progress of its task into. If None, the simulation prints its own progress instead.
+        self.ProgressTask = 0 # The slot of the progress counter that this simulation writes into.
+
+        self.ParticleFloatType = np.float64 # The data type of the x-positions, mean free paths and properties of the media of the alpha particles in the particle store (see the ParticleAdmin.py script). np.float32 halves the memory they use. The momenta are always float64.
+
+        self.BootstrapResamples = 0 # If greater than 0, the calculate_Data() method also calculates a 95% bootstrap confidence interval for the mean range from this many resamples of the alpha particles. It is stored in the MeanRange_ConfidenceInterval variable.
+        self.MeanRange_ConfidenceInterval = None
+
+        self.NumOfDistancesToCheck = 5e2 # The number of distances, from 0 to the maximum range, at which the number of alpha particles remaining in the beam is calculated in the calculate_ParticleNumList_Distance() method. The calculation takes about the same time for any number of distances, so this number can be made much larger for a smoother plot.
+
+        self.ParticlesPerChunk = 500 # The beam analysis and the radiotherapy game split the alpha particles into chunks of at most this many alpha particles, and each chunk is a separate task for the pooled processes. The chunks do not depend on the number of CPU cores, so neither do the random numbers of each chunk.
+
         # REFERENCES:
             # National Institute of Standards and Technology. Atomic Weights and Isotopic Compositions for All Elements. Retrieved from https://physics.nist.gov/cgi-bin/Compositions/stand_alone.pl?ele=&ascii=html&isotype=all
             # CRC handbook of chemistry and physics : a ready-reference book of chemical and physical data. (2017).  (97 ed.). 6000 Broken Sound Parkway NW, Suite 300 Boca Raton, FL 33487-2742: Taylor & Francis Group, LLC.
@@ -698,6 +823,8 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         self.ParticleNumber = InitialParticleNumber # At the start of the simulation, the beam of alpha particles has the initial number of alpha particles that the user defined. However, as the simulation progresses, some alpha particles will leave the beam, thus decreasing the number of alpha particles in the beam. This variable is for keeping track of the number of alpha particles in the beam throughout the simulation.
         self.RandomDistribution = RandomDistribution # The user can specify which probability density function the program will use to generate random numbers. The random numbers affected by the choice of this probability density function will be used to generate the randomised 3x3 matrix, RandomMatrix. RandomMatrix is to be used to repeatedly update the momentum vector of every alpha particle.
         self.AmountOfNumbers = None # Define the AmountOfNumbers variable for *immediate* use in an IF statement in the randomNum_0to1() method. The main reason of this line of code is to avoid the error that says the variable is not defined when it is called in the IF statement.
+        self.Seed = None # The seed for the random number generators. main() passes the user's seed and AmountOfNumbers into the class before the simulation starts. The random number generator itself is made in the make_RandomNumberGenerator() method.
+        self.SeedSequences = None # The numpy SeedSequence objects of the chunks of alpha particles, from the get_SeedSequences() function of the RandomNumberAdmin.py script. They are made in the main process before the chunks are sent to the pooled processes.
         
         self.MeanRange_Description = "" # Prepare a description about the mean range. Depending on the user's inputs, the mean range may not be assigned a value as expected. This variable is used in the write() method that creates a text file of the data to be outputted from the program. An empty string is its default value.
         self.MaximumRange_Description = "" # Prepare a description about the maximum range. Depending on the user's inputs, the maximum range may not be assigned a value as expected. This variable is used in the write() method that creates a text file of the data to be outputted fromt the program. An empty string is its default value.
@@ -721,38 +848,56 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         
     
     def make_Medium(self):
-        self.ElectronSpatialDensity = self.AtomicNumber * (self.MassDensity * self.AvogadrosNum / self.AtomicWeight) # Units: cm^-3. This variable is the number of electrons in the medium per unit volume.
+        medium_constants = MediumAdmin.get_MediumConstants(self.AtomicNumber, self.AtomicWeight, self.MassDensity, self.AvogadrosNum, self.CrossSectionConstant) # The quantities of the medium are only calculated the first time that this process uses the medium.
+        self.ElectronSpatialDensity = medium_constants.ElectronSpatialDensity # Units: cm^-3. This variable is the number of electrons in the medium per unit volume.
+        self.MeanFreePathFactor = medium_constants.MeanFreePathFactor # The mean free path of an alpha particle is (ElectronSpatialDensity * CrossSection) ** -1 = MeanFreePathFactor * (its momentum magnitude) ** 2.
+        # NOTE: Before the MediumAdmin.py script was made ...
+        # self.ElectronSpatialDensity = self.AtomicNumber * (self.MassDensity * self.AvogadrosNum / self.AtomicWeight) # Units: cm^-3. This variable is the number of electrons in the medium per unit volume.
         print()
 
         # REFERENCES:
             # Nave, C R Scattering Cross Section, http://hyperphysics.phy-astr.gsu.edu/hbase/Nuclear/crosec.html.
 
     
-    def initialise_Simulation(self, instance): # Prepare the arrays, lists and other variables that are to be used in the simulation using what was defined in the class's __init__() method.
-        print("Simulation Instance", instance + 1, "has been started with __name__ ==", __name__, "...")
+    def initialise_Simulation(self, instance, AlphaParticleIDs = None, seed_sequence = None): # Prepare the arrays, lists and other variables that are to be used in the simulation using what was defined in the class's __init__() method. AlphaParticleIDs and seed_sequence are given when a simulation instance is split into chunks of alpha particles. Then only the alpha particles with those IDs are simulated, using the random numbers of the SeedSequence of the chunk.
+        if AlphaParticleIDs is None: # Simulate the whole beam.
+            AlphaParticleIDs = np.arange(0, self.InitialParticleNumber)
+            print("Simulation Instance", instance + 1, "has been started with __name__ ==", __name__, "...")
+
+        else:
+            print("Simulation Instance", instance + 1, "has been started for {} of its alpha particles".format(AlphaParticleIDs.shape[0]), "with __name__ ==", __name__, "...")
+
+        if seed_sequence is None: # The simulation instance is not split into chunks, so it uses the SeedSequence of its first chunk.
+            seed_sequence = RandomNumberAdmin.get_SeedSequences(self.Seed, instance + 1, 1)[(instance, 0)]
+
+        self.ParticleNumber = AlphaParticleIDs.shape[0] # The number of alpha particles in this simulation (or chunk of a simulation) at the start.
         
         # NOTE: Before multiprocessing ...
         # if __name__ == "__main__": # All of these time.time() calls must be protected with this IF statement so that the slave processes do not raise the "NameError: name 'timing_studies' is not defined" error.
         #     timing_studies.start_InitialiseSimulation = time.time()
+
+        self.make_RandomNumberGenerator(seed_sequence) # Each simulation instance (or chunk of a simulation instance) gets its own random number generator.
         
         # All of the alpha particles in the beam are going to be kept track of using a pandas DataFrame. We want to keep track of each particle's momentum vector and x-position.
-        self.AlphaParticleIDsList = np.array(list([range(0, self.InitialParticleNumber)])).T # Initialise a list for making a list of identification (ID) numbers for the alpha particles.
+        self.AlphaParticleIDsList = np.array([AlphaParticleIDs]).T # Initialise a list for making a list of identification (ID) numbers for the alpha particles.
+        # NOTE: Before simulation instances could be split into chunks of alpha particles ...
+        # self.AlphaParticleIDsList = np.array(list([range(0, self.InitialParticleNumber)])).T # Initialise a list for making a list of identification (ID) numbers for the alpha particles.
         
         # Now we initialise their x-positions, i.e., their positions along the x-axis.
-        self.PositionXArray = np.array([[self.InitialPositionX]] * self.InitialParticleNumber) # Now there is one position along the x-axis for each alpha particle. We want a column vector, not a row vector.
+        self.PositionXArray = np.array([[self.InitialPositionX]] * self.ParticleNumber) # Now there is one position along the x-axis for each alpha particle. We want a column vector, not a row vector.
         # NOTE: Before optimisation ...
         # self.PositionXList_DF = pd.DataFrame([self.InitialPositionX] * self.InitialParticleNumber) # Now there is one position along the x-axis for each alpha particle.
 
         ## Now we initialise their momentum vectors.
         # Initialise a general momentum vector for the alpha particles.
-        self.MomentumVectorList = np.array([[self.InitialMomentumX, 0.0, 0.0]] * self.InitialParticleNumber)  # This is the list of inital momentum vectors of the alpha particle, in units of kg m/s. At the start of the first simulation step, every alpha particle has this momentum vector. *Initialise* a list of momentum vectors to keep track of each alpha particle's momentum. Now there is one momentum vector for each alpha particle. The [] around each individual momentum vector makes sure that each momentum vector is its own list. Treating the list of momentum vectors as a numpy array is necessary for making the calculations in the simulation involving vectors and matrices work properly.
+        self.MomentumVectorList = np.array([[self.InitialMomentumX, 0.0, 0.0]] * self.ParticleNumber)  # This is the list of inital momentum vectors of the alpha particle, in units of kg m/s. At the start of the first simulation step, every alpha particle has this momentum vector. *Initialise* a list of momentum vectors to keep track of each alpha particle's momentum. Now there is one momentum vector for each alpha particle. The [] around each individual momentum vector makes sure that each momentum vector is its own list. Treating the list of momentum vectors as a numpy array is necessary for making the calculations in the simulation involving vectors and matrices work properly.
         # NOTE: Before optimisation ...
         # self.MomentumVectorList_DF = pd.DataFrame([self.MomentumVector] * self.InitialParticleNumber) # *Initialise* a list of momentum vectors to keep track of each alpha particle's momentum. Now there is one momentum vector for each alpha particle. The [] around "MomentumVector" makes sure that each momentum vector is its own list. Treating the list of momentum vectors as a numpy array is necessary for making the calculations in the simulation involving vectors and matrices work properly.
 
         ## Now we calculate the cross-sections, which is a function of the alpha particle's energy. Consequently, each alpha particle will have its own mean free path.
         # We are going to need to know the momentum magnitude of each alpha particle. Also, the magnitude is used in other parts of the program. So, we might as well put it into the information DataFrame so that it does not have to be recalculated unnecessarily.
         self.MomentumMagnitudeList = np.array([((self.MomentumVectorList ** 2).sum(axis = 1)) ** (1/2)]).T # Momentum magnitudes. We need the arrays to be in columns for the upcoming concatenation into the info list.
-        self.CrossSectionList = (2 * math.pi * self.AlphaMass_kg * (self.ClassicalElectronRadius_m) ** 2) / self.MomentumMagnitudeList ** 2 # Cross-section for each alpha particle. The pandas Series supports an element-wise operation.
+        self.CrossSectionList = self.CrossSectionConstant / self.MomentumMagnitudeList ** 2 # Cross-section for each alpha particle. The pandas Series supports an element-wise operation.
         self.MeanFreePathInMediumList = (self.ElectronSpatialDensity * self.CrossSectionList) ** -1 # Mean free path in the medium for each alpha particle.
         # NOTE: Before optimisation ...
         # self.MomentumMagnitudeList_DF = ((self.MomentumVectorList_DF ** 2).sum(axis = 1)) ** (1/2) # Momentum magnitudes.
@@ -760,13 +905,23 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         # self.MeanFreePathInMediumList_DF = (self.ElectronSpatialDensity * self.CrossSectionList_DF) ** -1 # Mean free path in the medium for each alpha particle.
 
 
-        # Now we put all the above information into one pandas DataFrame.
-        self.AlphaParticlesInfoList_ID_X_Momentum = np.concatenate((self.AlphaParticleIDsList, self.PositionXArray, self.MomentumVectorList, self.MomentumMagnitudeList, self.CrossSectionList, self.MeanFreePathInMediumList), axis = 1) # This DataFrame will be useful for keeping each alpha particle's momentum vector attached to its x-position, especially when particles get removed from the beam when they have sufficiently low momentum.
+        # Now we put all the above information into the particle store. Each field has its own array.
+        self.particle_store = ParticleAdmin.ParticleStore(self.ParticleNumber, ParticleAdmin.BeamFields, self.ParticleFloatType)
+        self.particle_store.ID = self.AlphaParticleIDsList[:, 0]
+        self.particle_store.PositionX = self.PositionXArray[:, 0]
+        self.particle_store.Momentum = self.MomentumVectorList
+        self.particle_store.MomentumMagnitude = self.MomentumMagnitudeList[:, 0]
+        self.particle_store.CrossSection = self.CrossSectionList[:, 0]
+        self.particle_store.MeanFreePath = self.MeanFreePathInMediumList[:, 0]
+        # NOTE: Before the ParticleAdmin.py script was made ...
+        # self.AlphaParticlesInfoList_ID_X_Momentum = np.concatenate((self.AlphaParticleIDsList, self.PositionXArray, self.MomentumVectorList, self.MomentumMagnitudeList, self.CrossSectionList, self.MeanFreePathInMediumList), axis = 1) # This DataFrame will be useful for keeping each alpha particle's momentum vector attached to its x-position, especially when particles get removed from the beam when they have sufficiently low momentum.
         # NOTE: Before optimisation ...
         # self.AlphaParticlesInfoList_ID_X_Momentum_DF = pd.concat([pd.DataFrame(self.AlphaParticleIDsList), self.PositionXList_DF, self.MomentumVectorList_DF, self.MomentumMagnitudeList_DF, self.CrossSectionList_DF, self.MeanFreePathInMediumList_DF], axis = 1).T.reset_index(drop = True).T # This DataFrame will be useful for keeping each alpha particle's momentum vector attached to its x-position, especially when particles get removed from the beam when they have sufficiently low momentum.
 
+        self.make_TrajectoryStore(self.particle_store.ID) # Prepare the store for the x-positions of the alpha particles.
+
         # *Initialise* a list for recording the number of alpha particles in the beam at each simulation step. Energy and range straggling of the particles does *not* affect the number of particles in the beam. Energy straggling is when all of the alpha particles start off with the same kinetic energy but lose different amounts of energy per collision with atomic electrons. Each particle has its own history of collisions and energy transfers. Particles with more energy travel further. Thus, energy straggling causes range straggling. Energy straggling is what causes the sigmoid curve at the end of the plot of the relationship between the number of particles in the beam and the simulation step. This plot is output from the program as a .png file.
-        self.NumberParticlesInBeam = [self.InitialParticleNumber] # It is not necessary to treat this list as a numpy array because it is not used in any vector or matrix calculations.
+        self.NumberParticlesInBeam = [self.ParticleNumber] # It is not necessary to treat this list as a numpy array because it is not used in any vector or matrix calculations.
 
         # Initialise a list for recording the numbers of the off-diagonal elements of the randomised 3x3 matrix (RandomMatrix). They are generated from the random numbers generated using the randomNum_0to1() method. The frequency of the occurrence of each RandomMatrix random number is going to be plotted to get an idea of the probability density function that was used to generate the numbers. The plot will be useful for the user for understanding the results of the simulation because which random numbers are generated affects the results.
         self.RandomNumList_C_xy = [] # Initialise a list for each off-diagonal element of the randomised 3x3 matrix.
@@ -777,10 +932,12 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         self.RandomNumList_C_zy = [] # Initialise a list for each off-diagonal element of the randomised 3x3 matrix.
         
         self.DelayForShowingProgress = 2.5 # Units: s. Do not print the progress of each simulation instance to the command terminal at each simulation step, which would flood the terminal with text.
-        self.DelayTimer = 0.0
-        self.StartDelayTimer = None # This is one of my typical solutions for avoiding the error of a variable being referenced in an IF statement before being defined.
+        self.reset_Progress()
+        # NOTE: Before the ProgressAdmin.py script was made ...
+        # self.DelayTimer = 0.0
+        # self.StartDelayTimer = None # This is one of my typical solutions for avoiding the error of a variable being referenced in an IF statement before being defined.
         
-        if instance == 0: # Print this message only once.
+        if (instance == 0) and (AlphaParticleIDs[0] == 0): # Print this message only once.
             print("Alpha particles will be removed from the beam when their kinetic energies fall below {0:0.3f} eV.".format(self.MinimumAlphaEnergy_eV)) # At which kinetic energy alpha particles are removed from the beam affects the results that the program outputs. The user must know what is affecting their results so that they may document it in their work/research. The minimum alpha kinetic energy may not be 1 eV, but may be expressed by a demical number in the future. Using the format() method keeps such numbers neatly presented.
             print() # Separate the above print() statement from text that is going to be printed to the screen later.
 
@@ -795,66 +952,53 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
             # The SciPy community (2020). numpy.concatenate, https://numpy.org/doc/stable/reference/generated/numpy.concatenate.html.
 
         
+    def make_TrajectoryStore(self, AlphaParticleIDs): # Make the store for the x-positions of the alpha particles. Its rows are found from the IDs of the alpha particles.
+        if self.TrajectoryRecording == "summary":
+            self.trajectory_store = TrajectoryAdmin.DepthSummaryStore(AlphaParticleIDs, self.InitialPositionX, self.RecordRemovals)
+
+        elif self.TrajectoryRecording == "full":
+            self.trajectory_store = TrajectoryAdmin.TrajectoryStore(AlphaParticleIDs, self.InitialPositionX, self.RecordRemovals)
+
+        self.PositionXArray = self.trajectory_store.get_PositionXArray() # PositionXArray always has the x-positions recorded so far.
+
+
+    def split_ParticlesIntoChunks(self): # Split the IDs of the alpha particles in the beam into chunks for the pooled processes. The alpha particles are dealt out to the chunks in turn, as the radiotherapy game has always done for its pooled processes, so the chunks differ in size by at most 1 alpha particle.
+        self.NumberOfChunks = max(math.ceil(self.InitialParticleNumber / self.ParticlesPerChunk), 1)
+
+        return {chunk : np.arange(chunk, self.InitialParticleNumber, self.NumberOfChunks) for chunk in range(0, self.NumberOfChunks)}
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.arange, https://numpy.org/doc/stable/reference/generated/numpy.arange.html.
+
+
+    def get_CacheInputs(self): # The inputs that decide the results of a seeded simulation, for the key of the result cache (see the CacheAdmin.py script). The numbers are cast so that, e.g., an atomic number of 7 and 7.0 give the same key.
+        return {"Class" : type(self).__name__, "Initial kinetic energy" : float(self.InitialKineticEnergy), "Initial particle number" : int(self.InitialParticleNumber), "Probability density function" : self.RandomDistribution, "Amount of numbers" : self.AmountOfNumbers,
+                "Atomic number" : float(self.AtomicNumber), "Atomic weight" : float(self.AtomicWeight), "Mass density" : float(self.MassDensity), "Seed" : int(self.Seed), "Minimum alpha energy" : float(self.MinimumAlphaEnergy_eV),
+                "Collision kernel" : self.CollisionKernel, "Particles per chunk" : int(self.ParticlesPerChunk), "Number of distances to check" : float(self.NumOfDistancesToCheck), "Bootstrap resamples" : int(self.BootstrapResamples), "Particle float type" : np.dtype(self.ParticleFloatType).name, "Mean free path update" : self.MeanFreePathUpdate}
+
+
+    def make_RandomNumberGenerator(self, seed_sequence): # Make the random number generator for a simulation instance or chunk from its numpy SeedSequence, which comes from the get_SeedSequences() function of the RandomNumberAdmin.py script. This must be done inside the simulation instance or pooled process so that each one gets its own random numbers.
+        self.random_number_generator = RandomNumberAdmin.RandomNumberGenerator(self.RandomDistribution, self.AmountOfNumbers, seed_sequence)
+        # NOTE: Before the get_SeedSequences() function was made ...
+        # self.random_number_generator = RandomNumberAdmin.RandomNumberGenerator(self.RandomDistribution, self.AmountOfNumbers, self.Seed, StreamNumber) # StreamNumber is the simulation instance or pooled process number.
+
+
     def randomNum_0to1(self, RandomDistribution): # Use this function to shorten the code that generates random numbers between 0 and 1 when giving the user the option to choose which random distribution to use for generating the random numbers. The higher the value of AmountOfNumbersMinus1, the more numbers between 0 and 1 that can be generated; this is better than having less numbers between 0 and 1 being generated. For example, randomNum_0to1(2) generates 0.0, 0.5 or 1.
-        # NOTE: Before multiprocessing ...
-        # if __name__ == "__main__":
-        #     timing_studies.start_RandomNum_0to1 = time.time()
+        # NOTE: Before the RandomNumberAdmin.py script was made, this method used the random standard library and asked the user for AmountOfNumbers the first time it was called with the discrete probability density function. That question is now asked by the get_AmountOfNumbersForDiscreteDistribution() method of the ProgramAdmin class before the simulation starts.
+        # return random.random() # basic
+        # return float(random.randint(a = 0, b = self.AmountOfNumbers) / self.AmountOfNumbers) # discrete
+        # return float(random.triangular(low = 0.0, high = 1.0, mode = 0.0)) # triangular
+        # return float(random.uniform(a = 0.0, b = 1.0)) # uniform
 
-        if self.RandomDistribution == "basic": # Use the basic random number generator of Python's random module.
-            # NOTE: Before multiprocessing ...
-            # if __name__ == "__main__":
-            #     timing_studies.end_RandomNum_0to1 = time.time() # The use of the RETURN statement below mean that the end time.time() calls and appending of execution times must happen before the RETURN statements.
-            #     timing_studies.randomNum_0to1_List.append(timing_studies.end_RandomNum_0to1 - timing_studies.start_RandomNum_0to1)
-            
-            return random.random()
-        
-        elif self.RandomDistribution == "discrete": # Use a probability density function of which the user can specify the discretisation. Numbers have an equal probability of being generated.
-            try: # Approach the error handling for the AmountOfNumbers variable in the same way as the error-handling for the InitialParticleNumber variable was approached because both these variables must be an integer greater than 0.
-                if self.AmountOfNumbers is None: # Ask the user to specify a value for AmountOfNumbers only if it does not already have a value. Without this IF statement, the user will be asked to input a value for this variable *every time the randomNum_0to1() method is called* in the case where the user specifed a discrete random distribution.
-                    self.AmountOfNumbers = int(self.check_FloatingPointInput(float(input("\tOption: discrete\n\t\tHow many random numbers between 0 and 1 inclusive should be possible to be generated? "))) - 1)
-            
-            except:
-                print("Error: You did not input an integer greater than 0 for the number of numbers that can be randomly generated. The program will now exit.")
-                exit() # This is what I want the program to do in this case.
-            
-            while self.AmountOfNumbers <= 0: # ... if the user specified an integer value but it is negative.
-                print("Error: You must input an integer greater than 0 for the number of numbers to be randomly generated. Please try again.")
-                
-                try:
-                    self.AmountOfNumbers = int(self.check_FloatingPointInput(float(input("\tOption: discrete\n\t\tHow many random numbers between 0 and 1 inclusive should be possible to be generated? "))) - 1)
-                
-                except: # ... if the user gave an input that would raise an error.
-                    print("You did not input an integer greater than 0. The program will now exit.")
-                    exit() # This is what I want the program to do in this case.
+        return self.random_number_generator.randomNum_0to1()
 
-            # NOTE: Before multiprocessing ...
-            # if __name__ == "__main__":
-            #     timing_studies.end_RandomNum_0to1 = time.time()
-            #     timing_studies.randomNum_0to1_List.append(timing_studies.end_RandomNum_0to1 - timing_studies.start_RandomNum_0to1)
-            
-            return float(random.randint(a = 0, b = self.AmountOfNumbers) / self.AmountOfNumbers) # Normalise the random numbers to 1. The random numbers are fractions of the largest number that can be generated.
-            
-            # REFERENCE: Python Software Foundation. (2013, 1 August 2013). PEP 8 -- Style Guide for Python Code. Retrieved from https://www.python.org/dev/peps/pep-0008/
-        
-        elif self.RandomDistribution == "triangular": # Use a probability density function that is biased towards 0 and linearly decreases from 0 to 1 and where it is zero at 1.
-            # NOTE: Before multiprocessing ...
-            # if __name__ == "__main__":
-            #     timing_studies.end_RandomNum_0to1 = time.time()
-            #     timing_studies.randomNum_0to1_List.append(timing_studies.end_RandomNum_0to1 - timing_studies.start_RandomNum_0to1)
-            
-            return float(random.triangular(low = 0.0, high = 1.0, mode = 0.0))
-        
-        elif self.RandomDistribution == "uniform": # Use a uniform probability density function.
-            # NOTE: Before multiprocessing ...
-            # if __name__ == "__main__":
-            #     timing_studies.end_RandomNum_0to1 = time.time()
-            #     timing_studies.randomNum_0to1_List.append(timing_studies.end_RandomNum_0to1 - timing_studies.start_RandomNum_0to1)
-            
-            return float(random.uniform(a = 0.0, b = 1.0)) # When this function is executed, the rest of the program sees the code after the RETURN keyword.
-        
         # REFERENCES:
             # Python Software Foundation. (2020, 11 September 2020). random — Generate pseudo-random numbers. Retrieved from https://docs.python.org/3/library/random.html
-    
+
+
+    def randomNums_0to1(self, RandomDistribution, AmountOfRandomNums): # This method is the array version of the randomNum_0to1() method. It generates AmountOfRandomNums random numbers between 0 and 1 at once using the same probability density function, which is much faster than calling randomNum_0to1() AmountOfRandomNums times.
+        return self.random_number_generator.randomNums_0to1(AmountOfRandomNums)
+
     
     def update_AlphaParticlePosition(self):
         ### Timing experiment:
@@ -865,12 +1009,12 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         
         ## Update the x-positions of the alpha particles.
         # Now we are going to update the positions of the alpha particles along the x-axis using the momentum unit vectors. We are going to express the distances travelled along the x-axis in terms of free paths. A free path is the distance an alpha particle has travelled without colliding with an electron. In this program, we are assuming the free paths are straight. The free paths are only magnitudes. However, the directions of the free paths affect how far each alpha particle travels along the x-axis. We can assign directions to the free paths by calculating the unit vectors of the momenta. A unit vector has a magnitude of 1, so it is only a direction and will not make any change to the magnitude of a free path.
-        self.FreePathList = -1*np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 7]]).T * np.log(1 - np.random.uniform(low = 0, high = 1 + 1.1 * self.FloatMin, size = (self.AlphaParticlesInfoList_ID_X_Momentum.shape[0], 1))) # Alpha particles have a mean free path in media that depends on the probability that they will interact with the electrons, which in turn depends on the kinetic energies of the alpha particles. Each particle has its own free path. The np.random.uniform() method excludes the high endpoint. To include 1 in the range of values that can be generated, we increase the endpoint beyond 1 by an extremely small amount. With "-" at the front of the expression, the "bad operand type for unary -: NoneType" error was raised. So I replaced "-" with "-1*".
+        self.FreePathList = -1*np.array([self.particle_store.MeanFreePath]).T * np.log(1 - self.random_number_generator.uniform(low = 0, high = 1 + 1.1 * self.FloatMin, size = (self.particle_store.Count, 1))) # Alpha particles have a mean free path in media that depends on the probability that they will interact with the electrons, which in turn depends on the kinetic energies of the alpha particles. Each particle has its own free path. The np.random.uniform() method excludes the high endpoint. To include 1 in the range of values that can be generated, we increase the endpoint beyond 1 by an extremely small amount. With "-" at the front of the expression, the "bad operand type for unary -: NoneType" error was raised. So I replaced "-" with "-1*".
         # NOTE: Before optimisation ...
         # self.FreePathList = -np.array(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:, 7]).reshape(1, self.AlphaParticlesInfoList_ID_X_Momentum_DF.shape[0]) * np.log(1 - np.random.rand(1, self.AlphaParticlesInfoList_ID_X_Momentum_DF.shape[0])) # Alpha particles have a mean free path in media that depends on the probability that they will interact with the electrons, which in turn depends on the kinetic energies of the alpha particles. Each particle has its own free path.
         
         # We are going to do matrix operations, which are better done using numpy arrays than pandas DataFrames.
-        self.AlphaParticlesInfoList_ID_X_Momentum[:, 1] = self.AlphaParticlesInfoList_ID_X_Momentum[:, 1] + self.FreePathList.T * (self.AlphaParticlesInfoList_ID_X_Momentum[:, 2] / self.AlphaParticlesInfoList_ID_X_Momentum[:, 5])
+        self.particle_store.PositionX = self.particle_store.PositionX + self.FreePathList.T * (self.particle_store.Momentum[:, 0] / self.particle_store.MomentumMagnitude)
         # NOTE: Before optimisation ...
         # self.AlphaParticlesInfoList_ID_X_Momentum = np.array(self.AlphaParticlesInfoList_ID_X_Momentum_DF)
         # self.MomentumMagnitudeList = np.array(self.MomentumMagnitudeList_DF)
@@ -905,12 +1049,15 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         # if __name__ == "__main__":
         #     timing_studies.start_RecordAlphaParticlePosition = time.time()
          
-        if np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T.shape[0] == self.PositionXArray.shape[0]:
-            self.PositionXArray = np.concatenate((self.PositionXArray, np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T), axis = 1)
-        
-        else:
-            _ = np.concatenate((np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T, np.zeros((self.PositionXArray.shape[0] - np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T.shape[0], 1))), axis = 0) # Unlike pandas, numpy does not concatenate arrays that have an unequal number of rows. So we must make the array that is to be added have the same number of rows as the array to which it is to be added. Using 0s for this is suitable for the data analysis that is to be done after the simulation.
-            self.PositionXArray = np.concatenate((self.PositionXArray, _), axis = 1) 
+        self.trajectory_store.record_PositionsX(self.particle_store.ID, self.particle_store.PositionX) # Each alpha particle's x-position is written into its own row, which is found from its ID. Alpha particles that have left the beam keep an x-position of 0.
+        self.PositionXArray = self.trajectory_store.get_PositionXArray() # PositionXArray is now a view of what the trajectory store keeps. So the calculate_Data() and calculate_MaximumRange() methods work without changes.
+        # NOTE: Before the TrajectoryAdmin.py script was made ... Concatenating a column onto PositionXArray at every simulation step copies the whole array every time. Also, the rows of the alpha particles that were still in the beam moved up when alpha particles were removed from the beam.
+        # if np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T.shape[0] == self.PositionXArray.shape[0]:
+        #     self.PositionXArray = np.concatenate((self.PositionXArray, np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T), axis = 1)
+        # 
+        # else:
+        #     _ = np.concatenate((np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T, np.zeros((self.PositionXArray.shape[0] - np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 1]]).T.shape[0], 1))), axis = 0) # Unlike pandas, numpy does not concatenate arrays that have an unequal number of rows. So we must make the array that is to be added have the same number of rows as the array to which it is to be added. Using 0s for this is suitable for the data analysis that is to be done after the simulation.
+        #     self.PositionXArray = np.concatenate((self.PositionXArray, _), axis = 1) 
         # NOTE: Before optimisation ...
         # self.PositionXList_DF = pd.concat([pd.DataFrame(self.PositionXList_DF), self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:, 1]], axis = 1) # It is favourable that pandas concatenates DataFrames with unequal numbers of columns. The NaN values can be dealt with later when we try to plot the number of particles in the beam as a function of x-position. The approach used here with the DataFrames is the DataFrame-equivalent of using the append() method for lists.
         
@@ -929,7 +1076,7 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         #     timing_studies.start_GenerateRandomMatrixMomentum = time.time()
         
         # Prepare the 3x3 randomised matrix that is going to be used to update the momentum vectors of the alpha particles. RandomMatrix is the 3x3 randomised matrix.
-        self.MeFirst = random.randint(a = 0, b = 1) # This variable is for the IF-ELIF statement below. It is for randomising which of the two matrix elements below are defined first and which one is derived from the one that was defined first.
+        self.MeFirst = int(self.random_number_generator.randomIndices_0or1(1)[0]) # This variable is for the IF-ELIF statement below. It is for randomising which of the two matrix elements below are defined first and which one is derived from the one that was defined first.
         
         if self.MeFirst == 0:
             self.C_xy = self.randomNum_0to1(self.RandomDistribution) * (1 - self.C_xx) # The absolute values of the numbers in each column of RandomMatrix must sum to 1 because each column represents how much of the corresponding component of the momentum vector at the start of the simulation step is distributed amongst the components of the momentum vector at the end of the simulation step. RandomMatrix is recalculated for each alpha particle per simulation step.
@@ -942,13 +1089,13 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         # The alpha particle may be deflected in either the positive or negative direction of the y- and z-axes.
         self.SignList = [-1,1] # C_xy and C_xz are to be randomly assigned a sign.
         
-        self.C_xy = self.C_xy * self.SignList[random.randint(a = 0, b = 1)]
-        self.C_xz = self.C_xz * self.SignList[random.randint(a = 0, b = 1)] # We randomly select a sign again to avoid *always* getting a "- -" or "+ +" pair. We also want "+ -" and "- +" pairs to be possible.
+        self.C_xy = self.C_xy * self.SignList[int(self.random_number_generator.randomIndices_0or1(1)[0])]
+        self.C_xz = self.C_xz * self.SignList[int(self.random_number_generator.randomIndices_0or1(1)[0])] # We randomly select a sign again to avoid *always* getting a "- -" or "+ +" pair. We also want "+ -" and "- +" pairs to be possible.
         self.RandomNumList_C_xy.append(self.C_xy) # We are going to plot a frequency plot of each off-diagonal element of the randomised 3x3 matrix. So we must record each value.
         self.RandomNumList_C_xz.append(self.C_xz) # We are going to plot a frequency plot of each off-diagonal element of the randomised 3x3 matrix. So we must record each value.
 
         ## C_yx and C_yz:
-        self.MeFirst = random.randint(a = 0, b = 1) # This variable is for the IF-ELIF statement below. It is for randomising which of the two matrix elements below are defined first and which one is derived from the one that was defined first.
+        self.MeFirst = int(self.random_number_generator.randomIndices_0or1(1)[0]) # This variable is for the IF-ELIF statement below. It is for randomising which of the two matrix elements below are defined first and which one is derived from the one that was defined first.
         
         if self.MeFirst == 0:
             self.C_yx = self.randomNum_0to1(self.RandomDistribution) * (1 - self.C_yy) # The absolute values of the numbers in each column of RandomMatrix must sum to 1 because each column represents how much of the corresponding component of the momentum vector at the start of the simulation step is distributed amongst the components of the momentum vector at the end of the simulation step. RandomMatrix is recalculated for each alpha particle per simulation step.
@@ -959,13 +1106,13 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
             self.C_yx = self.randomNum_0to1(self.RandomDistribution) * (1 - self.C_yy - self.C_yz)
 
         # The alpha particle may be deflected in either the positive or negative direction of the x- and z-axes. We randomly select a pair of signs again for added randomness because the choice of deflection in the positive or negative direction of an axis between orthogonal axes are independent of each other.
-        self.C_yx = self.C_yx * self.SignList[random.randint(a = 0, b = 1)]
-        self.C_yz = self.C_yz * self.SignList[random.randint(a = 0, b = 1)] # We randomly select a sign again to avoid *always* getting a "- -" or "+ +" pair. We also want "+ -" and "- +" pairs to be possible.
+        self.C_yx = self.C_yx * self.SignList[int(self.random_number_generator.randomIndices_0or1(1)[0])]
+        self.C_yz = self.C_yz * self.SignList[int(self.random_number_generator.randomIndices_0or1(1)[0])] # We randomly select a sign again to avoid *always* getting a "- -" or "+ +" pair. We also want "+ -" and "- +" pairs to be possible.
         self.RandomNumList_C_yx.append(self.C_yx) # We are going to plot a frequency plot of each off-diagonal element of the randomised 3x3 matrix. So we must record each value.
         self.RandomNumList_C_yz.append(self.C_yz) # We are going to plot a frequency plot of each off-diagonal element of the randomised 3x3 matrix. So we must record each value.
 
         ## C_zx and C_zy:
-        self.MeFirst = random.randint(a = 0, b = 1) # This variable is for the IF-ELIF statement below. It is for randomising which of the two matrix elements below are defined first and which one is derived from the one that was defined first.
+        self.MeFirst = int(self.random_number_generator.randomIndices_0or1(1)[0]) # This variable is for the IF-ELIF statement below. It is for randomising which of the two matrix elements below are defined first and which one is derived from the one that was defined first.
         
         if self.MeFirst == 0:
             self.C_zx = self.randomNum_0to1(self.RandomDistribution) * (1 - self.C_zz) # The absolute values of the numbers in each column of RandomMatrix must sum to 1 because each column represents how much of the corresponding component of the momentum vector at the start of the simulation step is distributed amongst the components of the momentum vector at the end of the simulation step. RandomMatrix is recalculated for each alpha particle per simulation step.
@@ -976,8 +1123,8 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
             self.C_zx = self.randomNum_0to1(self.RandomDistribution) * (1 - self.C_zz - self.C_zy)
 
         # The alpha particle may be deflected in either the positive or negative direction of the x- and y-axes. We randomly select a pair of signs again for added randomness because the choice of deflection in the positive or negative direction of an axis between orthogonal axes are independent of each other.
-        self.C_zx = self.C_zx * self.SignList[random.randint(a = 0, b = 1)]
-        self.C_zy = self.C_zy * self.SignList[random.randint(a = 0, b = 1)] # We randomly select a sign again to avoid *always* getting a "- -" or "+ +" pair. We also want "+ -" and "- +" pairs to be possible.
+        self.C_zx = self.C_zx * self.SignList[int(self.random_number_generator.randomIndices_0or1(1)[0])]
+        self.C_zy = self.C_zy * self.SignList[int(self.random_number_generator.randomIndices_0or1(1)[0])] # We randomly select a sign again to avoid *always* getting a "- -" or "+ +" pair. We also want "+ -" and "- +" pairs to be possible.
         self.RandomNumList_C_zx.append(self.C_zx) # We are going to plot a frequency plot of each off-diagonal element of the randomised 3x3 matrix. So we must record each value.
         self.RandomNumList_C_zy.append(self.C_zy) # We are going to plot a frequency plot of each off-diagonal element of the randomised 3x3 matrix. So we must record each value.
 
@@ -990,25 +1137,74 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         
         # REFERENCE: Python Software Foundation (2020). random — Generate pseudo-random numbers, https://docs.python.org/3/library/random.html.
 
-    
+
+    def generate_RandomOffDiagonalPair(self, DiagonalElement, NumberOfMatrices): # This method generates one pair of off-diagonal elements of a column of RandomMatrix, such as C_xy and C_xz, for NumberOfMatrices randomised 3x3 matrices at once. It follows the same rules as the generate_RandomMatrix_Momentum() method.
+        self.MeFirst_Array = self.random_number_generator.randomIndices_0or1(NumberOfMatrices) # For each matrix, randomise which of the two elements is defined first and which one is derived from the one that was defined first.
+
+        self.FirstElement_Array = self.randomNums_0to1(self.RandomDistribution, NumberOfMatrices) * (1 - DiagonalElement) # The absolute values of the numbers in each column of RandomMatrix must sum to 1.
+        self.SecondElement_Array = self.randomNums_0to1(self.RandomDistribution, NumberOfMatrices) * (1 - DiagonalElement - self.FirstElement_Array)
+
+        # When MeFirst is 0, the first element of the pair (e.g. C_xy) is defined first. When MeFirst is 1, the second element of the pair (e.g. C_xz) is defined first.
+        self.ElementA_Array = np.where(self.MeFirst_Array == 0, self.FirstElement_Array, self.SecondElement_Array)
+        self.ElementB_Array = np.where(self.MeFirst_Array == 0, self.SecondElement_Array, self.FirstElement_Array)
+
+        # The alpha particle may be deflected in either the positive or negative direction of each axis. Each element gets its own random sign so that "+ -" and "- +" pairs are possible.
+        self.ElementA_Array = self.ElementA_Array * self.SignArray[self.random_number_generator.randomIndices_0or1(NumberOfMatrices)]
+        self.ElementB_Array = self.ElementB_Array * self.SignArray[self.random_number_generator.randomIndices_0or1(NumberOfMatrices)]
+
+        return self.ElementA_Array, self.ElementB_Array
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.where, https://numpy.org/doc/stable/reference/generated/numpy.where.html.
+
+
+    def generate_RandomMatrices_Momentum(self, NumberOfMatrices): # This method is the vectorised version of the generate_RandomMatrix_Momentum() method. It makes a stack of NumberOfMatrices randomised 3x3 matrices, one for each alpha particle in the beam, in one pass instead of one matrix per call.
+        self.C_xy_Array, self.C_xz_Array = self.generate_RandomOffDiagonalPair(self.C_xx, NumberOfMatrices)
+        self.C_yx_Array, self.C_yz_Array = self.generate_RandomOffDiagonalPair(self.C_yy, NumberOfMatrices)
+        self.C_zx_Array, self.C_zy_Array = self.generate_RandomOffDiagonalPair(self.C_zz, NumberOfMatrices)
+
+        # We are going to plot a frequency plot of each off-diagonal element of the randomised 3x3 matrix. So we must record each value.
+        self.RandomNumList_C_xy.extend(self.C_xy_Array.tolist())
+        self.RandomNumList_C_xz.extend(self.C_xz_Array.tolist())
+        self.RandomNumList_C_yx.extend(self.C_yx_Array.tolist())
+        self.RandomNumList_C_yz.extend(self.C_yz_Array.tolist())
+        self.RandomNumList_C_zx.extend(self.C_zx_Array.tolist())
+        self.RandomNumList_C_zy.extend(self.C_zy_Array.tolist())
+
+        # Assemble the stack of matrices. Each matrix has the same layout as RandomMatrix in the generate_RandomMatrix_Momentum() method.
+        self.RandomMatrices = np.empty((NumberOfMatrices, 3, 3))
+        self.RandomMatrices[:, 0, 0], self.RandomMatrices[:, 0, 1], self.RandomMatrices[:, 0, 2] = self.C_xx, self.C_yx_Array, self.C_zx_Array
+        self.RandomMatrices[:, 1, 0], self.RandomMatrices[:, 1, 1], self.RandomMatrices[:, 1, 2] = self.C_xy_Array, self.C_yy, self.C_zy_Array
+        self.RandomMatrices[:, 2, 0], self.RandomMatrices[:, 2, 1], self.RandomMatrices[:, 2, 2] = self.C_xz_Array, self.C_yz_Array, self.C_zz
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.empty, https://numpy.org/doc/stable/reference/generated/numpy.empty.html.
+
+
     def update_AlphaParticleMomentum(self): # This method is for recalculating each alpha particle's momentum vector after the alpha particles collide with atomic electrons.
         # NOTE: Before multiprocessing ...
         # if __name__ == "__main__":
         #     timing_studies.start_UpdateAlphaParticleMomentum = time.time()
-        
-        for particle in range(0, self.ParticleNumber): # We are going to calculate each alpha particle's final momentum vector at the end of the simulation step. Here, we iterate the matrix calculation over the number of alpha particles in the beam. These calculations are done at each simulation step.
-            self.generate_RandomMatrix_Momentum() # Generate the randomised 3x3 matrix for updating the momentum vectors of the alpha particles.
-        
-            # #### debug for the radiotherapy game.
-            # print("Inside update_AlphaParticleMomentum(self)'s FOR loop with particle =", particle)
-            # print("self.generate_RandomMatrix_Momentum() in update_AlphaParticleMomentum(self) has been executed successfully ...\n")
-            # ####
 
-            ## Update the momenta of the alpha particles.
-            # Now we are going to use RandomMatrix to update the momentum vector of each alpha particle minus the alpha particles that were removed from the beam. Each alpha particle has its own RandomMatrix applied to it because the random numbers are recalculated for each alpha particle. I am assuming that how a particular alpha particle transfers momentum to an electron does *not* affect how another alpha particle transfers momentum to an electron, whether that electron is the same one or another one.
-            
-            self.AlphaParticlesInfoList_ID_X_Momentum[particle, 2:5] = self.RandomMatrix.dot(self.AlphaParticlesInfoList_ID_X_Momentum[particle, 2:5])
-            
+        if self.CollisionKernel == "vectorised": # Update the momentum vectors of all of the alpha particles in the beam at once.
+            self.generate_RandomMatrices_Momentum(self.ParticleNumber) # Generate one randomised 3x3 matrix for each alpha particle in the beam.
+
+            self.particle_store.Momentum = np.einsum("nij,nj->ni", self.RandomMatrices, self.particle_store.Momentum) # Multiply each alpha particle's momentum vector by its own randomised 3x3 matrix. This is the same as doing RandomMatrix.dot(momentum vector) for every row of the info list, but in one operation.
+
+        elif self.CollisionKernel == "legacy": # Update the momentum vectors one alpha particle at a time. This is how the program worked before the collisions were vectorised.
+            for particle in range(0, self.ParticleNumber): # We are going to calculate each alpha particle's final momentum vector at the end of the simulation step. Here, we iterate the matrix calculation over the number of alpha particles in the beam. These calculations are done at each simulation step.
+                self.generate_RandomMatrix_Momentum() # Generate the randomised 3x3 matrix for updating the momentum vectors of the alpha particles.
+
+                # #### debug for the radiotherapy game.
+                # print("Inside update_AlphaParticleMomentum(self)'s FOR loop with particle =", particle)
+                # print("self.generate_RandomMatrix_Momentum() in update_AlphaParticleMomentum(self) has been executed successfully ...\n")
+                # ####
+
+                ## Update the momenta of the alpha particles.
+                # Now we are going to use RandomMatrix to update the momentum vector of each alpha particle minus the alpha particles that were removed from the beam. Each alpha particle has its own RandomMatrix applied to it because the random numbers are recalculated for each alpha particle. I am assuming that how a particular alpha particle transfers momentum to an electron does *not* affect how another alpha particle transfers momentum to an electron, whether that electron is the same one or another one.
+
+                self.particle_store.Momentum[particle] = self.RandomMatrix.dot(self.particle_store.Momentum[particle])
+
 
         # NOTE: Before optimisation, there was also the following line of code ...
         # self.AlphaParticlesInfoList_ID_X_Momentum_DF = pd.DataFrame(self.AlphaParticlesInfoList_ID_X_Momentum)
@@ -1023,8 +1219,27 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
             # W3Schools. (2020). Python Operators. Retrieved from https://www.w3schools.com/python/python_operators.asp
             # the pandas development team. (2014). pandas.DataFrame.sum. pandas. Retrieved from https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.sum.html
             # The SciPy community. (2020, 29 June 2020). numpy.dot. Retrieved from https://numpy.org/doc/stable/reference/generated/numpy.dot.html#numpy.dot
+            # The SciPy community (2020). numpy.einsum, https://numpy.org/doc/stable/reference/generated/numpy.einsum.html.
                     
     
+    def update_MomentumDependentQuantities(self): # Recalculate the momentum magnitude, cross-section and mean free path of every alpha particle in the beam in one pass after the collisions. The squared momentum magnitudes are written into a scratch array of the particle store, and each quantity is written into its array in the particle store, so no new arrays are made at each simulation step.
+        MomentumMagnitudesSquared = self.particle_store.get_ScratchArray("MomentumMagnitudesSquared")
+        np.einsum("ij,ij->i", self.particle_store.Momentum, self.particle_store.Momentum, out = MomentumMagnitudesSquared) # The dot product of each momentum vector with itself.
+        np.sqrt(MomentumMagnitudesSquared, out = self.particle_store.MomentumMagnitude)
+
+        if self.MeanFreePathUpdate == "per-step":
+            np.divide(self.CrossSectionConstant, MomentumMagnitudesSquared, out = self.particle_store.CrossSection)
+            np.multiply(MomentumMagnitudesSquared, self.get_MeanFreePathFactors(), out = self.particle_store.MeanFreePath) # This is the same as (ElectronSpatialDensity * CrossSection) ** -1, with one multiplication instead of a multiplication and a division.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.einsum, https://numpy.org/doc/stable/reference/generated/numpy.einsum.html.
+            # The SciPy community (2020). Universal functions (ufunc), https://numpy.org/doc/stable/reference/ufuncs.html.
+
+
+    def get_MeanFreePathFactors(self): # Every alpha particle is in the same medium. The AttenuationQuiz class gives back one factor for each alpha particle instead.
+        return self.MeanFreePathFactor
+
+
     def update_ParticleNum(self): # This method *manages* how many alpha particles remain in the beam. Alpha particles leave the beam when they lose too much energy due to colliding with too many atomic electrons. When their energy is extremely low, they capture atomic electrons and become helium atoms, thus leaving the beam.
         # NOTE: Before multiprocessing ...
         # if __name__ == "__main__":
@@ -1032,7 +1247,9 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         
         #     timing_studies.start_UpdateParticleNum_MomentumMagnitudeCalculation = time.time()
         
-        self.AlphaParticlesInfoList_ID_X_Momentum[:, 5] = (self.AlphaParticlesInfoList_ID_X_Momentum[:, 2:5] ** 2).sum(axis = 1) ** (1/2) # Recalculate the momentum magnitude of each alpha particle.
+        self.update_MomentumDependentQuantities() # Recalculate the momentum magnitude, cross-section and mean free path of each alpha particle.
+        # NOTE: Before the cross-sections and mean free paths were updated at each simulation step ...
+        # self.particle_store.MomentumMagnitude = (self.particle_store.Momentum ** 2).sum(axis = 1) ** (1/2) # Recalculate the momentum magnitude of each alpha particle.
         # NOTE: Before optimisation ...
         # self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:, 5] = ((self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:, 2:5] ** 2).sum(axis = 1) ** (1/2)) # Recalculate the momentum magnitude of each alpha particle.
         
@@ -1042,7 +1259,12 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
 
         #     timing_studies.start_UpdateParticleNum_NumpyArrayMask = time.time()
         
-        self.AlphaParticlesInfoList_ID_X_Momentum = self.AlphaParticlesInfoList_ID_X_Momentum[self.AlphaParticlesInfoList_ID_X_Momentum[:, 5] > self.MinimumAlphaMomentum] # Remove the alpha particles from the beam that have momenta less than MinimumAlphaMomentum, which is the minimum momentum that a particle must have to stay in the beam. This line of code does not actually remove the alpha particles that have less than the minimum momentum but extracts the particles with momenta higher than the minimum momentum.
+        self.InBeamMask = self.particle_store.MomentumMagnitude > self.MinimumAlphaMomentum # The alpha particles that stay in the beam.
+        if not self.InBeamMask.all(): # At most simulation steps, no alpha particle leaves the beam, and nothing else needs to be done.
+            self.trajectory_store.record_Removals(self.particle_store.ID[~self.InBeamMask], self.particle_store.PositionX[~self.InBeamMask]) # Record where and when the other alpha particles left the beam, if the user wants this to be recorded.
+            self.particle_store.remove(self.InBeamMask) # The alpha particles that stay in the beam are compacted in place and keep their order. The particle store's Count is the watermark of the alpha particles that are in the beam.
+        # NOTE: Before the ParticleAdmin.py script was made ...
+        # self.AlphaParticlesInfoList_ID_X_Momentum = self.AlphaParticlesInfoList_ID_X_Momentum[self.InBeamMask] # Remove the alpha particles from the beam that have momenta less than MinimumAlphaMomentum, which is the minimum momentum that a particle must have to stay in the beam. This line of code does not actually remove the alpha particles that have less than the minimum momentum but extracts the particles with momenta higher than the minimum momentum.
         # NOTE: Before optimisation ...
         # self.AlphaParticlesInfoList_ID_X_Momentum_DF = self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:,:][self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:, 5] > self.MinimumAlphaMomentum] # Remove the alpha particles from the beam that have momenta less than MinimumAlphaMomentum, which is the minimum momentum that a particle must have to stay in the beam. This line of code does not actually remove the alpha particles that have less than the minimum momentum but extracts the particles with momenta higher than the minimum momentum.
         # self.AlphaParticlesInfoList_ID_X_Momentum_DF = self.AlphaParticlesInfoList_ID_X_Momentum_DF.reset_index(drop = True) # It is necessary to reset the row indices of the DataFrame now that some of the rows have been removed. Doing this should avoid problems with indexing the DataFrame later.
@@ -1051,7 +1273,7 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         # if __name__ == "__main__":
         #     timing_studies.end_UpdateParticleNum_NumpyArrayMask = time.time()
 
-        self.ParticleNumber = self.AlphaParticlesInfoList_ID_X_Momentum.shape[0] # Tell the ParticleNumber variable that the number of particles in the beam has changed. MomentumVectorList is a numpy array. Thus, we use the .shape method to extract how many rows it has.
+        self.ParticleNumber = self.particle_store.Count # Tell the ParticleNumber variable that the number of particles in the beam has changed.
         # NOTE: Before optimisation ...
         # self.ParticleNumber = self.AlphaParticlesInfoList_ID_X_Momentum_DF.shape[0] # Tell the ParticleNumber variable that the number of particles in the beam has changed. MomentumVectorList is a numpy array. Thus, we use the .shape method to extract how many rows it has.
 
@@ -1079,61 +1301,63 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
         
         # At this point, each alpha beam object has a PositionXArray array that is to be analysed.
         ## Calculate the maximum range of the alpha particles. NOTE: The x-positions are in the same units as the mean free path, which has units of m.
-        self.MaximumRange = self.PositionXArray.max().max() # The maximum range is the largest number in the array. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
+        self.range_estimator = RangeEstimator.RangeEstimator(self.PositionXArray.max(axis = 1), self.InitialPositionX) # Find the furthest x-position of each alpha particle only once. The range estimator sorts them so that the ranges can be found directly from the sorted x-positions.
+        self.MaximumRange = self.range_estimator.get_MaximumRange() # The maximum range is the largest number in the array. It is the furthest distance an alpha particle in the beam has travelled.
+        # NOTE: Before the RangeEstimator.py script was made ...
+        # self.MaximumRange = self.PositionXArray.max().max() # The maximum range is the largest number in the array. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
         # NOTE: Before optimisation ...
         # self.PositionXList_DF = ((self.PositionXList_DF.T).reset_index(drop = True)).T # First, we make sure its columns are labelled by the simulation steps rather than all having the same label due to having been concatenated together. The reset_index() method works row-wise, so we transpose the DataFrame first. Then we reset the row labels and transpose the DataFrame back to its original shape. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method. However, we use parentheses to make reading the code easier.
         # self.MaximumRange = self.PositionXList_DF.max().max() # The maximum range is the largest number in the DataFrame. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
         
         ## Calculate the number of alpha particles remaining in the beam as a function of distance.
-        self.NumOfDistancesToCheck = 5e2 # This variable is for specifying the number of points to be created using the np.linspace() method.
-        self.DistancesToCheck = list(np.linspace(start = 0.0, stop = self.MaximumRange, num = int(self.NumOfDistancesToCheck), endpoint = True)) # Create the DistancesToCheckList to be zipped into a dictionary as values.
-
-        self.NumbersList = list(range(0, len(self.DistancesToCheck))) # The list created here will be zipped into the dictionary for the DistancesToCheck list as keys.
-        
-        self.DistancesToCheck_Dict = dict(zip(self.NumbersList, self.DistancesToCheck))
-
-        self.ParticleNumList_Distance = [] # This list is going to have the number of alpha particles remaining in the beam at each distance of interest.
-        for distance_Key in range(0, len(self.DistancesToCheck_Dict)): # Use a nested FOR loop for now. Nested FOR loops are known to be relatively slow, but they get the job done in this case.
-            self.ParticleNumber_DistanceCheck = self.InitialParticleNumber # Reset this variable for use in the FOR loop below.
-            
-            for particle in range(0, self.PositionXArray.shape[0]): # Check how many particles passed the distance of interest.
-                if self.PositionXArray[particle, :].max() <= self.DistancesToCheck_Dict[distance_Key]: # For each particle that did not pass the distance of interest, decrement the ParticleNum variable by 1.
-                    self.ParticleNumber_DistanceCheck = self.ParticleNumber_DistanceCheck - 1
-            # NOTE: Before optimisation ...
-            # for particle in range(0, self.PositionXList_DF.shape[0]): # Check how many particles passed the distance of interest.
-            #     if self.PositionXList_DF.iloc[particle,:].max() <= self.DistancesToCheck_Dict[distance_Key]: # For each particle that did not pass the distance of interest, decrement the ParticleNum variable by 1.
-            #         self.ParticleNumber_DistanceCheck = self.ParticleNumber_DistanceCheck - 1
-            
-
-            self.ParticleNumList_Distance.append(self.ParticleNumber_DistanceCheck)
+        self.calculate_ParticleNumList_Distance()
+        # NOTE: Before the calculate_ParticleNumList_Distance() method was made ... The nested FOR loop below recalculated the maximum x-position of every alpha particle for every distance of interest.
+        # self.NumOfDistancesToCheck = 5e2 # This variable is for specifying the number of points to be created using the np.linspace() method.
+        # self.DistancesToCheck = list(np.linspace(start = 0.0, stop = self.MaximumRange, num = int(self.NumOfDistancesToCheck), endpoint = True)) # Create the DistancesToCheckList to be zipped into a dictionary as values.
+        # self.NumbersList = list(range(0, len(self.DistancesToCheck))) # The list created here will be zipped into the dictionary for the DistancesToCheck list as keys.
+        # self.DistancesToCheck_Dict = dict(zip(self.NumbersList, self.DistancesToCheck))
+        # self.ParticleNumList_Distance = [] # This list is going to have the number of alpha particles remaining in the beam at each distance of interest.
+        # for distance_Key in range(0, len(self.DistancesToCheck_Dict)): # Use a nested FOR loop for now. Nested FOR loops are known to be relatively slow, but they get the job done in this case.
+        #     self.ParticleNumber_DistanceCheck = self.InitialParticleNumber # Reset this variable for use in the FOR loop below.
+        #     for particle in range(0, self.PositionXArray.shape[0]): # Check how many particles passed the distance of interest.
+        #         if self.PositionXArray[particle, :].max() <= self.DistancesToCheck_Dict[distance_Key]: # For each particle that did not pass the distance of interest, decrement the ParticleNum variable by 1.
+        #             self.ParticleNumber_DistanceCheck = self.ParticleNumber_DistanceCheck - 1
+        #     self.ParticleNumList_Distance.append(self.ParticleNumber_DistanceCheck)
        
         
         ## Calculate the mean range of the alpha particles.
-        try: # It is possible that self.InitialParticleNumber // 2 not be in the ParticleNumList_Distance list in the case where more than 1 alpha particle leaves the beam at the same time at the time when slightly more than 50% of the initial number of particles remain in the beam.
-            self.MeanRange = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.InitialParticleNumber // 2)] # The mean range is defined as the distance beyond which 50% of the initial number of particles travel.
-        
-        except: # The code in the EXCEPT section is focused on assigning an alternative value to MeanRange in the case where InitialParticleNumber // 2 number of particles was skipped during the simulation because more than 1 particle was removed from the beam.
-            for num in range(1, self.InitialParticleNumber // 2 + 1):
-                try: # The code below can actually raise a ValueError error if a particular value is not found in the ParticleNumList_Distance list. Therefore, we include a TRY-EXCEPT code block in the FOR loop.
-                    if self.InitialParticleNumber // 2 + num >= self.InitialParticleNumber: # If this is the case, search for the furthest distance that *all* of the particles travelled just before the first particle left the beam.
-                        self.MeanRange_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(len(self.ParticleNumList_Distance) - 1 - self.ParticleNumList_Distance[::-1].index(self.InitialParticleNumber))] # The index() method searches for the specified element from the start of the list. However, we want the index of the *last* element, so we flip the list. Having found the index of the last element in the flipped list, we want to know its index in the original list, so we calculate the original index.
-                    else:
-                        self.MeanRange_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.InitialParticleNumber // 2 + num)]
+        self.MeanRange = self.range_estimator.get_DepthForTransmittedNumber(self.InitialParticleNumber // 2) # The mean range is defined as the distance beyond which 50% of the initial number of particles travel.
+
+        if self.BootstrapResamples > 0: # ... only if the user wants to know how uncertain the mean range of this simulation instance is.
+            self.MeanRange_ConfidenceInterval = self.range_estimator.get_BootstrapConfidenceInterval(self.InitialParticleNumber // 2, self.random_number_generator.Generator, NumberOfResamples = int(self.BootstrapResamples))
+
+        # NOTE: Before the RangeEstimator.py script was made ... The mean range was searched for in the ParticleNumList_Distance list. This searched the list many times and was only as precise as the spacing of the distances to check. Also, np.array(a, b) treats b as a data type rather than as a second number, so the last line did not take the mean of the two numbers.
+        # ## Calculate the mean range of the alpha particles.
+        # try: # It is possible that self.InitialParticleNumber // 2 not be in the ParticleNumList_Distance list in the case where more than 1 alpha particle leaves the beam at the same time at the time when slightly more than 50% of the initial number of particles remain in the beam.
+        #     self.MeanRange = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.InitialParticleNumber // 2)] # The mean range is defined as the distance beyond which 50% of the initial number of particles travel.
+        
+        # except: # The code in the EXCEPT section is focused on assigning an alternative value to MeanRange in the case where InitialParticleNumber // 2 number of particles was skipped during the simulation because more than 1 particle was removed from the beam.
+        #     for num in range(1, self.InitialParticleNumber // 2 + 1):
+        #         try: # The code below can actually raise a ValueError error if a particular value is not found in the ParticleNumList_Distance list. Therefore, we include a TRY-EXCEPT code block in the FOR loop.
+        #             if self.InitialParticleNumber // 2 + num >= self.InitialParticleNumber: # If this is the case, search for the furthest distance that *all* of the particles travelled just before the first particle left the beam.
+        #                 self.MeanRange_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(len(self.ParticleNumList_Distance) - 1 - self.ParticleNumList_Distance[::-1].index(self.InitialParticleNumber))] # The index() method searches for the specified element from the start of the list. However, we want the index of the *last* element, so we flip the list. Having found the index of the last element in the flipped list, we want to know its index in the original list, so we calculate the original index.
+        #             else:
+        #                 self.MeanRange_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.InitialParticleNumber // 2 + num)]
                 
-                    if self.InitialParticleNumber // 2 - num <= 0: # We do not want self.InitialParticleNumber // 2 - num being negative, so we stop it from being so.
-                        self.MeanRange_Forwards = self.DistancesToCheck[-1] # Unlike with MeanRange_Backwards when the condition in the IF statement just above is True, we want the index of the first occurrence of 0 particles. The simulation stops when the number of particles in the beam is 0, meaning that there is only one occurrence of 0 in the list of the number of particles in the beam. We use the list version rather than the dictionary version of DistancesToCheck because [-1] for a dictionary means "the key named '-1'", which is not what we want, while for a list it refers to the last element, which is what we want.
-                    else:
-                        self.MeanRange_Forwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.InitialParticleNumber // 2 - num)]
+        #             if self.InitialParticleNumber // 2 - num <= 0: # We do not want self.InitialParticleNumber // 2 - num being negative, so we stop it from being so.
+        #                 self.MeanRange_Forwards = self.DistancesToCheck[-1] # Unlike with MeanRange_Backwards when the condition in the IF statement just above is True, we want the index of the first occurrence of 0 particles. The simulation stops when the number of particles in the beam is 0, meaning that there is only one occurrence of 0 in the list of the number of particles in the beam. We use the list version rather than the dictionary version of DistancesToCheck because [-1] for a dictionary means "the key named '-1'", which is not what we want, while for a list it refers to the last element, which is what we want.
+        #             else:
+        #                 self.MeanRange_Forwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.InitialParticleNumber // 2 - num)]
 
-                    if (self.MeanRange_Backwards is not None) and (self.MeanRange_Forwards is not None):
-                        break # Now that we have assigned a value to each of the two variables above, we do not need to iterate "num" anymore. We have what we wanted.
-                    else:
-                        continue
+        #             if (self.MeanRange_Backwards is not None) and (self.MeanRange_Forwards is not None):
+        #                 break # Now that we have assigned a value to each of the two variables above, we do not need to iterate "num" anymore. We have what we wanted.
+        #             else:
+        #                 continue
 
-                except:
-                    continue # We want to use the normal behaviour of a FOR loop in that it goes to its next iteration. It is because of the ValueError error that we use a TRY-EXCEPT code block.
+        #         except:
+        #             continue # We want to use the normal behaviour of a FOR loop in that it goes to its next iteration. It is because of the ValueError error that we use a TRY-EXCEPT code block.
             
-            self.MeanRange = np.array(self.MeanRange_Backwards, self.MeanRange_Forwards).mean() # The slope at the descending end of the plot of the number of particles in the beam as a function of distance is approximately linear. So we do linear interpolation. I prefer to use a numpy array and the mean() method instead of doing (a + b)/2, because the latter option seems a bit hard-coded to me.
+        #     self.MeanRange = np.array(self.MeanRange_Backwards, self.MeanRange_Forwards).mean() # The slope at the descending end of the plot of the number of particles in the beam as a function of distance is approximately linear. So we do linear interpolation. I prefer to use a numpy array and the mean() method instead of doing (a + b)/2, because the latter option seems a bit hard-coded to me.
 
         # NOTE: Before multiprocessing ...
         # if __name__ == "__main__":
@@ -1153,6 +1377,17 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
             # Krane, K S (2014). Introductory Nuclear Physics, Reprint ed. Durga Printo Graphics, Delhi: John Wiley & Sons, Inc.
     
     
+    def calculate_ParticleNumList_Distance(self): # Calculate the number of alpha particles remaining in the beam at each distance of interest. An alpha particle is counted as remaining in the beam at a distance if its furthest x-position is beyond that distance. The range_estimator object must have been made before this method is used.
+        self.DistancesToCheck = list(np.linspace(start = 0.0, stop = self.MaximumRange, num = int(self.NumOfDistancesToCheck), endpoint = True)) # Create the DistancesToCheckList to be zipped into a dictionary as values.
+        self.NumbersList = list(range(0, len(self.DistancesToCheck))) # The list created here will be zipped into the dictionary for the DistancesToCheck list as keys.
+        self.DistancesToCheck_Dict = dict(zip(self.NumbersList, self.DistancesToCheck))
+
+        self.ParticleNumList_Distance = self.range_estimator.get_ParticleNumList_Distance(self.DistancesToCheck) # This list has the number of alpha particles remaining in the beam at each distance of interest. The range estimator uses a binary search on the sorted furthest x-positions of the alpha particles, with the same condition as in the nested FOR loop that this method replaced.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.linspace, https://numpy.org/doc/stable/reference/generated/numpy.linspace.html.
+
+
     def plot_ParticleNum(self): # Plot the number of alpha particles in the beam as a function of simulation step. The AttenuationQuiz class inherits this method.
         plt.figure(figsize = (17, 7)) # Make the figure have dimensions that are suitable for seeing the relationship between the number of particles in the beam and the distance the beam travelled more clearly.
         plt.scatter(self.DistancesToCheck, self.ParticleNumList_Distance, marker = ".", alpha = 0.5) # I do not want the markers of the scatter plot to be too big lest the apparent curve be seen as too thick to see the relationship clearly. In general, the number of alpha particles in a beam travelling through a medium stays constant for some distance and then rapidly drops to 0 near the maximum range of the particles. The rapid drop in the number of particles in the beam as a function of distance tends to be sigmoidal in shape. Using an "alpha" less than 1 means that we can see the plot from each instance of the simulation.
@@ -1169,29 +1404,51 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
             # Hofmann, F. Creating and Deleting Directories with Python. Retrieved from https://stackabuse.com/creating-and-deleting-directories-with-python/
     
     
+    def reset_Progress(self): # Start counting the simulation steps and the time until the progress is next worked out and printed.
+        self.StepsSinceProgress = 0
+        self.NextProgressReport = time.monotonic() + self.DelayForShowingProgress # A monotonic clock is not changed when the clock of the computer is set, so the time until the next message is never negative.
+
+
     def show_Progress(self, instance):
+        self.StepsSinceProgress = self.StepsSinceProgress + 1
+        if (self.StepsSinceProgress < self.ProgressStepInterval) or (self.ParticleNumber == 0): # Most simulation steps end here, so working out the progress costs almost nothing. The simulation ends when there are no alpha particles left in the beam.
+            return
+
+        self.StepsSinceProgress = 0
+
         if __name__ == "__main__":
             timing_studies.start_ShowProgress = time.time()
         
         try:
             ### Calculate the progress.
             if self.ParticleNumber != 0: # Keep showing the maximum alpha particle kinetic energy in the beam until there are no more particles in the beam. The maximum kinetic energy decreases throughout the entire simulation. However, the number of alpha particles in the beam stays constant until near the end of the simulation where it rapidly decreases to 0. Thus, letting the user see the maximum alpha particle kinetic energy rather than how many particles remain in the beam gives them a better measure of the progress of the simulation.
-                self.MaximumAlphaMomentum_now = max(((self.AlphaParticlesInfoList_ID_X_Momentum[:, 2:5] ** 2).sum(axis = 1) ** (1/2))) # Given the momentum vectors of all of the alpha particles in the beam, I want to pick out the one that has the highest magnitude. *In the same simulation step*, use the pandas DataFrame of the list of momentum vectors to calculate the magnitudes of the vectors all at once. Then pick out the maximum magnitude.
-                self.MaximumAlphaEnergy_now = ((self.MaximumAlphaMomentum_now ** 2 / (2 * self.AlphaMass_kg)) / self.J_eV_ConversionFactor) * 1e-6 # This is the equation E_alpha = p_alpha ** 2 / (2 * AlphaMass), where E_alpha and p_alpha are the kinetic energy and momentum magnitude of the alpha particle, respectively. I want the kinetic energy in MeV.
+                self.MaximumAlphaMomentum_now = self.particle_store.MomentumMagnitude.max() # The update_ParticleNum() method has just recalculated the momentum magnitudes of the alpha particles in the beam, so they are not calculated again here.
+                self.MaximumAlphaEnergy_now = self.KineticEnergyFactor_MeV * self.MaximumAlphaMomentum_now ** 2 # This is the equation E_alpha = p_alpha ** 2 / (2 * AlphaMass), in units of MeV.
+                # NOTE: Before the MediumAdmin.py script was made ...
+                # self.MaximumAlphaMomentum_now = max(((self.particle_store.Momentum ** 2).sum(axis = 1) ** (1/2))) # Given the momentum vectors of all of the alpha particles in the beam, I want to pick out the one that has the highest magnitude. *In the same simulation step*, use the pandas DataFrame of the list of momentum vectors to calculate the magnitudes of the vectors all at once. Then pick out the maximum magnitude.
+                # self.MaximumAlphaEnergy_now = ((self.MaximumAlphaMomentum_now ** 2 / (2 * self.AlphaMass_kg)) / self.J_eV_ConversionFactor) * 1e-6 # This is the equation E_alpha = p_alpha ** 2 / (2 * AlphaMass), where E_alpha and p_alpha are the kinetic energy and momentum magnitude of the alpha particle, respectively. I want the kinetic energy in MeV.
 
                 self.Progress_Percentage = (1.0 - self.MaximumAlphaEnergy_now / (self.InitialKineticEnergy - self.MinimumAlphaEnergy_eV * 1e-6)) ** (10) * 100 # The maximum alpha particle kinetic energy does not decrease linearly, but approximately proportionally to the specified power, which was chosen through trial and error. The "* 100" is for converting the fraction to a percentage.
 
             
             ### Show the progress.
-            self.EndDelayTimer = time.time()
-
-            if (self.StartDelayTimer is None) or (self.DelayTimer > self.DelayForShowingProgress):
-                self.StartDelayTimer = time.time() # Give this variable a value.
+            if self.progress_counter is not None: # A pooled process only writes its progress into shared memory. The main process prints the progress of all of the pooled processes.
+                self.progress_counter.set_Progress(self.ProgressTask, self.Progress_Percentage)
 
-            self.DelayTimer = self.EndDelayTimer - self.StartDelayTimer
-            
-            if self.DelayTimer > self.DelayForShowingProgress: # This time period is how much to wait before showing another message of the progress of each simulation instance.
+            elif time.monotonic() >= self.NextProgressReport: # This time period is how much to wait before showing another message of the progress of each simulation instance.
                 print("\tThe progress of Simulation Instance {}".format(instance + 1) + " is {0:0.2f}% ...".format(self.Progress_Percentage)) # It seems that all or none of the {}s must have a specification of the formatting to avoid the "ValueError: cannot switch from automatic field numbering to manual field specification" error. (I tried it myself, so there is no reference to cite.) Alternatively, I can separate the strings and use string concatenation.
+                self.NextProgressReport = time.monotonic() + self.DelayForShowingProgress
+
+            # NOTE: Before the ProgressAdmin.py script was made ...
+            # self.EndDelayTimer = time.time()
+
+            # if (self.StartDelayTimer is None) or (self.DelayTimer > self.DelayForShowingProgress):
+            #     self.StartDelayTimer = time.time() # Give this variable a value.
+
+            # self.DelayTimer = self.EndDelayTimer - self.StartDelayTimer
+
+            # if self.DelayTimer > self.DelayForShowingProgress: # This time period is how much to wait before showing another message of the progress of each simulation instance.
+            #     print("\tThe progress of Simulation Instance {}".format(instance + 1) + " is {0:0.2f}% ...".format(self.Progress_Percentage)) # It seems that all or none of the {}s must have a specification of the formatting to avoid the "ValueError: cannot switch from automatic field numbering to manual field specification" error. (I tried it myself, so there is no reference to cite.) Alternatively, I can separate the strings and use string concatenation.
               
         except AttributeError: # AttributeError is the error I saw in the command terminal when I specified an initial alpha particle kinetic energy less than the minimum energy required for a particle to stay in the beam.
             print("Error: You must specify an initial alpha particle kinetic energy greater than {} eV. The program will now exit.".format(self.MinimumAlphaEnergy_eV))
@@ -1294,9 +1551,9 @@ class AlphaParticles(ErrorChecking): # *Define* a class for the alpha particles.
             # Programiz. Python Exception Handling Using try, except and finally statement. Retrieved from https://www.programiz.com/python-programming/exception-handling
 
 
-    def process_Simulation(self, instance): # Pass the "instance" argument to the show_Progress() method.
+    def process_Simulation(self, instance, AlphaParticleIDs = None, seed_sequence = None): # Pass the "instance" argument to the show_Progress() method. AlphaParticleIDs and seed_sequence are passed to the initialise_Simulation() method.
         self.make_Medium()
-        self.initialise_Simulation(instance) # Prepare the arrays, lists and other variables that are to be used in the simulation using what was defined in the class's __init__() method.
+        self.initialise_Simulation(instance, AlphaParticleIDs, seed_sequence) # Prepare the arrays, lists and other variables that are to be used in the simulation using what was defined in the class's __init__() method.
             
         ### Process the data. This WHILE loop is the simulation.
         while self.ParticleNumber > 0: # Use the ParticleNumber variable directly instead of using a method to retrieve it. I prefer this style.
@@ -1335,6 +1592,18 @@ class StatisticalAnalysis(AlphaParticles): # This class is for running a simulat
     def __init__(self, InitialKineticEnergy, InitialParticleNumber, RandomDistribution, AtomicNumber, AtomicWeight, MassDensity, SimInstances):
         super().__init__(InitialKineticEnergy, InitialParticleNumber, RandomDistribution, AtomicNumber, AtomicWeight, MassDensity)
 
+        self.OffDiagonalHistogram_NumberOfBins = None # If this is None, each simulation instance sends back the values of the off-diagonal elements of the randomised 3x3 matrices so that the user can choose the number of bins of the histograms after the simulation. If it is a number of bins, each simulation instance sends back only the histograms, which are much smaller.
+        self.OffDiagonalHistogram_Counts_All = None # The histograms of all of the simulation instances added together. This is only used when OffDiagonalHistogram_NumberOfBins is not None.
+        self.CollectOffDiagonalElements = True # If False, the simulation instances send back neither the values of the off-diagonal elements nor their histograms, e.g., for a parameter sweep, which only needs the ranges. Then the histograms cannot be plotted.
+
+        # If TargetRelativeUncertainty is not None, simulation instances are run in batches until 3 standard errors of the mean of both the mean range and the maximum range are at most this fraction of their averages. See the ConvergenceAdmin.py script.
+        self.TargetRelativeUncertainty = None
+        self.MinimumSimInstances = 3
+        self.MaximumSimInstances = 1000 # Stop even if the results have not converged, e.g., if the target is too small to ever be reached.
+        self.SimInstancesPerBatch = 4 # The number of simulation instances that are run before the convergence is checked again. A batch has many chunks, so all of the CPU cores are kept busy.
+        self.convergence_monitor = None
+        self.RootSeed = None # The seed of the root SeedSequence. It is the user's seed, or the entropy from the operating system if there is no seed.
+
         # REFERENCES:
             # Fayek, H (2020). Week 6 Object-Oriented Programming, 124 La Trobe St, Melbourne VIC 3000: Haytham Fayek.
     
@@ -1347,17 +1616,139 @@ class StatisticalAnalysis(AlphaParticles): # This class is for running a simulat
         print("Analysing the data from Simulation Instance {} ...".format(instance + 1)) # Tell the user what is happening. This process can take some time because of the large amount of data that must be processed, especially for producing a plot of the number of alpha particles in the beam as a function of penetration distance into the medium.
         self.alpha_beam_dict[instance].calculate_Data() # Calculate the results.
 
-        return self.alpha_beam_dict[instance] # It is actually necessary that the multiprocessing pool return something.
+        return ResultAdmin.SimulationInstanceResult(self.alpha_beam_dict[instance], instance, self.OffDiagonalHistogram_NumberOfBins) # It is actually necessary that the multiprocessing pool return something. Only the results that the main process needs are sent back rather than the whole AlphaParticles object, which would have to be pickled with all of its arrays and lists.
+        # NOTE: Before the ResultAdmin.py script was made ...
+        # return self.alpha_beam_dict[instance] # It is actually necessary that the multiprocessing pool return something.
 
         # REFERENCES:
             # PhysicistAbroad (2017). Multiprocessing in Python returns None unexpectedly, https://stackoverflow.com/questions/44052594/multiprocessing-in-python-returns-none-unexpectedly.
         
                 
+    def make_SimulationChunks(self): # Split the alpha particles of each simulation instance into chunks. A pooled process that finishes its chunk early takes the next chunk from the queue, so all of the CPU cores stay busy until the last chunk is done, rather than waiting for the slowest simulation instance. Every simulation instance is split in the same way as the alpha particles of the radiotherapy game.
+        self.ChunkDict_AlphaParticleIDs = self.split_ParticlesIntoChunks()
+        self.SimulationChunks_List = [(instance, chunk) for instance in range(0, self.SimInstances) for chunk in range(0, self.NumberOfChunks)] # The tasks for the pooled processes.
+
+        if self.RootSeed is None: # Without a seed, the entropy from the operating system is drawn once, so that the simulation instances that are added later have SeedSequences from the same root.
+            self.RootSeed = self.Seed if self.Seed is not None else np.random.SeedSequence().entropy
+
+        self.SeedSequences = RandomNumberAdmin.get_SeedSequences(self.RootSeed, self.SimInstances, self.NumberOfChunks + 1) # One SeedSequence per chunk, plus one per simulation instance for analysing its results in the main process.
+        # NOTE: Before the radiotherapy game and the beam analysis split their alpha particles in the same way, each chunk was a block of consecutive IDs.
+        # self.ChunkDict_AlphaParticleIDs = {chunk : IDs for chunk, IDs in enumerate(np.array_split(np.arange(0, self.InitialParticleNumber), self.NumberOfChunks))}
+
+
+    def get_SimulationChunkTask(self, instance, chunk): # The task of the pooled processes for one chunk of alpha particles of a simulation instance. See the process_SimulationChunk() function. The AlphaParticles object of the simulation instance has not been simulated yet, so it only has the inputs and constants of the simulation and is small to pickle. It cannot be made in a pooled process instead, because the ErrorChecking class needs the FloatMin and FloatMax variables, which only the main process has when the pooled processes are started with the spawn start method.
+        AlphaParticleIDs = None if self.NumberOfChunks == 1 else self.ChunkDict_AlphaParticleIDs[chunk] # If the whole simulation instance is one chunk, it is simulated as a whole.
+        ProgressTask = self.ProgressTasks[(instance, chunk)] if self.progress_counter is not None else 0
+
+        return (self.alpha_beam_dict[instance], instance, chunk, AlphaParticleIDs, self.SeedSequences[(instance, chunk)], self.OffDiagonalHistogram_NumberOfBins, self.CollectOffDiagonalElements, self.progress_counter, ProgressTask)
+
+
+    # NOTE: Before the process_SimulationChunk() function was made, this method was given to the pooled processes, so this object was pickled with every chunk, with the IDs and SeedSequences of every chunk and the AlphaParticles object of every simulation instance.
+    # def process_SimulationChunk(self, InstanceAndChunk):
+        # instance, chunk = InstanceAndChunk
+
+        # if self.progress_counter is not None: # The chunk writes its progress into its slot of the progress counter rather than printing it.
+        #     self.alpha_beam_dict[instance].progress_counter, self.alpha_beam_dict[instance].ProgressTask = self.progress_counter, self.ProgressTasks[InstanceAndChunk]
+
+        # if self.NumberOfChunks == 1: # The whole simulation instance is one chunk.
+        #     self.alpha_beam_dict[instance].process_Simulation(instance, None, self.SeedSequences[(instance, chunk)])
+
+        # else:
+        #     self.alpha_beam_dict[instance].process_Simulation(instance, self.ChunkDict_AlphaParticleIDs[chunk], self.SeedSequences[(instance, chunk)])
+
+        # return ResultAdmin.SimulationChunkResult(self.alpha_beam_dict[instance], instance, chunk, self.OffDiagonalHistogram_NumberOfBins) # The chunks are put back together in the main process by a SimulationInstanceReducer object.
+
+
+    def add_SimulationInstances(self, NumberOfSimInstances): # Add simulation instances that have not been run yet. This is used when the simulation instances are run until the results converge.
+        for instance in range(self.SimInstances, self.SimInstances + NumberOfSimInstances):
+            self.alpha_beam_dict[instance] = AlphaParticles(self.InitialKineticEnergy, self.InitialParticleNumber, self.RandomDistribution, self.AtomicNumber, self.AtomicWeight, self.MassDensity)
+            self.alpha_beam_dict[instance].Seed, self.alpha_beam_dict[instance].AmountOfNumbers = self.Seed, self.AmountOfNumbers
+            self.MaximumRanges_Dict[instance], self.ParticleNumDict_Distance_Dict[instance], self.MeanRanges_Dict[instance] = 0, 0, 0
+
+        self.SimInstances = self.SimInstances + NumberOfSimInstances
+        self.SimInstances_List = list(range(0, self.SimInstances))
+
+
+    def get_CacheKey(self, result_cache, instance): # The key of a simulation instance in the result cache, or None if its results cannot be kept because there is no seed. The random numbers of a simulation instance only depend on the seed, the simulation instance and the number of chunks, which the particles per chunk decide, so the number of simulation instances is not part of the key.
+        if (result_cache is None) or (self.Seed is None):
+            return None
+
+        CacheInputs = self.get_CacheInputs()
+        CacheInputs.update({"Simulation instance" : int(instance), "Number of bins of the histograms" : self.OffDiagonalHistogram_NumberOfBins, "Collect off-diagonal elements" : self.CollectOffDiagonalElements}) # The results keep either the values of the off-diagonal elements, only their histograms or neither.
+
+        return result_cache.get_Key(CacheInputs)
+
+
+    def run_SimulationInstancesBatch(self, pool_admin, Instances, result_cache = None): # Run some of the simulation instances with the pooled processes and give back the SimulationInstanceResult object of each of them. The simulation instances that are in the result cache are not run again.
+        self.make_SimulationChunks() # The SeedSequences of the simulation instances that were already run do not change when more simulation instances are added.
+        PoolResult_BeamAnalysis = {} # The SimulationInstanceResult object of each simulation instance.
+
+        CacheKeys = {instance : self.get_CacheKey(result_cache, instance) for instance in Instances}
+        for instance in Instances:
+            if CacheKeys[instance] is not None:
+                CachedResult = result_cache.load(CacheKeys[instance])
+                if CachedResult is not None:
+                    print("The results of Simulation Instance {} were found in the result cache.".format(instance + 1))
+                    PoolResult_BeamAnalysis[instance] = CachedResult
+
+        Instances = [instance for instance in Instances if instance not in PoolResult_BeamAnalysis] # Only the simulation instances that are missing are run.
+        self.SimulationChunks_List = [(instance, chunk) for instance in Instances for chunk in range(0, self.NumberOfChunks)]
+        simulation_instance_reducers = {instance : ResultAdmin.SimulationInstanceReducer(self.alpha_beam_dict[instance], instance, self.NumberOfChunks, self.OffDiagonalHistogram_NumberOfBins, self.SeedSequences[(instance, self.NumberOfChunks)], self.CollectOffDiagonalElements) for instance in Instances}
+
+        self.progress_counter = ProgressAdmin.ProgressCounter(len(self.SimulationChunks_List)) # Each chunk writes its progress into its own slot.
+        self.ProgressTasks = {InstanceAndChunk : Task for Task, InstanceAndChunk in enumerate(self.SimulationChunks_List)}
+
+        SimulationChunkTasks = (self.get_SimulationChunkTask(instance, chunk) for instance, chunk in self.SimulationChunks_List) # Only the inputs of the simulation instance and the IDs and SeedSequence of the chunk are pickled with each task, not this object.
+        for chunk_result in ProgressAdmin.report_Progress(pool_admin.imap_unordered(process_SimulationChunk, SimulationChunkTasks), self.progress_counter, "the simulation instances"): # The chunks come back in the order in which they finish.
+            self.progress_counter.set_Progress(self.ProgressTasks[(chunk_result.Instance, chunk_result.Chunk)], 100.0)
+            if simulation_instance_reducers[chunk_result.Instance].add_ChunkResult(chunk_result): # All of the chunks of this simulation instance are done.
+                print("Analysing the data from Simulation Instance {} ...".format(chunk_result.Instance + 1))
+                PoolResult_BeamAnalysis[chunk_result.Instance] = simulation_instance_reducers.pop(chunk_result.Instance).get_Result() # The reducer is not needed anymore, so the chunks it kept can be freed.
+
+                if CacheKeys[chunk_result.Instance] is not None:
+                    result_cache.save(CacheKeys[chunk_result.Instance], PoolResult_BeamAnalysis[chunk_result.Instance])
+
+        self.progress_counter.close()
+        self.progress_counter = None
+
+        return PoolResult_BeamAnalysis
+
+
+    def run_SimulationInstances(self, pool_admin, result_cache = None): # Run all of the simulation instances. If TargetRelativeUncertainty is None, SimInstances simulation instances are run. Otherwise, simulation instances are run in batches until the results converge.
+        self.RootSeed = None
+
+        if self.TargetRelativeUncertainty is None:
+            PoolResult_BeamAnalysis = self.run_SimulationInstancesBatch(pool_admin, self.SimInstances_List, result_cache)
+
+        else:
+            self.convergence_monitor = ConvergenceAdmin.ConvergenceMonitor(self.TargetRelativeUncertainty, self.MinimumSimInstances)
+            PoolResult_BeamAnalysis = {}
+
+            while (not self.convergence_monitor.is_Converged()) and (self.SimInstances < self.MaximumSimInstances):
+                NumberOfSimInstances_Before = self.SimInstances
+                self.add_SimulationInstances(min(max(self.SimInstancesPerBatch, self.MinimumSimInstances - self.SimInstances), self.MaximumSimInstances - self.SimInstances))
+                PoolResult_BeamAnalysis.update(self.run_SimulationInstancesBatch(pool_admin, list(range(NumberOfSimInstances_Before, self.SimInstances)), result_cache))
+
+                for instance in range(NumberOfSimInstances_Before, self.SimInstances): # The results are added in the order of the simulation instances, not in the order in which they finished, so the number of simulation instances that are run is the same every time for the same seed.
+                    self.convergence_monitor.add_SimulationInstance(PoolResult_BeamAnalysis[instance].MeanRange, PoolResult_BeamAnalysis[instance].MaximumRange)
+
+                MeanRange_RelativeUncertainty, MaximumRange_RelativeUncertainty = self.convergence_monitor.get_RelativeUncertainties()
+                print("After {} simulation instances, the relative uncertainties of the mean range and the maximum range are {:.3g} and {:.3g}. The target is {:.3g}.".format(self.SimInstances, MeanRange_RelativeUncertainty, MaximumRange_RelativeUncertainty, self.TargetRelativeUncertainty))
+
+            if not self.convergence_monitor.is_Converged():
+                print("Warning: The results did not converge to the target relative uncertainty within {} simulation instances.".format(self.MaximumSimInstances))
+
+        self.alpha_beam_dict = {instance : PoolResult_BeamAnalysis[instance] for instance in self.SimInstances_List}
+
+
     def get_DataFromSimulationInstances(self): # Gather the results of each simulation instance.
         if __name__ == "__main__":
             ### Output the results.
             for instance in range(0, self.SimInstances):
+                timing_studies.start_GetResults = time.time() # The get_Results() method of the SimulationInstanceResult class is not timed by itself, so it is timed here instead.
                 self.MaximumRanges_Dict[instance], self.ParticleNumDict_Distance_Dict[instance], self.MeanRanges_Dict[instance] = self.alpha_beam_dict[instance].get_Results() # Collect the results of the simulation instance.
+                timing_studies.end_GetResults = time.time()
+                timing_studies.get_Results_List.append(timing_studies.end_GetResults - timing_studies.start_GetResults)
 
 
     def calculate_and_get_Average(self, Dictionary):
@@ -1419,10 +1810,21 @@ class StatisticalAnalysis(AlphaParticles): # This class is for running a simulat
     
     def plot_RandomMatrixOffDiagonal(self, DataList, OffDiagonalElement, x_axis_ScaleFactor, hist_NumberOfBins): # The code in this method is repeated for each off-diagonal element of the randomised 3x3 matrix (RandomMatrix).
         if __name__ == "__main__":
-            self.RandomNumList_C_All_np_rescaled = np.array(DataList) * x_axis_ScaleFactor # Apply the x-axis scale factor to the random numbers to make the x-axis label of the plot be more readable.
             plt.figure() # Initialise a new matplotlib.pyplot (plt) figure so that the histogram defined in the next line does not get added to any plt figure already in the computer's memory.
-            plt.hist(self.RandomNumList_C_All_np_rescaled, bins = hist_NumberOfBins) # This histogram is now in the computer's memory.
-            plt.xlim(0.0, max(self.RandomNumList_C_All_np_rescaled)) # This line of code solved the situation where the x-axis ranged from 0 to a few thousand. A scale factor of 1e5 would not scale the values of the off-diagonal elements that high because the sum of the off-diagonal values in each column of the randomised 3x3 matrix is 1 - C_xx.
+
+            if self.OffDiagonalHistogram_Counts_All is None: # The simulation instances sent back the values of the off-diagonal elements.
+                self.RandomNumList_C_All_np_rescaled = np.array(DataList) * x_axis_ScaleFactor # Apply the x-axis scale factor to the random numbers to make the x-axis label of the plot be more readable.
+                plt.hist(self.RandomNumList_C_All_np_rescaled, bins = hist_NumberOfBins) # This histogram is now in the computer's memory.
+                plt.xlim(0.0, max(self.RandomNumList_C_All_np_rescaled)) # This line of code solved the situation where the x-axis ranged from 0 to a few thousand. A scale factor of 1e5 would not scale the values of the off-diagonal elements that high because the sum of the off-diagonal values in each column of the randomised 3x3 matrix is 1 - C_xx.
+
+            else: # The simulation instances sent back histograms. Each bin is drawn as one value at the left edge of the bin, weighted by the number of values in the bin.
+                self.BinEdges_rescaled = self.OffDiagonalHistogram_BinEdges[OffDiagonalElement] * x_axis_ScaleFactor
+                self.Counts = self.OffDiagonalHistogram_Counts_All[OffDiagonalElement]
+                plt.hist(self.BinEdges_rescaled[:-1], bins = self.BinEdges_rescaled, weights = self.Counts)
+                plt.xlim(0.0, self.BinEdges_rescaled[1:][self.Counts > 0].max()) # The right edge of the last bin that has values in it.
+
+                # REFERENCE: Hunter, J., Dale, D., Firing, E., Droettboom, M., & The Matplotlib development team. (14 August 2020). matplotlib.pyplot.hist. Retrieved from https://matplotlib.org/3.3.1/api/_as_gen/matplotlib.pyplot.hist.html
+
             plt.xlabel("{} /{:.0e}".format(OffDiagonalElement, x_axis_ScaleFactor ** -1)) # Tell the user what the values they are seeing on the x-axis mean.
             plt.ylabel(self.plt_ylabel)
     
@@ -1442,14 +1844,29 @@ class StatisticalAnalysis(AlphaParticles): # This class is for running a simulat
 
             # Concatenate ...
             timing_studies.start_StatisticalAnalysis_plot_RandomMatrixOffDiagonals_Concatenation = time.time()
-        
-            for instance in range(0, SimInstances):
-                self.RandomNumList_C_xy_All = self.RandomNumList_C_xy_All + alpha_beam_dict[instance].RandomNumList_C_xy # List concatenation.
-                self.RandomNumList_C_xz_All = self.RandomNumList_C_xz_All + alpha_beam_dict[instance].RandomNumList_C_xz # List concatenation.
-                self.RandomNumList_C_yx_All = self.RandomNumList_C_yx_All + alpha_beam_dict[instance].RandomNumList_C_yx # List concatenation.
-                self.RandomNumList_C_yz_All = self.RandomNumList_C_yz_All + alpha_beam_dict[instance].RandomNumList_C_yz # List concatenation.
-                self.RandomNumList_C_zx_All = self.RandomNumList_C_zx_All + alpha_beam_dict[instance].RandomNumList_C_zx # List concatenation.
-                self.RandomNumList_C_zy_All = self.RandomNumList_C_zy_All + alpha_beam_dict[instance].RandomNumList_C_zy # List concatenation.
+
+            if self.OffDiagonalHistogram_NumberOfBins is None: # The simulation instances sent back the values of the off-diagonal elements as numpy arrays. Each array is concatenated once rather than once per simulation instance.
+                self.RandomNumList_C_xy_All = np.concatenate([alpha_beam_dict[instance].OffDiagonalValues["C_xy"] for instance in range(0, SimInstances)])
+                self.RandomNumList_C_xz_All = np.concatenate([alpha_beam_dict[instance].OffDiagonalValues["C_xz"] for instance in range(0, SimInstances)])
+                self.RandomNumList_C_yx_All = np.concatenate([alpha_beam_dict[instance].OffDiagonalValues["C_yx"] for instance in range(0, SimInstances)])
+                self.RandomNumList_C_yz_All = np.concatenate([alpha_beam_dict[instance].OffDiagonalValues["C_yz"] for instance in range(0, SimInstances)])
+                self.RandomNumList_C_zx_All = np.concatenate([alpha_beam_dict[instance].OffDiagonalValues["C_zx"] for instance in range(0, SimInstances)])
+                self.RandomNumList_C_zy_All = np.concatenate([alpha_beam_dict[instance].OffDiagonalValues["C_zy"] for instance in range(0, SimInstances)])
+
+            else: # The simulation instances sent back histograms with the same bin edges, so they are added together.
+                self.OffDiagonalHistogram_BinEdges = alpha_beam_dict[0].OffDiagonalHistogram_BinEdges
+                self.OffDiagonalHistogram_Counts_All = {OffDiagonalElement : sum(alpha_beam_dict[instance].OffDiagonalHistogram_Counts[OffDiagonalElement] for instance in range(0, SimInstances)) for OffDiagonalElement in ResultAdmin.OffDiagonalElements}
+
+            # NOTE: Before the ResultAdmin.py script was made ...
+            # for instance in range(0, SimInstances):
+            #     self.RandomNumList_C_xy_All = self.RandomNumList_C_xy_All + alpha_beam_dict[instance].RandomNumList_C_xy # List concatenation.
+            #     self.RandomNumList_C_xz_All = self.RandomNumList_C_xz_All + alpha_beam_dict[instance].RandomNumList_C_xz # List concatenation.
+            #     self.RandomNumList_C_yx_All = self.RandomNumList_C_yx_All + alpha_beam_dict[instance].RandomNumList_C_yx # List concatenation.
+            #     self.RandomNumList_C_yz_All = self.RandomNumList_C_yz_All + alpha_beam_dict[instance].RandomNumList_C_yz # List concatenation.
+            #     self.RandomNumList_C_zx_All = self.RandomNumList_C_zx_All + alpha_beam_dict[instance].RandomNumList_C_zx # List concatenation.
+            #     self.RandomNumList_C_zy_All = self.RandomNumList_C_zy_All + alpha_beam_dict[instance].RandomNumList_C_zy # List concatenation.
+
+            # REFERENCE: The SciPy community (2020). numpy.concatenate, https://numpy.org/doc/stable/reference/generated/numpy.concatenate.html.
         
             timing_studies.end_StatisticalAnalysis_plot_RandomMatrixOffDiagonals_Concatenation = time.time()
             timing_studies.append_TimingResults_ParticularLines("StatisticalAnalysis plot_RandomMatrixOffDiagonals() ConcatenationForRandomNumHistograms (once)", timing_studies.end_StatisticalAnalysis_plot_RandomMatrixOffDiagonals_Concatenation - timing_studies.start_StatisticalAnalysis_plot_RandomMatrixOffDiagonals_Concatenation)
@@ -1458,18 +1875,22 @@ class StatisticalAnalysis(AlphaParticles): # This class is for running a simulat
             self.hist_NumberOfBins_Default = 500 # Define a default number of bins for the histograms that are going to be plotted so that the number of bins in the histograms is always defined. The user may have invested considerable time and computer resources for running the simulation. They must get its results.
         
             timing_studies.start_StatisticalAnalysis_plot_RandomMatrixOffDiagonals_Input = time.time() # ... for subtracting the time spent waiting for a user input.
-            try:
-                self.hist_NumberOfBins = int(self.check_FloatingPointInput(float(input("\tHow many bins should the histograms of the off-diagonal elements of the randomised 3x3 matrix have? Please specify an integer greater than 0. (Default: {}) ".format(self.hist_NumberOfBins_Default))))) # The frequencies of the values can become quite large when the initial kinetic energy of the alpha particles is high and/or the initial number of particles in the beam is high. This message is indented to show the user it is part of the process of saving the data. The previous message during runtime would have been a message saying that the data is being saved.
+            if self.OffDiagonalHistogram_NumberOfBins is not None: # The number of bins was chosen before the simulation, so the user is not asked for it.
+                self.hist_NumberOfBins = self.OffDiagonalHistogram_NumberOfBins
+
+            else:
+                try:
+                    self.hist_NumberOfBins = int(self.check_FloatingPointInput(float(input("\tHow many bins should the histograms of the off-diagonal elements of the randomised 3x3 matrix have? Please specify an integer greater than 0. (Default: {}) ".format(self.hist_NumberOfBins_Default))))) # The frequencies of the values can become quite large when the initial kinetic energy of the alpha particles is high and/or the initial number of particles in the beam is high. This message is indented to show the user it is part of the process of saving the data. The previous message during runtime would have been a message saying that the data is being saved.
                 
-                if self.hist_NumberOfBins <= 0:
-                    print("Error: A histogram cannot have 0 or a negative number of bins. Please specify a positive number.") # The user must get the data of the simulation.
-                    self.hist_NumberOfBins = self.hist_NumberOfBins_Default
+                    if self.hist_NumberOfBins <= 0:
+                        print("Error: A histogram cannot have 0 or a negative number of bins. Please specify a positive number.") # The user must get the data of the simulation.
+                        self.hist_NumberOfBins = self.hist_NumberOfBins_Default
 
-                print("\t...") # Show the user that the program is still running.
+                    print("\t...") # Show the user that the program is still running.
             
-            except:
-                print("Error: You did not input a valid value for the number of bins in the histograms. The default number of bins will be used, i.e., {} bins.".format(self.hist_NumberOfBins_Default))
-                self.hist_NumberOfBins = self.hist_NumberOfBins_Default # The user may have invested considerable time and computer resources for running the simulation. They must get its results. Exiting the program would not be suitable.
+                except:
+                    print("Error: You did not input a valid value for the number of bins in the histograms. The default number of bins will be used, i.e., {} bins.".format(self.hist_NumberOfBins_Default))
+                    self.hist_NumberOfBins = self.hist_NumberOfBins_Default # The user may have invested considerable time and computer resources for running the simulation. They must get its results. Exiting the program would not be suitable.
 
             timing_studies.end_StatisticalAnalysis_plot_RandomMatrixOffDiagonals_Input = time.time()
         
@@ -1609,9 +2030,12 @@ class StatisticalAnalysis(AlphaParticles): # This class is for running a simulat
             
             self.DataFileContents_Intro = "Program: AlphaParticles2.py\nAuthor: Kyrollos Iskandar\n\nTimestamp (YYYY-MM-DD_hh-mm-ss): {}\n\n".format(timestamp)
             self.DataFileContents_Mode = "Simulation mode: {}\n\n".format(self.SimDistance_Option_Description)
-            self.DataFileContents_AlphaBeamInputs = "### Inputs about the alpha particles ###\nInitial kinetic energy = {} MeV\nInitial number of alpha particles = {}\nProbability density function used for random number generation: {}\nSeed for the random number generators = {}\n\n".format(self.InitialKineticEnergy, self.InitialParticleNumber, self.RandomDistribution_description, Seed)
+            self.DataFileContents_AlphaBeamInputs = "### Inputs about the alpha particles ###\nInitial kinetic energy = {} MeV\nInitial number of alpha particles = {}\nProbability density function used for random number generation: {}\nSeed for the random number generators = {}\nEntropy of the root SeedSequence of the random number generators = {}\n\n".format(self.InitialKineticEnergy, self.InitialParticleNumber, self.RandomDistribution_description, Seed, self.SeedSequences[(0, 0)].entropy) # Without a seed, the entropy is what the operating system gave. Using it as the seed reproduces the simulation.
             self.DataFileContents_MediumInputs = "### Inputs about the medium ###\nAtomic number = {}\nAtomic weight = {} g/mol\nMass density = {} g/cm^3\n\n".format(self.AtomicNumber, self.AtomicWeight, self.MassDensity)
             self.DataFileContents_SimulationInputs = "### Inputs about the simulation ###\nNumber of simulation instances: {}\n\n".format(SimInstances)
+
+            if self.convergence_monitor is not None: # The simulation instances were run until the results converged.
+                self.DataFileContents_SimulationInputs = self.DataFileContents_SimulationInputs[:-1] + "Target relative uncertainty (3 standard errors of the mean) of the mean range and the maximum range = {}\nAchieved relative uncertainties of the mean range and the maximum range = {}, {}\n\n".format(self.TargetRelativeUncertainty, *self.convergence_monitor.get_RelativeUncertainties())
             self.DataFileContents_Results = "### Results ###\nMean range = {} +/- {} m (Average +/- 3 * Population standard deviation){}\nMaximum range = {} +/- {} m (Average +/- 3 * Population standard deviation){}\n\n".format(MeanRange_Average, MeanRange_Uncertainty, self.MeanRange_Description, MaximumRange_Average, MaximumRange_Uncertainty, self.MaximumRange_Description)
             self.DataFileContents_AdditionalInfo = "### Information about the randomised 3x3 matrix that was used to generate the data ###\n# Diagonal elements:\nC_xx = {}\nC_yy = {}\nC_zz = {}\n\n# The values of the off-diagonal elements of the randomised 3x3 matrix are shown in the accompanying histograms.\n\n### End of the data file ###".format(self.C_xx, self.C_yy, self.C_zz)
 
@@ -1650,6 +2074,11 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
         # self.AlphaParticleMomentumMagnitudes = np.array([]) # Initialise a numpy array for keeping track of the momentum magnitude of each alpha particle per collision with an electron.
         
         self.InitialiseAlphaParticleMomentumMagnitudes = 0 # ... for making a particular IF statement execute only once even though it is in the record_AlphaParticleMomentumMagnitude method, which is in a loop.
+        # The depth profile of the kinetic energy deposit (Bragg curve). Each pooled process puts the kinetic energy that its alpha particles lose into depth bins during the simulation. NOTE: This is not a profile of the AbsorbedDose variable. See the calculate_DoseProfile() method.
+        self.RecordDoseProfile = True
+        self.DepthBinEdges_EnergyDeposit = None # Units: m. If this is an array of bin edges, the depth bins are fixed. Otherwise, the depth bins are adaptive: they start with the width DepthBinWidth_EnergyDeposit and are made twice as wide whenever the alpha particles go deeper than the last bin.
+        self.DepthBinWidth_EnergyDeposit = None # Units: m. If this is None, the mean free path of the alpha particles at the start of the simulation is used. Every pooled process must start with the same width so that their depth profiles can be merged.
+        self.NumberOfDepthBins_EnergyDeposit = 100 # The number of adaptive depth bins.
         
         self.CorrectMaterialThickness_Backwards = None # ... for error handling.
         self.CorrectMaterialThickness_Forwards = None # ... for error handling.
@@ -1659,22 +2088,26 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
         if __name__ == "__main__":
             timing_studies.start_AlphaRTGame_record_AlphaParticleMomentumMagnitude = time.time()
         
-        if self.InitialiseAlphaParticleMomentumMagnitudes != 1:
-            self.AlphaParticleMomentumMagnitudes = np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T # Initialise the AlphaParticleMomentumMagnitudes array, giving it the shape it needed for later concatenation operations.
-            self.InitialiseAlphaParticleMomentumMagnitudes = 1 # The AlphaParticleMomentumMagnitudes array has been initialised.
-        # NOTE: Before optimisation ... NOTE: The pre-optimised code below was in the __init__() method.
-        # self.AlphaParticleMomentumMagnitudes_DF = pd.DataFrame() # Initialise an empty pandas DataFrame for keeping track of the momentum magnitude of each alpha particle per collision with an electron.
+        self.energy_deposit_accumulator.record_MomentumMagnitudes(self.particle_store.ID, self.particle_store.PositionX, self.particle_store.MomentumMagnitude) # Add the momentum that the alpha particles lost since the last simulation step to the running sum.
+        # NOTE: Before the EnergyDepositAdmin.py script was made ... The momentum magnitudes of every simulation step were kept in an array with one column per simulation step.
+        # if self.InitialiseAlphaParticleMomentumMagnitudes != 1:
+        #     self.AlphaParticleMomentumMagnitudes = np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T # Initialise the AlphaParticleMomentumMagnitudes array, giving it the shape it needed for later concatenation operations.
+        #     self.InitialiseAlphaParticleMomentumMagnitudes = 1 # The AlphaParticleMomentumMagnitudes array has been initialised.
+        # # NOTE: Before optimisation ... NOTE: The pre-optimised code below was in the __init__() method.
+        # # self.AlphaParticleMomentumMagnitudes_DF = pd.DataFrame() # Initialise an empty pandas DataFrame for keeping track of the momentum magnitude of each alpha particle per collision with an electron.
         
         
-        # At this point, we have the AlphaParticlesInfoList_ID_X_Momentum array, which specifies the momentum of each alpha particle. Now we concatenate the new momentum magnitudes.
-        if np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T.shape[0] == self.AlphaParticleMomentumMagnitudes.shape[0]:
-            self.AlphaParticleMomentumMagnitudes = np.concatenate((self.AlphaParticleMomentumMagnitudes, np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T), axis = 1) # Record the momentum magnitude of each alpha particle for later being used to calculate how much kinetic energy was transferred to the electrons from the alpha particles.
+        # # At this point, we have the AlphaParticlesInfoList_ID_X_Momentum array, which specifies the momentum of each alpha particle. Now we concatenate the new momentum magnitudes.
+        # if np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T.shape[0] == self.AlphaParticleMomentumMagnitudes.shape[0]:
+        #     self.AlphaParticleMomentumMagnitudes = np.concatenate((self.AlphaParticleMomentumMagnitudes, np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T), axis = 1) # Record the momentum magnitude of each alpha particle for later being used to calculate how much kinetic energy was transferred to the electrons from the alpha particles.
+        
+        # else:
+        #     self.AlphaParticleMomentumMagnitudesOfPresentSimStep = np.concatenate((np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T, np.zeros((self.AlphaParticleMomentumMagnitudes.shape[0] - np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T.shape[0], 1))), axis = 0) # Unlike pandas, numpy does not concatenate arrays that have an unequal number of rows. So we must make the array that is to be added have the same number of rows as the array to which it is to be added. Using 0s for this is suitable for the data analysis that is to be done after the simulation.
+        #     self.AlphaParticleMomentumMagnitudes = np.concatenate((self.AlphaParticleMomentumMagnitudes, self.AlphaParticleMomentumMagnitudesOfPresentSimStep), axis = 1)
+        # # NOTE: Before optimisation ...
+        # # self.AlphaParticleMomentumMagnitudes_DF = pd.concat([self.AlphaParticleMomentumMagnitudes_DF, self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:, 5]], axis = 1) # Record the momentum magnitude of each alpha particle for later being used to calculate how much kinetic energy was transferred to the electrons from the alpha particles. MomentumMagnitudeList_DF is calculated in the update_AlphaParticlePosition() method.
+
         
-        else:
-            self.AlphaParticleMomentumMagnitudesOfPresentSimStep = np.concatenate((np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T, np.zeros((self.AlphaParticleMomentumMagnitudes.shape[0] - np.array([self.AlphaParticlesInfoList_ID_X_Momentum[:, 5]]).T.shape[0], 1))), axis = 0) # Unlike pandas, numpy does not concatenate arrays that have an unequal number of rows. So we must make the array that is to be added have the same number of rows as the array to which it is to be added. Using 0s for this is suitable for the data analysis that is to be done after the simulation.
-            self.AlphaParticleMomentumMagnitudes = np.concatenate((self.AlphaParticleMomentumMagnitudes, self.AlphaParticleMomentumMagnitudesOfPresentSimStep), axis = 1)
-        # NOTE: Before optimisation ...
-        # self.AlphaParticleMomentumMagnitudes_DF = pd.concat([self.AlphaParticleMomentumMagnitudes_DF, self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[:, 5]], axis = 1) # Record the momentum magnitude of each alpha particle for later being used to calculate how much kinetic energy was transferred to the electrons from the alpha particles. MomentumMagnitudeList_DF is calculated in the update_AlphaParticlePosition() method.
 
         
         if __name__ == "__main__":    
@@ -1685,6 +2118,35 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
             # The SciPy community (2020). numpy.concatenate, https://numpy.org/doc/stable/reference/generated/numpy.concatenate.html.
     
     
+    def get_CacheInputs(self): # The depth bins of the dose profile are also part of the results that are kept in the result cache.
+        CacheInputs = super().get_CacheInputs()
+        CacheInputs.update({"Record dose profile" : self.RecordDoseProfile, "Depth bin edges" : self.DepthBinEdges_EnergyDeposit, "Depth bin width" : self.DepthBinWidth_EnergyDeposit, "Number of depth bins" : self.NumberOfDepthBins_EnergyDeposit})
+
+        return CacheInputs
+
+
+    def make_EnergyDepositAccumulator(self): # Make the accumulator for the momentum and kinetic energy that the alpha particles of a pooled process lose.
+        if not self.RecordDoseProfile:
+            self.energy_deposit_accumulator = EnergyDepositAdmin.EnergyDepositAccumulator(self.particle_store.ID, self.AlphaMass_kg)
+
+        elif self.DepthBinEdges_EnergyDeposit is not None: # Fixed depth bins.
+            self.energy_deposit_accumulator = EnergyDepositAdmin.EnergyDepositAccumulator(self.particle_store.ID, self.AlphaMass_kg, DepthBinEdges = self.DepthBinEdges_EnergyDeposit)
+
+        else: # Adaptive depth bins. The mean free path at the start of the simulation is the same for all of the alpha particles because they all start with the same momentum. It was calculated in the initialise_Simulation() method, before the pooled processes were made.
+            if self.DepthBinWidth_EnergyDeposit is None:
+                self.DepthBinWidth_EnergyDeposit = self.MeanFreePathInMediumList.min()
+
+            self.energy_deposit_accumulator = EnergyDepositAdmin.EnergyDepositAccumulator(self.particle_store.ID, self.AlphaMass_kg, DepthBinWidth = self.DepthBinWidth_EnergyDeposit, NumberOfDepthBins = self.NumberOfDepthBins_EnergyDeposit)
+
+
+    def release_BeamArrays(self): # Delete the arrays of the whole beam once its alpha particles have been split into chunks. This object is pickled with every chunk that is sent to the pooled processes, so it must not keep anything whose size grows with the number of alpha particles. Each pooled process gets the particle store of its own chunk instead.
+        if self.RecordDoseProfile and (self.DepthBinEdges_EnergyDeposit is None) and (self.DepthBinWidth_EnergyDeposit is None): # The make_EnergyDepositAccumulator() method needs the mean free paths of the whole beam for the width of the adaptive depth bins, so it is worked out now.
+            self.DepthBinWidth_EnergyDeposit = self.MeanFreePathInMediumList.min()
+
+        self.particle_store, self.trajectory_store, self.PositionXArray = None, None, None
+        self.AlphaParticleIDsList, self.MomentumVectorList, self.MomentumMagnitudeList, self.CrossSectionList, self.MeanFreePathInMediumList = None, None, None, None, None
+
+
     def calculate_MaximumRange(self): # At the end of the simulation, we have a large DataFrame that has information about the x-position of each alpha particle in each simulation step. We want to make a histogram of the number of particles in the beam as a function of distance out of this DataFrame.
         if __name__ == "__main__":
             timing_studies.start_AlphaRTGame_calculate_MaximumRange = time.time()
@@ -1692,7 +2154,11 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
         print("Analysing the data ...")
 
         ## Calculate the maximum range of the alpha particles. NOTE: The x-positions are in the same units as the mean free path, which has units of m.
-        self.MaximumRange = self.PositionXArray.max().max() # The maximum range is the largest number in the DataFrame. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
+        self.range_estimator = RangeEstimator.RangeEstimator(self.PositionXArray.max(axis = 1), self.InitialPositionX)
+        self.MaximumRange = self.range_estimator.get_MaximumRange() # The maximum range is the largest number in the array. It is the furthest distance an alpha particle in the beam has travelled.
+        self.MeanRange = self.range_estimator.get_DepthForTransmittedNumber(self.InitialParticleNumber // 2) # The mean range is not needed for the game, but it is cheap to calculate now that the furthest x-positions are sorted.
+        # NOTE: Before the RangeEstimator.py script was made ...
+        # self.MaximumRange = self.PositionXArray.max().max() # The maximum range is the largest number in the DataFrame. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
         # NOTE: Before optimisation ...
         # self.PositionXList_DF = ((self.PositionXList_DF.T).reset_index(drop = True)).T # First, we make sure its columns are labelled by the simulation steps rather than all having the same label due to having been concatenated together. The reset_index() method works row-wise, so we transpose the DataFrame first. Then we reset the row labels and transpose the DataFrame back to its original shape. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method. However, we use parentheses to make reading the code easier.
         # self.MaximumRange = self.PositionXList_DF.max().max() # The maximum range is the largest number in the DataFrame. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
@@ -1708,8 +2174,9 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
             # Krane, K S (2014). Introductory Nuclear Physics, Reprint ed. Durga Printo Graphics, Delhi: John Wiley & Sons, Inc.
 
     
-    def calculate_MomentumTransferArraySum1(self, step): # This method is for the multiprocessing section of code in the calculate_DoseToMedium() method below.
-        return (np.array([self.AlphaParticleMomentumMagnitudes[:, step]]).T - np.array([self.AlphaParticleMomentumMagnitudes[:, step + 1]]).T).sum()
+    # NOTE: Before the EnergyDepositAdmin.py script was made ... This method was used by the pool of processes in the calculate_DoseToMedium() method.
+    # def calculate_MomentumTransferArraySum1(self, step): # This method is for the multiprocessing section of code in the calculate_DoseToMedium() method below.
+    #     return (np.array([self.AlphaParticleMomentumMagnitudes[:, step]]).T - np.array([self.AlphaParticleMomentumMagnitudes[:, step + 1]]).T).sum()
         
     
     def calculate_DoseToMedium(self, BeamHeight, BeamWidth): # In the game, the kinetic energy that the alpha particles transfer to the electrons in the medium must be calculated. However, this kinetic energy is equal to the total kinetic energy that the alpha particles lose due to conservation of energy. We are assuming that all of the energy that the alpha particles lose is deposited into the medium.
@@ -1733,13 +2200,16 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
             timing_studies.start_AlphaRTGame_calculate_DoseToMedium_MomentumTransferArray = time.time()
         # Now we have a DataFrame ready for analysis. We want to extract the total kinetic energy transferred to the electrons in the medium. This value is a scalar.
         ################################### Do the MomentumTransfer_Array calculation using multiprocessing ###################################
-        if __name__ == "__main__":
-            pool_MomentumTransferArray = mp.Pool(processes = int(MaxCPUCoresToUse)) # Make sure that MaxCPUCoresToUse is an integer.
+        self.MomentumTransferred_Total = EnergyDepositAdmin.get_MomentumTransferred_Total(self.energy_deposit_accumulators) # The momentum lost was added up during the simulation, so no pool of processes is needed here.
+        # NOTE: Before the EnergyDepositAdmin.py script was made ...
+        # if __name__ == "__main__":
+        #     pool_MomentumTransferArray = mp.Pool(processes = int(MaxCPUCoresToUse)) # Make sure that MaxCPUCoresToUse is an integer.
 
-            self.MomentumTransfer_Array = np.array(pool_MomentumTransferArray.map(self.calculate_MomentumTransferArraySum1, list(range(0, self.AlphaParticleMomentumMagnitudes.shape[1] - 1))))
+        #     self.MomentumTransfer_Array = np.array(pool_MomentumTransferArray.map(self.calculate_MomentumTransferArraySum1, list(range(0, self.AlphaParticleMomentumMagnitudes.shape[1] - 1))))
 
-            pool_MomentumTransferArray.close()
-            pool_MomentumTransferArray.join()
+        #     pool_MomentumTransferArray.close()
+        #     pool_MomentumTransferArray.join()
+        
         
         # REFERENCES:
             # Python Software Foundation (2020). multiprocessing — Process-based parallelism, https://docs.python.org/3/library/multiprocessing.html.
@@ -1762,7 +2232,8 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
             timing_studies.start_AlphaRTGame_calculate_DoseToMedium_AbsoredDose = time.time()
         # The kinetic energy transferred to an electron from an alpha particle is given by the equation in the next line below. The total kinetic energy transferred to the electrons in the medium is just the sum of the kinetic energies transferred to each electron. Therefore, it is valid to calculate the momentum transfers first and leave the conversion of momentum into kinetic energy until later.
         # Kinetic energy transferred = (Initial momentum magnitude of the alpha particle - Final momentum magnitude of the alpha particle) / (2 * Electron mass)
-        self.MomentumTransferred_Total = self.MomentumTransfer_Array.sum()
+        # NOTE: Before the EnergyDepositAdmin.py script was made ... The MomentumTransferred_Total variable is now calculated above.
+        # self.MomentumTransferred_Total = self.MomentumTransfer_Array.sum()
         # NOTE: Before multiprocessing
         # self.MomentumTransferred_Total = self.MomentumTransfer_Array.sum().sum() # Units: kg m/s.
         # NOTE: Before optimisation ...
@@ -1775,6 +2246,9 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
         self.MassIrradiated = self.VolumeIrradiated * self.MassDensity # Units: g.
         self.AbsorbedDose = self.KineticEnergyTransferred_Total / (self.MassIrradiated * 1e-3) # Units: J/kg = Gy.
 
+        if self.RecordDoseProfile:
+            self.calculate_DoseProfile(BeamHeight, BeamWidth)
+
         if __name__ == "__main__":
             timing_studies.end_AlphaRTGame_calculate_DoseToMedium_AbsoredDose = time.time()
             
@@ -1787,29 +2261,85 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
             # The SciPy community (2020). numpy.concatenate, https://numpy.org/doc/stable/reference/generated/numpy.concatenate.html.
 
     
+    def calculate_DoseProfile(self, BeamHeight, BeamWidth): # Calculate the kinetic energy deposited per unit mass in each depth bin from the kinetic energy that the alpha particles lost in it, i.e., (p_before^2 - p_after^2) / (2 * Alpha mass) for each collision. NOTE: This is not a profile of the AbsorbedDose variable. The AbsorbedDose variable is calculated from the square of the total momentum transferred, which cannot be split into depth bins, so the profile does not add up to it. The profile adds up to KineticEnergyLost_Total, which is checked below.
+        self.KineticEnergyTransferred_Profile = EnergyDepositAdmin.merge_DepthHistograms([energy_deposit_accumulator.KineticEnergyTransferred_Profile for energy_deposit_accumulator in self.energy_deposit_accumulators]) # Merge the depth profiles of all of the pooled processes.
+        self.KineticEnergyLost_Total = EnergyDepositAdmin.get_KineticEnergyLost_Total(self.energy_deposit_accumulators) # Units: J. The kinetic energy lost by the alpha particles, added up without depth bins.
+
+        self.DepthBinEdges_Dose = self.KineticEnergyTransferred_Profile.get_DepthBinEdges() # Units: m.
+        self.MassInDepthBins = BeamHeight * BeamWidth * (np.diff(self.DepthBinEdges_Dose) * 1e2) * self.MassDensity # Units: g. Each depth bin is a slab of medium with the cross-sectional area of the beam.
+        self.KineticEnergyDeposit_Profile = self.KineticEnergyTransferred_Profile.Counts / (self.MassInDepthBins * 1e-3) # Units: J/kg = Gy. This is the kinetic-energy-deposit-vs-depth array.
+        # NOTE: Before the profile was checked against KineticEnergyLost_Total, it was called the absorbed dose profile even though it does not add up to the AbsorbedDose variable.
+        # self.AbsorbedDose_Profile = self.KineticEnergyTransferred_Profile.Counts / (self.MassInDepthBins * 1e-3) # Units: J/kg = Gy. This is the dose-vs-depth array.
+
+        # The kinetic energy deposit in each depth bin multiplied by the mass of the depth bin must add up to the kinetic energy lost. Otherwise, some kinetic energy was lost or counted twice when it was put into depth bins or when the depth bins were merged.
+        self.KineticEnergyLost_FromProfile = (self.KineticEnergyDeposit_Profile * (self.MassInDepthBins * 1e-3)).sum() # Units: J.
+        if not np.isclose(self.KineticEnergyLost_FromProfile, self.KineticEnergyLost_Total, rtol = 1e-9, atol = 0.0):
+            print("Warning: The kinetic energy deposit profile adds up to {} J, but the alpha particles lost {} J of kinetic energy.".format(self.KineticEnergyLost_FromProfile, self.KineticEnergyLost_Total))
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.diff, https://numpy.org/doc/stable/reference/generated/numpy.diff.html.
+            # Knoll, G. F. (2010). Radiation Detection and Measurement (4th ed.). 111 River Street, Hoboken, NJ 07030-5774: John Wiley & Sons, Inc.
+
+
+    def plot_DoseProfile(self): # Plot the kinetic energy deposited per unit mass as a function of depth, i.e., the Bragg curve.
+        if __name__ == "__main__":
+            plt.figure(figsize = (17, 7))
+            plt.hist(self.DepthBinEdges_Dose[:-1], bins = self.DepthBinEdges_Dose, weights = self.KineticEnergyDeposit_Profile, histtype = "step") # Each depth bin is drawn as one value at the left edge of the bin, weighted by the kinetic energy deposit in the bin.
+            plt.xlabel("Depth /m")
+            plt.ylabel("Kinetic energy deposited per unit mass /Gy")
+            plt.title("Kinetic energy lost by the alpha particles (adds up to {:.6g} J, not to the absorbed dose)".format(self.KineticEnergyLost_Total))
+            plt.savefig(DirectoryToSaveTo + "KineticEnergyDepositProfile_" + timestamp + ".png") # Save the plot into the same folder as the other outputted files.
+            # NOTE: Before the profile was relabelled as the kinetic energy deposit ...
+            # plt.ylabel("Absorbed dose /Gy")
+            # plt.savefig(DirectoryToSaveTo + "DoseProfile_" + timestamp + ".png")
+
+            print("Please check {} for a plot of the kinetic energy deposited per unit mass as a function of depth.".format(DirectoryToSaveTo))
+
+        # REFERENCES:
+            # Hunter, J., Dale, D., Firing, E., Droettboom, M., & The Matplotlib development team. (14 August 2020). matplotlib.pyplot.hist. Retrieved from https://matplotlib.org/3.3.1/api/_as_gen/matplotlib.pyplot.hist.html
+            # Hunter, J., Dale, D., Firing, E., Droettboom, M., & The Matplotlib development team. matplotlib.pyplot.savefig. Retrieved from https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
+
+
     def show_Progress(self, process): # This method prints a slightly different message compared to the method with the same name in the AlphaParticles class.
+        self.StepsSinceProgress = self.StepsSinceProgress + 1
+        if (self.StepsSinceProgress < self.ProgressStepInterval) or (self.ParticleNumber == 0): # Most simulation steps end here, so working out the progress costs almost nothing. The simulation ends when there are no alpha particles left in the beam.
+            return
+
+        self.StepsSinceProgress = 0
+
         if __name__ == "__main__":
             timing_studies.start_AlphaRTGame_ShowProgress = time.time()
         
         try:
             ### Calculate the progress.
             if self.ParticleNumber != 0: # Keep showing the maximum alpha particle kinetic energy in the beam until there are no more particles in the beam. The maximum kinetic energy decreases throughout the entire simulation. However, the number of alpha particles in the beam stays constant until near the end of the simulation where it rapidly decreases to 0. Thus, letting the user see the maximum alpha particle kinetic energy rather than how many particles remain in the beam gives them a better measure of the progress of the simulation.
-                self.MaximumAlphaMomentum_now = max(((self.AlphaParticlesInfoList_ID_X_Momentum[:, 2:5] ** 2).sum(axis = 1) ** (1/2))) # Given the momentum vectors of all of the alpha particles in the beam, I want to pick out the one that has the highest magnitude. *In the same simulation step*, use the pandas DataFrame of the list of momentum vectors to calculate the magnitudes of the vectors all at once. Then pick out the maximum magnitude.
-                self.MaximumAlphaEnergy_now = ((self.MaximumAlphaMomentum_now ** 2 / (2 * self.AlphaMass_kg)) / self.J_eV_ConversionFactor) * 1e-6 # This is the equation E_alpha = p_alpha ** 2 / (2 * AlphaMass), where E_alpha and p_alpha are the kinetic energy and momentum magnitude of the alpha particle, respectively. I want the kinetic energy in MeV.
+                self.MaximumAlphaMomentum_now = self.particle_store.MomentumMagnitude.max() # The update_ParticleNum() method has just recalculated the momentum magnitudes of the alpha particles in the beam, so they are not calculated again here.
+                self.MaximumAlphaEnergy_now = self.KineticEnergyFactor_MeV * self.MaximumAlphaMomentum_now ** 2 # This is the equation E_alpha = p_alpha ** 2 / (2 * AlphaMass), in units of MeV.
+                # NOTE: Before the MediumAdmin.py script was made ...
+                # self.MaximumAlphaMomentum_now = max(((self.particle_store.Momentum ** 2).sum(axis = 1) ** (1/2))) # Given the momentum vectors of all of the alpha particles in the beam, I want to pick out the one that has the highest magnitude. *In the same simulation step*, use the pandas DataFrame of the list of momentum vectors to calculate the magnitudes of the vectors all at once. Then pick out the maximum magnitude.
+                # self.MaximumAlphaEnergy_now = ((self.MaximumAlphaMomentum_now ** 2 / (2 * self.AlphaMass_kg)) / self.J_eV_ConversionFactor) * 1e-6 # This is the equation E_alpha = p_alpha ** 2 / (2 * AlphaMass), where E_alpha and p_alpha are the kinetic energy and momentum magnitude of the alpha particle, respectively. I want the kinetic energy in MeV.
 
                 self.Progress_Percentage = (1.0 - self.MaximumAlphaEnergy_now / (self.InitialKineticEnergy - self.MinimumAlphaEnergy_eV * 1e-6)) ** (10) * 100 # The maximum alpha particle kinetic energy does not decrease linearly, but approximately proportionally to the specified power, which was chosen through trial and error. The "* 100" is for converting the fraction to a percentage.
 
             
             ### Show the progress.
-            self.EndDelayTimer = time.time()
+            if self.progress_counter is not None: # A pooled process only writes its progress into shared memory. The main process prints the progress of all of the pooled processes.
+                self.progress_counter.set_Progress(self.ProgressTask, self.Progress_Percentage)
 
-            if (self.StartDelayTimer is None) or (self.DelayTimer > self.DelayForShowingProgress):
-                self.StartDelayTimer = time.time() # Give this variable a value.
+            elif time.monotonic() >= self.NextProgressReport: # This time period is how much to wait before showing another message of the progress of each simulation instance.
+                print("\tThe progress of Chunk {}".format(process + 1) + " is {0:0.2f}% ...".format(self.Progress_Percentage)) # It seems that all or none of the {}s must have a specification of the formatting to avoid the "ValueError: cannot switch from automatic field numbering to manual field specification" error. (I tried it myself, so there is no reference to cite.) Alternatively, I can separate the strings and use string concatenation.
+                self.NextProgressReport = time.monotonic() + self.DelayForShowingProgress
 
-            self.DelayTimer = self.EndDelayTimer - self.StartDelayTimer
-            
-            if self.DelayTimer > self.DelayForShowingProgress: # This time period is how much to wait before showing another message of the progress of each simulation instance.
-                print("\tThe progress of Pooled Process {}".format(process + 1) + " is {0:0.2f}% ...".format(self.Progress_Percentage)) # It seems that all or none of the {}s must have a specification of the formatting to avoid the "ValueError: cannot switch from automatic field numbering to manual field specification" error. (I tried it myself, so there is no reference to cite.) Alternatively, I can separate the strings and use string concatenation.
+            # NOTE: Before the ProgressAdmin.py script was made ...
+            # self.EndDelayTimer = time.time()
+
+            # if (self.StartDelayTimer is None) or (self.DelayTimer > self.DelayForShowingProgress):
+            #     self.StartDelayTimer = time.time() # Give this variable a value.
+
+            # self.DelayTimer = self.EndDelayTimer - self.StartDelayTimer
+
+            # if self.DelayTimer > self.DelayForShowingProgress: # This time period is how much to wait before showing another message of the progress of each simulation instance.
+            #     print("\tThe progress of Chunk {}".format(process + 1) + " is {0:0.2f}% ...".format(self.Progress_Percentage)) # It seems that all or none of the {}s must have a specification of the formatting to avoid the "ValueError: cannot switch from automatic field numbering to manual field specification" error. (I tried it myself, so there is no reference to cite.) Alternatively, I can separate the strings and use string concatenation.
               
         except AttributeError: # AttributeError is the error I saw in the command terminal when I specified an initial alpha particle kinetic energy less than the minimum energy required for a particle to stay in the beam.
             print("Error: You must specify an initial alpha particle kinetic energy greater than {} eV. The program will now exit.".format(self.MinimumAlphaEnergy_eV))
@@ -1824,12 +2354,20 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
             timing_studies.AlphaRTGame_show_Progress_List.append(timing_studies.end_AlphaRTGame_ShowProgress - timing_studies.start_AlphaRTGame_ShowProgress) # This is the execution time for one execution of the update_ParticleNum() method.
         
     
-    def process_SimulationForAlphaParticles(self, process): # The FOR in the update_AlphaParticleMomentum() of the AlphaParticles class over the number of alpha particles is made smaller by the parallelisation of this method, meaning that more particles may be simulated in a given time.
-        print("Pooled process", process + 1, "has started with __name__ ==", __name__, "...")
+    def process_SimulationForAlphaParticles(self, ChunkTask): # The FOR in the update_AlphaParticleMomentum() of the AlphaParticles class over the number of alpha particles is made smaller by the parallelisation of this method, meaning that more particles may be simulated in a given time. ChunkTask is the number of the chunk, the particle store of its alpha particles and its SeedSequence, so only the alpha particles of this chunk are pickled with it.
+        process, particle_store, seed_sequence = ChunkTask
+        print("Chunk", process + 1, "of the alpha particles has started with __name__ ==", __name__, "...")
         
         # The two variables below need to be redefined for each pooled process because the AlphaParticlesInfoList_ID_X_Momentum has less rows in it. Each row represents an alpha particle.
-        self.AlphaParticlesInfoList_ID_X_Momentum = self.AlphaParticlesInfoList_ID_X_Momentum_ForProcesses[process]
-        self.ParticleNumber = self.AlphaParticlesInfoList_ID_X_Momentum.shape[0] # Redefining this variable fixes an IndexError in the FOR loop of the update_AlphaParticleMomentum() method.
+        self.particle_store = particle_store
+        # NOTE: Before the release_BeamArrays() method was made, the particle stores of every chunk were pickled with this object and sent with every chunk.
+        # self.particle_store = self.particle_store_dict[process]
+        self.ParticleNumber = self.particle_store.Count # Redefining this variable fixes an IndexError in the FOR loop of the update_AlphaParticleMomentum() method.
+        self.make_TrajectoryStore(self.particle_store.ID) # Each pooled process only records the x-positions of its own alpha particles.
+        self.make_EnergyDepositAccumulator() # Each pooled process adds up the momentum lost by its own alpha particles.
+        self.ProgressTask = process # The chunk writes its progress into its slot of the progress counter.
+        self.reset_Progress()
+        self.make_RandomNumberGenerator(seed_sequence) # Each chunk gets its own random number generator. The chunks do not depend on the number of pooled processes, so neither do the random numbers. Otherwise, every pooled process would inherit the same random number generator from the parent process and simulate its alpha particles with the same random numbers.
         
         
         ### Process the data. This WHILE loop is the simulation.
@@ -1843,7 +2381,19 @@ class AlphaRTGame(AlphaParticles): # This class is for making a game related to
             
             self.show_Progress(process) # Show the user the progress of each pooled process so that they may know whether the program is running or frozen. The argument of 0 is present because the show_Progress() method is inherited from the AlphaParticles class, which is used to run multiple instances of a simulation when the program is run in beam analysis mode. However, in the radiotherapy game mode, only one instance of a simulation is run. When the WHILE loop in main() is running, the would not see any update about whether the program is running or frozen if the show_Progress() method did not exist.
         
-        return self.PositionXArray, self.AlphaParticleMomentumMagnitudes # Collect PositionXArray to calculate the maximnum range, and AlphaParticleMomentumMagnitudes to calculate absorbed dose. 
+        # Write the furthest x-position of each alpha particle of this pooled process into its row of the shared memory block that the main process made. The ID of an alpha particle is its row.
+        self.MaximumPositionsX_SharedArray.Array[self.trajectory_store.AlphaParticleIDs] = self.trajectory_store.get_MaximumPositionsX()
+        self.MaximumPositionsX_SharedArray.close()
+
+        self.energy_deposit_accumulator.finish_Recording()
+
+        return self.energy_deposit_accumulator # The momentum lost by the alpha particles is used to calculate absorbed dose. The accumulator is small, so it is cheap to pickle.
+        # NOTE: Before the EnergyDepositAdmin.py script was made ... The number of simulation steps of this pooled process was not known before the simulation, so this pooled process made its own shared memory block for the momentum magnitudes.
+        # self.MomentumMagnitudes_SharedArray = SharedMemoryAdmin.make_SharedArrayFromArray(self.AlphaParticleMomentumMagnitudes)
+        # self.MomentumMagnitudes_SharedArray.close()
+        # return self.MomentumMagnitudes_SharedArray # AlphaParticleMomentumMagnitudes is used to calculate absorbed dose.
+        # NOTE: Before the SharedMemoryAdmin.py script was made ...
+        # return self.PositionXArray, self.AlphaParticleMomentumMagnitudes # Collect PositionXArray to calculate the maximnum range, and AlphaParticleMomentumMagnitudes to calculate absorbed dose. 
         
         # REFERENCES:
             # Fayek, H. (2020). Week 6 Object-Oriented Programming. 124 La Trobe St, Melbourne VIC 3000: Haytham Fayek.
@@ -1910,16 +2460,26 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
         
         self.CorrectMaterialThickness = None # Initialise this variable for use in an IF statement.
 
+        # Choose how the alpha particles go through the boundaries between the media in the update_AlphaParticlePosition() method.
+        #   > "resample": a free path that reaches a boundary is cut off at the boundary, and the rest of it is continued with the mean free path of the next medium, as many times as needed. So a medium that is much thinner than a free path is neither skipped nor put in the wrong place. This is the default.
+        #   > "step": the whole free path uses the mean free path of the medium that the alpha particle was in at the start of the simulation step, and the medium is only updated afterwards. This is how the attenuation quiz worked before, and it is kept for comparing the results.
+        self.LayerTransport = "resample"
+
     
-    def ask_QuizQuestion(self):
-        self.TransmissionFraction = round(random.random(), 3) # It is easier for the user to deal with a transmission fraction that has less decimal places than one than has more. Also, there is a very large range over which all particles are transmitted, meaning that there are many correct thicknesses for 100% transmission. Therefore, we omit 1.0 from being randomly chosen by using the random.random() random number generator. Rounding error is *not* a concern here.
+    def ask_QuizQuestion(self, MaterialThicknesses = None, random_number_generator = None): # MaterialThicknesses are the predicted thicknesses, in m, if they are already known, e.g., from a job of a job spec file. Then the user is not asked for them. random_number_generator is the same as for the choose_MediaForAttenuationQuiz() method of the ProgramAdmin class.
+        self.TransmissionFraction = round(random.random() if random_number_generator is None else random_number_generator.randomNum_0to1(), 3) # It is easier for the user to deal with a transmission fraction that has less decimal places than one than has more. Also, there is a very large range over which all particles are transmitted, meaning that there are many correct thicknesses for 100% transmission. Therefore, we omit 1.0 from being randomly chosen by using the random.random() random number generator. Rounding error is *not* a concern here.
         
         print("What thickness(es) of the chosen material(s), *together*, in m, will transmit {}% of a beam of {} alpha particles of energy {:.3e} MeV? ".format(self.TransmissionFraction * 1e2, self.InitialParticleNumber, self.InitialKineticEnergy))
         print("Note that the thickness of the last material you specify will be extended if it is too thin.") # The last material is too thin when there are still alpha particles to simulate. The particles must go through a medium, whichever one it is.
         print("Also note that you may add more materials to the 'AttenuationQuiz_MaterialLibrary.csv' file if you want the quiz to possibly consider other materials. However, you must adhere to the format of that file.")
         print()
+        if MaterialThicknesses is not None: # Treat the thicknesses as the lines of the input file, so that they are checked in the same way.
+            self.WhetherOrNotReadInputsFromFile_AttenuationQuiz = "y"
+            self.InputFileLines_AttenuationQuiz = ["Medium {} thickness = {} m\n".format(medium + 1, MaterialThickness) for medium, MaterialThickness in enumerate(MaterialThicknesses)]
+
         ### Ask whether or not the user would like to read material thicknesses from a file. We ask the user this question after they have seen which materials have been randomly selected. This is so that they may update the file before submitting it to the program.
-        self.WhetherOrNotReadInputsFromFile_AttenuationQuiz = input("Would you like to read material thicknesses from the input file named 'InputsForAttenuationQuiz.txt'? (y/n) ")
+        else:
+            self.WhetherOrNotReadInputsFromFile_AttenuationQuiz = input("Would you like to read material thicknesses from the input file named 'InputsForAttenuationQuiz.txt'? (y/n) ")
         
         try: # Make sure the user gives a valid answer before proceeding with the quiz.
             assert self.WhetherOrNotReadInputsFromFile_AttenuationQuiz in set(["y", "Y", "n", "N"])
@@ -1928,7 +2488,10 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
             print("Error: You did not provide a valid answer. The program will now exit.")
             exit()
         
-        if self.WhetherOrNotReadInputsFromFile_AttenuationQuiz in set(["y", "Y"]): # Read the material thicknesses from the input file.
+        if MaterialThicknesses is not None:
+            print("\n### The program has read the following thicknesses from the job ... ###")
+
+        elif self.WhetherOrNotReadInputsFromFile_AttenuationQuiz in set(["y", "Y"]): # Read the material thicknesses from the input file.
             print("\n### You have chosen to let the program read the material thicknesses from a file. ###")
             print("The program will read from a file named 'InputsForAttenuationQuiz.txt' in the same directory as the script file of this program. Please make sure it is formatted as shown by example below ...")
             print("Ignore this line:", "#" * 10, "Input file for the attenuation quiz", "#" * 10)
@@ -2029,6 +2592,10 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
         # NOTE: Before multiprocessing ...
         # if __name__ == "__main__": # All of these time.time() calls must be protected with this IF statement so that the slave processes do not raise the "NameError: name 'timing_studies' is not defined" error.
         #     timing_studies.start_InitialiseSimulation = time.time()
+
+        self.make_LayeredMedium() # The thicknesses of the media are only known after the ask_QuizQuestion() method.
+        self.ElectronSpatialDensity = self.LayerElectronSpatialDensities[0] # The alpha particles start in the first medium. The make_Medium() method only knows the dummy medium that the AttenuationQuiz object was made with.
+        self.make_RandomNumberGenerator(RandomNumberAdmin.get_SeedSequences(self.Seed, instance + 1, 1)[(instance, 0)]) # Each simulation instance gets its own random number generator.
         
         # All of the alpha particles in the beam are going to be kept track of using a pandas DataFrame. We want to keep track of each particle's momentum vector and x-position.
         self.AlphaParticleIDsList = np.array(list([range(0, self.InitialParticleNumber)])).T # Initialise a list for making a list of identification (ID) numbers for the alpha particles.
@@ -2047,7 +2614,7 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
         ## Now we calculate the cross-sections, which is a function of the alpha particle's energy. Consequently, each alpha particle will have its own mean free path.
         # We are going to need to know the momentum magnitude of each alpha particle. Also, the magnitude is used in other parts of the program. So, we might as well put it into the information DataFrame so that it does not have to be recalculated unnecessarily.
         self.MomentumMagnitudeList = np.array([((self.MomentumVectorList ** 2).sum(axis = 1)) ** (1/2)]).T # Momentum magnitudes. We need the arrays to be in columns for the upcoming concatenation into the info list.
-        self.CrossSectionList = (2 * math.pi * self.AlphaMass_kg * (self.ClassicalElectronRadius_m) ** 2) / self.MomentumMagnitudeList ** 2 # Cross-section for each alpha particle. The pandas Series supports an element-wise operation.
+        self.CrossSectionList = self.CrossSectionConstant / self.MomentumMagnitudeList ** 2 # Cross-section for each alpha particle. The pandas Series supports an element-wise operation.
         self.MeanFreePathInMediumList = (self.ElectronSpatialDensity * self.CrossSectionList) ** -1 # Mean free path in the medium for each alpha particle.
         # NOTE: Before optimisation ...
         # self.MomentumMagnitudeList_DF = ((self.MomentumVectorList_DF ** 2).sum(axis = 1)) ** (1/2) # Momentum magnitudes.
@@ -2061,11 +2628,26 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
         self.WhichMedium = np.array([[0]] * self.InitialParticleNumber)
         self.NextThicknessCheckPoint = np.array([[self.ChosenMaterials_DF.iloc[0, 4]]] * self.InitialParticleNumber)
 
-        # Now we put all the above information into one pandas DataFrame.
-        self.AlphaParticlesInfoList_ID_X_Momentum = np.concatenate((self.AlphaParticleIDsList, self.PositionXArray, self.MomentumVectorList, self.MomentumMagnitudeList, self.CrossSectionList, self.MeanFreePathInMediumList, self.AtomicNumberList, self.AtomicWeightList, self.MassDensityList, self.WhichMedium, self.NextThicknessCheckPoint), axis = 1) # This DataFrame will be useful for keeping each alpha particle's momentum vector attached to its x-position, especially when particles get removed from the beam when they have sufficiently low momentum.
+        # Now we put all the above information into the particle store. Each alpha particle also has the fields of its medium.
+        self.particle_store = ParticleAdmin.ParticleStore(self.ParticleNumber, ParticleAdmin.BeamFields + ParticleAdmin.MediumFields, self.ParticleFloatType)
+        self.particle_store.ID = self.AlphaParticleIDsList[:, 0]
+        self.particle_store.PositionX = self.PositionXArray[:, 0]
+        self.particle_store.Momentum = self.MomentumVectorList
+        self.particle_store.MomentumMagnitude = self.MomentumMagnitudeList[:, 0]
+        self.particle_store.CrossSection = self.CrossSectionList[:, 0]
+        self.particle_store.MeanFreePath = self.MeanFreePathInMediumList[:, 0]
+        self.particle_store.AtomicNumber = self.AtomicNumberList[:, 0]
+        self.particle_store.AtomicWeight = self.AtomicWeightList[:, 0]
+        self.particle_store.MassDensity = self.MassDensityList[:, 0]
+        self.particle_store.WhichMedium = self.WhichMedium[:, 0]
+        self.particle_store.NextThicknessCheckPoint = self.NextThicknessCheckPoint[:, 0]
+        # NOTE: Before the ParticleAdmin.py script was made ...
+        # self.AlphaParticlesInfoList_ID_X_Momentum = np.concatenate((self.AlphaParticleIDsList, self.PositionXArray, self.MomentumVectorList, self.MomentumMagnitudeList, self.CrossSectionList, self.MeanFreePathInMediumList, self.AtomicNumberList, self.AtomicWeightList, self.MassDensityList, self.WhichMedium, self.NextThicknessCheckPoint), axis = 1) # This DataFrame will be useful for keeping each alpha particle's momentum vector attached to its x-position, especially when particles get removed from the beam when they have sufficiently low momentum.
         # NOTE: Before optimisation ...
         # self.AlphaParticlesInfoList_ID_X_Momentum_DF = pd.concat([pd.DataFrame(self.AlphaParticleIDsList), self.PositionXList_DF, self.MomentumVectorList_DF, self.MomentumMagnitudeList_DF, self.CrossSectionList_DF, self.MeanFreePathInMediumList_DF], axis = 1).T.reset_index(drop = True).T # This DataFrame will be useful for keeping each alpha particle's momentum vector attached to its x-position, especially when particles get removed from the beam when they have sufficiently low momentum.
 
+        self.make_TrajectoryStore(self.particle_store.ID) # Prepare the store for the x-positions of the alpha particles.
+
         
         # *Initialise* a list for recording the number of alpha particles in the beam at each simulation step. Energy and range straggling of the particles does *not* affect the number of particles in the beam. Energy straggling is when all of the alpha particles start off with the same kinetic energy but lose different amounts of energy per collision with atomic electrons. Each particle has its own history of collisions and energy transfers. Particles with more energy travel further. Thus, energy straggling causes range straggling. Energy straggling is what causes the sigmoid curve at the end of the plot of the relationship between the number of particles in the beam and the simulation step. This plot is output from the program as a .png file.
         self.NumberParticlesInBeam = [self.InitialParticleNumber] # It is not necessary to treat this list as a numpy array because it is not used in any vector or matrix calculations.
@@ -2079,8 +2661,10 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
         self.RandomNumList_C_zy = [] # Initialise a list for each off-diagonal element of the randomised 3x3 matrix.
         
         self.DelayForShowingProgress = 2.5 # Units: s. Do not print the progress of each simulation instance to the command terminal at each simulation step, which would flood the terminal with text.
-        self.DelayTimer = 0.0
-        self.StartDelayTimer = None # This is one of my typical solutions for avoiding the error of a variable being referenced in an IF statement before being defined.
+        self.reset_Progress()
+        # NOTE: Before the ProgressAdmin.py script was made ...
+        # self.DelayTimer = 0.0
+        # self.StartDelayTimer = None # This is one of my typical solutions for avoiding the error of a variable being referenced in an IF statement before being defined.
         
         if instance == 0: # Print this message only once.
             print("Alpha particles will be removed from the beam when their kinetic energies fall below {0:0.3f} eV.".format(self.MinimumAlphaEnergy_eV)) # At which kinetic energy alpha particles are removed from the beam affects the results that the program outputs. The user must know what is affecting their results so that they may document it in their work/research. The minimum alpha kinetic energy may not be 1 eV, but may be expressed by a demical number in the future. Using the format() method keeps such numbers neatly presented.
@@ -2097,27 +2681,99 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
             # The SciPy community (2020). numpy.concatenate, https://numpy.org/doc/stable/reference/generated/numpy.concatenate.html.
     
     
-    def update_MediumForEachParticle(self):
-        self.AlphaParticlesInfoList_ID_X_Momentum_DF = pd.DataFrame(self.AlphaParticlesInfoList_ID_X_Momentum) # Maybe we will avoid shape or index errors if we use a pandas DataFrame rather than a numpy array.
-        
-        for particle in range(0, self.AlphaParticlesInfoList_ID_X_Momentum.shape[0]):
-            if self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 1] >= self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 12]:
-                if self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] < self.ChosenMaterials_DF.shape[0] - 1: # The beam has to go through a medium, whichever one it is. AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] is an index for use with the ChosenMaterials_DF DataFrame.
-                    self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] = self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] + 1
+    def make_LayeredMedium(self): # Keep the stack of chosen media as numpy arrays, so that the update_MediumForEachParticle() method can find the medium of every alpha particle at once instead of reading the ChosenMaterials_DF DataFrame one alpha particle at a time.
+        self.LayerAtomicNumbers = self.ChosenMaterials_DF.iloc[:, 1].to_numpy(dtype = float)
+        self.LayerAtomicWeights = self.ChosenMaterials_DF.iloc[:, 2].to_numpy(dtype = float)
+        self.LayerMassDensities = self.ChosenMaterials_DF.iloc[:, 3].to_numpy(dtype = float)
+        layer_constants = [MediumAdmin.get_MediumConstants(AtomicNumber, AtomicWeight, MassDensity, self.AvogadrosNum, self.CrossSectionConstant) for AtomicNumber, AtomicWeight, MassDensity in zip(self.LayerAtomicNumbers, self.LayerAtomicWeights, self.LayerMassDensities)] # Layers of the same medium share its quantities.
+        self.LayerElectronSpatialDensities = np.array([medium_constants.ElectronSpatialDensity for medium_constants in layer_constants]) # Units: cm^-3. The same as the ElectronSpatialDensity variable of the make_Medium() method, for each medium.
+        self.LayerMeanFreePathFactors = np.array([medium_constants.MeanFreePathFactor for medium_constants in layer_constants]) # The same as the MeanFreePathFactor variable of the make_Medium() method, for each medium.
+        self.LayerBoundaries = np.cumsum(self.ChosenMaterials_DF.iloc[:, 4].to_numpy(dtype = float)) # Units: m. The x-position of the far side of each medium, which is the NextThicknessCheckPoint of the alpha particles in it.
+        self.LastLayer = self.LayerBoundaries.shape[0] - 1
 
-                    ## Recalculate the mean free path of the alpha particle.
-                    self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 8] = self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 1] # Recalculate the atomic number.
-                    self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 9] = self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 2] # Recalculate the atomic weight.
-                    self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 10] = self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 3] # Recalculate the mass density.
+        # The boundaries that an alpha particle in each medium can reach going forwards and backwards. The first medium also fills the space before it and the last medium also fills the space after it, as in the update_MediumForEachParticle() method.
+        self.LayerUpperBoundaries = np.append(self.LayerBoundaries[:-1], np.inf)
+        self.LayerLowerBoundaries = np.insert(self.LayerBoundaries[:-1], 0, -np.inf)
 
-                    ## Recalculate the mean free path for the particle based on the medium it is in.
-                    self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 7] = ((self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 8] * (self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 10] * self.AvogadrosNum / self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 9])) * self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 6]) ** -1
+        # REFERENCES:
+            # The SciPy community (2020). numpy.cumsum, https://numpy.org/doc/stable/reference/generated/numpy.cumsum.html.
+
+
+    def get_MeanFreePathFactors(self): # Each alpha particle uses the factor of the medium that it is in.
+        return self.LayerMeanFreePathFactors[self.particle_store.WhichMedium]
+
+
+    def update_AlphaParticlePosition(self): # Move each alpha particle by one free path, going through the boundaries between the media on the way.
+        if self.LayerTransport == "step":
+            super().update_AlphaParticlePosition()
+            return
+
+        # The length of a free path in a medium is its mean free path times a number of mean free paths that is drawn from the exponential distribution, as in the update_AlphaParticlePosition() method of the AlphaParticles class. When a free path reaches a boundary, the number of mean free paths that is left is carried into the next medium. The exponential distribution has no memory, so this is the same as drawing a new free path at the boundary with the mean free path of the next medium, but the random numbers are the same as the "step" option, which gives the same results when there is one medium.
+        NumberOfMeanFreePaths = -np.log(1 - self.random_number_generator.uniform(low = 0, high = 1 + 1.1 * self.FloatMin, size = self.particle_store.Count))
+        DirectionX = self.particle_store.Momentum[:, 0] / self.particle_store.MomentumMagnitude # The x-component of each alpha particle's momentum unit vector.
+        PositionX = self.particle_store.PositionX.copy()
+        WhichMedium = self.particle_store.WhichMedium.copy()
+
+        InFlight = np.arange(0, self.particle_store.Count) # The rows of the alpha particles whose free paths have not ended yet. Each pass of the WHILE loop takes them to the end of their free paths or to the next boundary, so it runs at most once per medium.
+        while InFlight.shape[0] > 0:
+            Medium = WhichMedium[InFlight]
+            MeanFreePath = (self.LayerElectronSpatialDensities[Medium] * self.particle_store.CrossSection[InFlight]) ** -1
+            Direction = DirectionX[InFlight]
+            Boundary = np.where(Direction > 0, self.LayerUpperBoundaries[Medium], self.LayerLowerBoundaries[Medium])
+
+            with np.errstate(divide = "ignore", invalid = "ignore"): # An alpha particle that moves perpendicular to the x-axis never reaches a boundary.
+                DistanceToBoundary = np.where(Direction != 0, (Boundary - PositionX[InFlight]) / Direction, np.inf) # The distance along the free path, not along the x-axis.
+
+            FreePath = NumberOfMeanFreePaths[InFlight] * MeanFreePath
+            EndsInMedium = FreePath <= DistanceToBoundary
+
+            PositionX[InFlight[EndsInMedium]] = PositionX[InFlight[EndsInMedium]] + FreePath[EndsInMedium] * Direction[EndsInMedium]
+
+            ReachesBoundary = ~EndsInMedium
+            InFlight = InFlight[ReachesBoundary]
+            PositionX[InFlight] = Boundary[ReachesBoundary]
+            NumberOfMeanFreePaths[InFlight] = NumberOfMeanFreePaths[InFlight] - DistanceToBoundary[ReachesBoundary] / MeanFreePath[ReachesBoundary] # The part of the free path that is left.
+            WhichMedium[InFlight] = WhichMedium[InFlight] + np.where(Direction[ReachesBoundary] > 0, 1, -1)
+
+        self.particle_store.PositionX = PositionX # The update_MediumForEachParticle() method then updates the media and mean free paths of the alpha particles from their new x-positions.
 
-                    ## Update the NextThicknessCheckPoint variable for the particle.
-                    self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 12] = self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 12] + self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 4]
+        # REFERENCES:
+            # Johnston, P, Merchant, A, Taylor, M, Franich, R & Supple, J (2020). Lecture 2: Fundamentals and extensions to radiation transport, PHYS2139 – Radiotherapy Physics and Modelling, RMIT University.
+            # The SciPy community (2020). numpy.errstate, https://numpy.org/doc/stable/reference/generated/numpy.errstate.html.
+
+
+    def update_MediumForEachParticle(self): # Find the medium that each alpha particle is in from its x-position, and update the properties of the medium and the mean free path of the alpha particles that are in a different medium than before.
+        self.WhichMedium = np.minimum(np.searchsorted(self.LayerBoundaries, self.particle_store.PositionX, side = "right"), self.LastLayer) # An alpha particle that is exactly on a boundary is in the next medium, as before. An alpha particle that has gone past the last medium stays in the last medium. Unlike before, an alpha particle that went past more than one boundary in one simulation step is put into the right medium rather than the next one.
+        self.ChangedMediumMask = self.WhichMedium != self.particle_store.WhichMedium
+
+        if not self.ChangedMediumMask.any(): # Most simulation steps have no alpha particles going past a boundary.
+            return
+
+        NewMedium = self.WhichMedium[self.ChangedMediumMask]
+        self.particle_store.AtomicNumber[self.ChangedMediumMask] = self.LayerAtomicNumbers[NewMedium]
+        self.particle_store.AtomicWeight[self.ChangedMediumMask] = self.LayerAtomicWeights[NewMedium]
+        self.particle_store.MassDensity[self.ChangedMediumMask] = self.LayerMassDensities[NewMedium]
+        self.particle_store.WhichMedium[self.ChangedMediumMask] = NewMedium
+        self.particle_store.MeanFreePath[self.ChangedMediumMask] = (self.LayerElectronSpatialDensities[NewMedium] * self.particle_store.CrossSection[self.ChangedMediumMask]) ** -1 # Recalculate the mean free path of the alpha particles based on the medium they are in.
+        self.particle_store.NextThicknessCheckPoint[self.ChangedMediumMask] = self.LayerBoundaries[NewMedium] # Update the NextThicknessCheckPoint variable of the alpha particles.
+        # NOTE: Before the media were kept as numpy arrays ... The info list was turned into a pandas DataFrame at every simulation step and each alpha particle was checked in a FOR loop.
+        # self.AlphaParticlesInfoList_ID_X_Momentum_DF = pd.DataFrame(self.AlphaParticlesInfoList_ID_X_Momentum) # Maybe we will avoid shape or index errors if we use a pandas DataFrame rather than a numpy array.
+        # for particle in range(0, self.AlphaParticlesInfoList_ID_X_Momentum.shape[0]):
+        #     if self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 1] >= self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 12]:
+        #         if self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] < self.ChosenMaterials_DF.shape[0] - 1: # The beam has to go through a medium, whichever one it is. AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] is an index for use with the ChosenMaterials_DF DataFrame.
+        #             self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] = self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11] + 1
+        #             ## Recalculate the mean free path of the alpha particle.
+        #             self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 8] = self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 1] # Recalculate the atomic number.
+        #             self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 9] = self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 2] # Recalculate the atomic weight.
+        #             self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 10] = self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 3] # Recalculate the mass density.
+        #             ## Recalculate the mean free path for the particle based on the medium it is in.
+        #             self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 7] = ((self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 8] * (self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 10] * self.AvogadrosNum / self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 9])) * self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 6]) ** -1
+        #             ## Update the NextThicknessCheckPoint variable for the particle.
+        #             self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 12] = self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 12] + self.ChosenMaterials_DF.iloc[int(self.AlphaParticlesInfoList_ID_X_Momentum_DF.iloc[particle, 11]), 4]
+        # self.AlphaParticlesInfoList_ID_X_Momentum = np.array(self.AlphaParticlesInfoList_ID_X_Momentum_DF)
 
-                   
-        self.AlphaParticlesInfoList_ID_X_Momentum = np.array(self.AlphaParticlesInfoList_ID_X_Momentum_DF)
+        # REFERENCES:
+            # The SciPy community (2020). numpy.searchsorted, https://numpy.org/doc/stable/reference/generated/numpy.searchsorted.html.
     
     
     def process_Simulation(self, instance): # Pass the "instance" argument to the show_Progress() method.
@@ -2146,7 +2802,10 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
             timing_studies.start_AttenuationQuiz_calculate_Data = time.time()
         
         ## Calculate the maximum range of the alpha particles. This is necessary for defining the upper limit of the distances to check for calculating the number of particles remaining in the beam as a function of distance. NOTE: The x-positions are in the same units as the mean free path, which has units of m.
-        self.MaximumRange = self.PositionXArray.max().max() # The maximum range is the largest number in the DataFrame. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
+        self.range_estimator = RangeEstimator.RangeEstimator(self.PositionXArray.max(axis = 1), self.InitialPositionX) # Find the furthest x-position of each alpha particle only once. The range estimator sorts them so that the ranges can be found directly from the sorted x-positions.
+        self.MaximumRange = self.range_estimator.get_MaximumRange() # The maximum range is the largest number in the array. It is the furthest distance an alpha particle in the beam has travelled.
+        # NOTE: Before the RangeEstimator.py script was made ...
+        # self.MaximumRange = self.PositionXArray.max().max() # The maximum range is the largest number in the DataFrame. It is the furthest distance an alpha particle in the beam has travelled. It is the easiest value to calculate out of the ones we are interested in. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method.
         # NOTE: Before optimisation ...
         ## Prepare the PositionXList_DF DataFrame for data analysis. 
         # self.PositionXList_DF = ((self.PositionXList_DF.T).reset_index(drop = True)).T # First, we make sure its columns are labelled by the simulation steps rather than all having the same label due to having been concatenated together. The reset_index() method works row-wise, so we transpose the DataFrame first. Then we reset the row labels and transpose the DataFrame back to its original shape. The methods are evaluated one after the other, each one being applied to the result of the use of the previous method. However, we use parentheses to make reading the code easier.
@@ -2154,71 +2813,68 @@ class AttenuationQuiz(AlphaParticles): # This class is for quizzing the user abo
 
 
         ## Calculate the number of alpha particles remaining in the beam as a function of distance.
-        self.NumOfDistancesToCheck = 5e2 # This variable is for specifying the number of points to be created using the np.linspace() method.
-        self.DistancesToCheck = list(np.linspace(start = 0.0, stop = self.MaximumRange, num = int(self.NumOfDistancesToCheck), endpoint = True)) # Create the DistancesToCheckList to be zipped into a dictionary as values.
-        
-        self.NumbersList = list(range(0, len(self.DistancesToCheck))) # The list created here will be zipped into the dictionary for the DistancesToCheck list as keys.
-        
-        self.DistancesToCheck_Dict = dict(zip(self.NumbersList, self.DistancesToCheck))
-
-        self.ParticleNumList_Distance = [] # This list is going to have the number of alpha particles remaining in the beam at each distance of interest.
-        for distance_Key in range(0, len(self.DistancesToCheck_Dict)): # Use a nested FOR loop for now. Nested FOR loops are known to be relatively slow, but they get the job done in this case.
-            self.ParticleNumber_DistanceCheck = self.InitialParticleNumber # Reset this variable for use in the FOR loop below.
-            
-            for particle in range(0, self.PositionXArray.shape[0]): # Check how many particles passed the distance of interest.
-                if self.PositionXArray[particle,:].max() <= self.DistancesToCheck_Dict[distance_Key]: # For each particle that did not pass the distance of interest, decrement the ParticleNum variable by 1.
-                    self.ParticleNumber_DistanceCheck = self.ParticleNumber_DistanceCheck - 1
-            # NOTE: Before optimisation ...
-            # for particle in range(0, self.PositionXList_DF.shape[0]): # Check how many particles passed the distance of interest.
-            #     if self.PositionXList_DF.iloc[particle,:].max() <= self.DistancesToCheck_Dict[distance_Key]: # For each particle that did not pass the distance of interest, decrement the ParticleNum variable by 1.
-            #         self.ParticleNumber_DistanceCheck = self.ParticleNumber_DistanceCheck - 1
-            
-
-            self.ParticleNumList_Distance.append(self.ParticleNumber_DistanceCheck)
+        self.calculate_ParticleNumList_Distance()
+        # NOTE: Before the calculate_ParticleNumList_Distance() method was made ... The nested FOR loop below recalculated the maximum x-position of every alpha particle for every distance of interest.
+        # self.NumOfDistancesToCheck = 5e2 # This variable is for specifying the number of points to be created using the np.linspace() method.
+        # self.DistancesToCheck = list(np.linspace(start = 0.0, stop = self.MaximumRange, num = int(self.NumOfDistancesToCheck), endpoint = True)) # Create the DistancesToCheckList to be zipped into a dictionary as values.
+        # self.NumbersList = list(range(0, len(self.DistancesToCheck))) # The list created here will be zipped into the dictionary for the DistancesToCheck list as keys.
+        # self.DistancesToCheck_Dict = dict(zip(self.NumbersList, self.DistancesToCheck))
+        # self.ParticleNumList_Distance = [] # This list is going to have the number of alpha particles remaining in the beam at each distance of interest.
+        # for distance_Key in range(0, len(self.DistancesToCheck_Dict)): # Use a nested FOR loop for now. Nested FOR loops are known to be relatively slow, but they get the job done in this case.
+        #     self.ParticleNumber_DistanceCheck = self.InitialParticleNumber # Reset this variable for use in the FOR loop below.
+        #     for particle in range(0, self.PositionXArray.shape[0]): # Check how many particles passed the distance of interest.
+        #         if self.PositionXArray[particle, :].max() <= self.DistancesToCheck_Dict[distance_Key]: # For each particle that did not pass the distance of interest, decrement the ParticleNum variable by 1.
+        #             self.ParticleNumber_DistanceCheck = self.ParticleNumber_DistanceCheck - 1
+        #     self.ParticleNumList_Distance.append(self.ParticleNumber_DistanceCheck)
        
         
         ## Calculate the thickness of material that transmitted the specified fraction of alpha particles.
-        try: 
-            self.ParticleNumberTransmitted = round(self.TransmissionFraction * self.InitialParticleNumber) # The number of particles transmitted is an integer. round() gives a better answer than int().
-            self.CorrectMaterialThickness = self.DistancesToCheck[self.ParticleNumList_Distance.index(self.ParticleNumberTransmitted)]
-        
-        except: # Unlike for the MeanRange, either CorrectMaterialThickness_Backwards or CorrectMaterialThickness_Forwards may not be defined at all if they are in the same FOR loop because the FOR loop may end before both of them get assigned a value. Thus, they must be in separate FOR loops. However, this will affect the result, but it is better than having an error raised.
-            for num in range(1, self.InitialParticleNumber - self.ParticleNumberTransmitted + 1): # Calculate a value for CorrectMaterialThickness_Backwards.
-                try: # The code below can actually raise a ValueError error if a particular value is not found in the ParticleNumList_Distance list. Therefore, we include a TRY-EXCEPT code block in the FOR loop.
-                    if self.ParticleNumberTransmitted + num >= self.InitialParticleNumber: # If this is the case, search for the furthest distance that *all* of the particles travelled just before the first particle left the beam.
-                        self.CorrectMaterialThickness_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(len(self.ParticleNumList_Distance) - 1 - self.ParticleNumList_Distance[::-1].index(self.InitialParticleNumber))] # The index() method searches for the specified element from the start of the list. However, we want the index of the *last* element, so we flip the list. Having found the index of the last element in the flipped list, we want to know its index in the original list, so we calculate the original index.
+        self.ParticleNumberTransmitted = round(self.TransmissionFraction * self.InitialParticleNumber) # The number of particles transmitted is an integer. round() gives a better answer than int().
+        self.CorrectMaterialThickness = self.range_estimator.get_DepthForTransmittedNumber(self.ParticleNumberTransmitted)
+
+        # NOTE: Before the RangeEstimator.py script was made ... The thickness was searched for in the ParticleNumList_Distance list in the same way as the mean range was in the calculate_Data() method of the AlphaParticles class.
+        # ## Calculate the thickness of material that transmitted the specified fraction of alpha particles.
+        # try: 
+        #     self.ParticleNumberTransmitted = round(self.TransmissionFraction * self.InitialParticleNumber) # The number of particles transmitted is an integer. round() gives a better answer than int().
+        #     self.CorrectMaterialThickness = self.DistancesToCheck[self.ParticleNumList_Distance.index(self.ParticleNumberTransmitted)]
+        
+        # except: # Unlike for the MeanRange, either CorrectMaterialThickness_Backwards or CorrectMaterialThickness_Forwards may not be defined at all if they are in the same FOR loop because the FOR loop may end before both of them get assigned a value. Thus, they must be in separate FOR loops. However, this will affect the result, but it is better than having an error raised.
+        #     for num in range(1, self.InitialParticleNumber - self.ParticleNumberTransmitted + 1): # Calculate a value for CorrectMaterialThickness_Backwards.
+        #         try: # The code below can actually raise a ValueError error if a particular value is not found in the ParticleNumList_Distance list. Therefore, we include a TRY-EXCEPT code block in the FOR loop.
+        #             if self.ParticleNumberTransmitted + num >= self.InitialParticleNumber: # If this is the case, search for the furthest distance that *all* of the particles travelled just before the first particle left the beam.
+        #                 self.CorrectMaterialThickness_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(len(self.ParticleNumList_Distance) - 1 - self.ParticleNumList_Distance[::-1].index(self.InitialParticleNumber))] # The index() method searches for the specified element from the start of the list. However, we want the index of the *last* element, so we flip the list. Having found the index of the last element in the flipped list, we want to know its index in the original list, so we calculate the original index.
                     
-                    else:
-                        self.CorrectMaterialThickness_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.ParticleNumberTransmitted + num)]
+        #             else:
+        #                 self.CorrectMaterialThickness_Backwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.ParticleNumberTransmitted + num)]
                     
-                    if self.CorrectMaterialThickness_Backwards is not None:
-                        break # Now that we have assigned a value to each of the two variables above, we do not need to iterate "num" anymore. We have what we wanted.
+        #             if self.CorrectMaterialThickness_Backwards is not None:
+        #                 break # Now that we have assigned a value to each of the two variables above, we do not need to iterate "num" anymore. We have what we wanted.
                     
-                    else:
-                        continue
+        #             else:
+        #                 continue
 
-                except:
-                    continue # We want to use the normal behaviour of a FOR loop in that it goes to its next iteration. It is because of the ValueError error that we use a TRY-EXCEPT code block.
+        #         except:
+        #             continue # We want to use the normal behaviour of a FOR loop in that it goes to its next iteration. It is because of the ValueError error that we use a TRY-EXCEPT code block.
             
-            for num in range(1, self.ParticleNumberTransmitted + 1): # Calculate a value for CorrectMaterialThickness_Forwards.
-                try: # The code below can actually raise a ValueError error if a particular value is not found in the ParticleNumList_Distance list. Therefore, we include a TRY-EXCEPT code block in the FOR loop.
-                    if self.ParticleNumberTransmitted - num <= 0: # We do not want self.ParticleNumberTransmitted - num being negative, so we stop it from being so.
-                        self.CorrectMaterialThickness_Forwards = self.DistancesToCheck[-1] # Unlike with CorrectMaterialThickness_Backwards when the condition in the IF statement just above is True, we want the index of the first occurrence of 0 particles. The simulation stops when the number of particles in the beam is 0, meaning that there is only one occurrence of 0 in the list of the number of particles in the beam. We use the list version rather than the dictionary version of DistancesToCheck because [-1] for a dictionary means "the key named '-1'", which is not what we want, while for a list it refers to the last element, which is what we want.
+        #     for num in range(1, self.ParticleNumberTransmitted + 1): # Calculate a value for CorrectMaterialThickness_Forwards.
+        #         try: # The code below can actually raise a ValueError error if a particular value is not found in the ParticleNumList_Distance list. Therefore, we include a TRY-EXCEPT code block in the FOR loop.
+        #             if self.ParticleNumberTransmitted - num <= 0: # We do not want self.ParticleNumberTransmitted - num being negative, so we stop it from being so.
+        #                 self.CorrectMaterialThickness_Forwards = self.DistancesToCheck[-1] # Unlike with CorrectMaterialThickness_Backwards when the condition in the IF statement just above is True, we want the index of the first occurrence of 0 particles. The simulation stops when the number of particles in the beam is 0, meaning that there is only one occurrence of 0 in the list of the number of particles in the beam. We use the list version rather than the dictionary version of DistancesToCheck because [-1] for a dictionary means "the key named '-1'", which is not what we want, while for a list it refers to the last element, which is what we want.
                     
-                    else:
-                        self.CorrectMaterialThickness_Forwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.ParticleNumberTransmitted - num)]
+        #             else:
+        #                 self.CorrectMaterialThickness_Forwards = self.DistancesToCheck_Dict[self.ParticleNumList_Distance.index(self.ParticleNumberTransmitted - num)]
                     
-                    if self.CorrectMaterialThickness_Forwards is not None:
-                        break # Now that we have assigned a value to each of the two variables above, we do not need to iterate "num" anymore. We have what we wanted.
+        #             if self.CorrectMaterialThickness_Forwards is not None:
+        #                 break # Now that we have assigned a value to each of the two variables above, we do not need to iterate "num" anymore. We have what we wanted.
                     
-                    else:
-                        continue
+        #             else:
+        #                 continue
 
-                except:
-                    continue # We want to use the normal behaviour of a FOR loop in that it goes to its next iteration. It is because of the ValueError error that we use a TRY-EXCEPT code block.
+        #         except:
+        #             continue # We want to use the normal behaviour of a FOR loop in that it goes to its next iteration. It is because of the ValueError error that we use a TRY-EXCEPT code block.
 
            
-            self.CorrectMaterialThickness = np.array(self.CorrectMaterialThickness_Backwards, self.CorrectMaterialThickness_Forwards).mean() # The slope at the descending end of the plot of the number of particles in the beam as a function of distance is approximately linear. So we do linear interpolation. I prefer to use a numpy array and the mean() method instead of doing (a + b)/2, because the latter option seems a bit hard-coded to me.
+        #     self.CorrectMaterialThickness = np.array(self.CorrectMaterialThickness_Backwards, self.CorrectMaterialThickness_Forwards).mean() # The slope at the descending end of the plot of the number of particles in the beam as a function of distance is approximately linear. So we do linear interpolation. I prefer to use a numpy array and the mean() method instead of doing (a + b)/2, because the latter option seems a bit hard-coded to me.
 
         if __name__ == "__main__":
             timing_studies.end_AttenuationQuiz_calculate_Data = time.time()
@@ -2281,10 +2937,12 @@ if __name__ == "__main__":
     timing_studies.start_FunctionDefinition_main = time.time()
 
 
-def main(): # This function is one of the functions that are at the highest level of the program. And it is the first function that actually gets *executed*. Writing the code for this function first helped me to write the code for defining the classes and their methods above.
+def main(job = None): # This function is one of the functions that are at the highest level of the program. And it is the first function that actually gets *executed*. Writing the code for this function first helped me to write the code for defining the classes and their methods above. job is a job from a job spec file (see the BatchAdmin.py script). If it is given, its answers are used instead of asking the user.
     program_admin = ProgramAdmin()
-    program_admin.show_AboutTheProgram() # This notice is for telling the user basic information about the program.
-    program_admin.show_Instructions() # This notice tells the user intructions for how to use the program.
+
+    if job is None:
+        program_admin.show_AboutTheProgram() # This notice is for telling the user basic information about the program.
+        program_admin.show_Instructions() # This notice tells the user intructions for how to use the program.
     
     if __name__ == "__main__":
         timing_studies.ExecutionTime_main_SimDistance_Option_Input, timing_studies.ExecutionTime_main_WhetherOrNotReadInputsFromFile_Input, timing_studies.ExecutionTime_program_admin_get_InputsForAlphaBeam, timing_studies.ExecutionTime_program_admin_get_InputsForMedium, timing_studies.ExecutionTime_main_SimInstances_Input, timing_studies.ExecutionTime_statistical_analyser_plot_RandomMatrixOffDiagonals_All_HistogramBins_Input, timing_studies.ExecutionTime_main_AnalyseBeam_AppendTimingResults = program_admin.initialise_TimersForMain() # ... in case any of these variables are not defined depending on which mode of the program is run. These variables are to be subtracted from the execution time of the main() function.
@@ -2292,7 +2950,11 @@ def main(): # This function is one of the functions that are at the highest leve
     ### Ask the user which mode they want to use the program in.
         timing_studies.start_main_SimDistance_Option_Input = time.time()
     
-    SimDistance_Option = input("Would you like to analyse an alpha particle beam (a), play the radiotherapy game (g), or do the beam attenuation quiz (q)? ") # It is not likely that incorrect user input here will raise an error because all of their inputs are treated as a string.
+    if job is not None:
+        SimDistance_Option = job["mode"]
+
+    else:
+        SimDistance_Option = input("Would you like to analyse an alpha particle beam (a), play the radiotherapy game (g), or do the beam attenuation quiz (q)? ") # It is not likely that incorrect user input here will raise an error because all of their inputs are treated as a string.
     
     if __name__ == "__main__":
         timing_studies.end_main_SimDistance_Option_Input = time.time()
@@ -2322,7 +2984,7 @@ def main(): # This function is one of the functions that are at the highest leve
         if __name__ == "__main__":
             timing_studies.start_main_WhetherOrNotReadInputsFromFile_Input = time.time()
         
-        WhetherOrNotReadInputsFromFile = input("Would you like to read inputs from InputsForBeamAnalysis.txt? (y/n) ")
+        WhetherOrNotReadInputsFromFile = input("Would you like to read inputs from InputsForBeamAnalysis.txt? (y/n) ") if job is None else "y" # The inputs of a job are read in the same way as the inputs in the input file.
         
         if __name__ == "__main__":
             timing_studies.end_main_WhetherOrNotReadInputsFromFile_Input = time.time()
@@ -2341,16 +3003,20 @@ def main(): # This function is one of the functions that are at the highest leve
         
         
         if WhetherOrNotReadInputsFromFile in set(["y", "Y"]):
-            InitialKineticEnergy, InitialParticleNumber, RandomDistribution, WhetherOrNotToSeed, AtomicNumber, AtomicWeight, MassDensity, SimInstances = program_admin.get_InputsForBeamAnalysisFromFile()
+            InitialKineticEnergy, InitialParticleNumber, RandomDistribution, WhetherOrNotToSeed, AtomicNumber, AtomicWeight, MassDensity, SimInstances = program_admin.get_InputsForBeamAnalysisFromFile(None if job is None else BatchAdmin.get_InputFileLines(job))
             
             try:
                 program_admin.Seed = int(program_admin.InputFileLines_BeamAnalysis[4].replace("Seed = ", ""))
+                assert program_admin.Seed >= 0 # numpy's random number generators only accept seeds that are 0 or greater.
                 
                 if WhetherOrNotToSeed in set(["y", "Y"]):
-                    random.seed(a = program_admin.Seed, version = 2) # These inputs are not accessed directly via the main() function as are the other inputs in the line above.
+                    pass # The seed is passed to the random number generator of each simulation instance via the make_RandomNumberGenerator() method of the AlphaParticles class.
+                    # NOTE: Before the RandomNumberAdmin.py script was made ...
+                    # random.seed(a = program_admin.Seed, version = 2) # These inputs are not accessed directly via the main() function as are the other inputs in the line above.
                 
                 elif WhetherOrNotToSeed in set(["n", "N"]):
                     print("The random number generators will *not* be seeded.")
+                    program_admin.Seed = None # ... so that the seed in the input file is not used.
             
             except:
                 print("Error: Either an invalid answer was given for whether or not to seed or an invalid seed was given. Please give a valid seed. The program will now exit.")
@@ -2393,11 +3059,19 @@ def main(): # This function is one of the functions that are at the highest leve
                 print("Please check the input file named 'InputsForBeamAnalysis.txt'. The program will now exit.")
                 exit()
             
-            elif SimInstances <= 0:
-                print("Error: The number of simulation instances must be at least 1. Please try again.")
+            elif SimInstances < 0:
+                print("Error: The number of simulation instances must be at least 1, or 0 to run simulation instances until the results converge. Please try again.")
+                print("Please check the input file named 'InputsForBeamAnalysis.txt'. The program will now exit.")
+                exit()
+
+            elif (SimInstances == 0) and ((program_admin.TargetRelativeUncertainty is None) or (program_admin.TargetRelativeUncertainty <= 0.0)):
+                print("Error: 0 simulation instances means that simulation instances are run until the results converge. This needs a target relative uncertainty greater than 0 on the line after the number of simulation instances, e.g., 'Target relative uncertainty = 0.01'.")
                 print("Please check the input file named 'InputsForBeamAnalysis.txt'. The program will now exit.")
                 exit()
 
+            if RandomDistribution == "discrete": # The input file does not have the discretisation. Ask for it now rather than in the middle of the simulation.
+                program_admin.get_AmountOfNumbersForDiscreteDistribution(None if job is None else job["Number of possible random numbers"])
+
 
             # Tell me what the program read from the input file so that I know whether or not the program is doing what I expect it to be doing.
             print("### Inputs ###")
@@ -2410,6 +3084,8 @@ def main(): # This function is one of the functions that are at the highest leve
             print("Atomic weight of the medium = {} g/mol".format(AtomicWeight))
             print("Mass density of the medium = {} g/cm^3".format(MassDensity))
             print("Number of simulation instances = {}".format(SimInstances))
+            if SimInstances == 0:
+                print("Target relative uncertainty = {}".format(program_admin.TargetRelativeUncertainty))
             print("#" * len("### Inputs ###"))
 
         elif WhetherOrNotReadInputsFromFile in set(["n", "N"]):
@@ -2440,11 +3116,14 @@ def main(): # This function is one of the functions that are at the highest leve
                 timing_studies.start_main_SimInstances_Input = time.time()
             
             try:
-                SimInstances = int(program_admin.check_FloatingPointInput(float(input("How many instances of the simulation would you like to run? "))))
+                SimInstances = int(program_admin.check_FloatingPointInput(float(input("How many instances of the simulation would you like to run? (0: run simulation instances until the results converge) "))))
                 
-                while SimInstances <= 0:
-                    print("Error: The number of simulation instances must be at least 1. Please try again.")
-                    SimInstances = int(program_admin.check_FloatingPointInput(float(input("How many instances of the simulation would you like to run? "))))
+                while SimInstances < 0:
+                    print("Error: The number of simulation instances must be at least 1, or 0. Please try again.")
+                    SimInstances = int(program_admin.check_FloatingPointInput(float(input("How many instances of the simulation would you like to run? (0: run simulation instances until the results converge) "))))
+
+                if SimInstances == 0:
+                    program_admin.get_TargetRelativeUncertainty()
             
             except:
                 print("Error: You did not provide a valid answer. The program will now exit.")
@@ -2459,11 +3138,21 @@ def main(): # This function is one of the functions that are at the highest leve
         
         ### Initialise dictionaries for the simulation.
         alpha_beam_dict = {instance : AlphaParticles(InitialKineticEnergy, InitialParticleNumber, RandomDistribution, AtomicNumber, AtomicWeight, MassDensity) for instance in range(0, SimInstances)} # Create the alpha particle beam. Transfer the MeanFreePath variable into the AlphaParticles() class.
+
+        for instance in range(0, SimInstances): # Pass the inputs for the random number generators into each simulation instance.
+            alpha_beam_dict[instance].Seed, alpha_beam_dict[instance].AmountOfNumbers = program_admin.Seed, program_admin.AmountOfNumbers
         MaximumRanges_Dict = {instance : 0 for instance in range(0, SimInstances)} # ... for collecting the maximum range from each simulation instance.
         ParticleNumDict_Distance_Dict = {instance : 0 for instance in range(0, SimInstances)} # ... for collecting the relationship between the number of alpha particles in the beam as a function of distance that the beam travelled from each simulation instance.
         MeanRanges_Dict = {instance : 0 for instance in range(0, SimInstances)} # ... for collecting the mean range from each simulation instance.
 
         statistical_analyser = StatisticalAnalysis(InitialKineticEnergy, InitialParticleNumber, RandomDistribution, AtomicNumber, AtomicWeight, MassDensity, SimInstances) # This is the object for statistically analysing the simulation's results.
+        statistical_analyser.Seed, statistical_analyser.AmountOfNumbers = program_admin.Seed, program_admin.AmountOfNumbers # AmountOfNumbers is used for describing the discrete probability density function in the outputted data file.
+
+        if SimInstances == 0: # Run simulation instances until the results converge. The simulation instances are added by the run_SimulationInstances() method of the StatisticalAnalysis class.
+            statistical_analyser.TargetRelativeUncertainty = program_admin.TargetRelativeUncertainty
+
+        if job is not None: # The user is not asked for the number of bins of the histograms after the simulation.
+            statistical_analyser.OffDiagonalHistogram_NumberOfBins = job["Number of bins of the histograms"]
         
         statistical_analyser.SimInstances, statistical_analyser.alpha_beam_dict, statistical_analyser.MaximumRanges_Dict, statistical_analyser.ParticleNumDict_Distance_Dict, statistical_analyser.MeanRanges_Dict = SimInstances, alpha_beam_dict, MaximumRanges_Dict, ParticleNumDict_Distance_Dict, MeanRanges_Dict # Simplify the code for multiprocessing by passing the arguments of the statistical_analyser.process_MultipleInstancesOfSimulation() into the StatisticalAnalysis class before the multiprocessing code is executed.
         
@@ -2478,13 +3167,16 @@ def main(): # This function is one of the functions that are at the highest leve
         if __name__ == "__main__":
             statistical_analyser.SimInstances_List = list(range(0, statistical_analyser.SimInstances)) # Store the list as a variable so that the program does not have to recreate the list each time it is needed. Doing this may let the program run slightly faster.
             
-            pool_BeamAnalysis = mp.Pool(processes = min(int(MaxCPUCoresToUse), statistical_analyser.SimInstances)) # The min() function is used to make sure that there is always one process per simulation instance but not more than the specified fraction of the total number of CPU cores the computer has.
+            # NOTE: Before the PoolAdmin.py script was made, a new pool was made here and closed after the simulation instances were run. The pool_admin object now keeps one pool for the whole program, so the time it takes to start the processes is only spent once.
+            # pool_BeamAnalysis = mp.Pool(processes = min(int(MaxCPUCoresToUse), statistical_analyser.SimInstances)) # The min() function is used to make sure that there is always one process per simulation instance but not more than the specified fraction of the total number of CPU cores the computer has.
+            # PoolResult_BeamAnalysis = pool_BeamAnalysis.map(statistical_analyser.process_SimulationInstance, statistical_analyser.SimInstances_List)
+            # pool_BeamAnalysis.close() # These two methods are required to end the pool.
+            # pool_BeamAnalysis.join()
 
+            ### Run the simulation instances. Each simulation instance is split into chunks of alpha particles. The chunks are handed out to the pooled processes one at a time as the processes become free, and the results of each simulation instance are put together as soon as all of its chunks are done.
             timing_studies.start_PooledProcesses = time.time()  # Determine the execution time of the method that is being parallelised.
-            PoolResult_BeamAnalysis = pool_BeamAnalysis.map(statistical_analyser.process_SimulationInstance, statistical_analyser.SimInstances_List) # A list is input into the map() method and another list is output. This means that we can treat "PoolResult_BeamAnalysis" as a list.
-
-            pool_BeamAnalysis.close() # These two methods are required to end the pool.
-            pool_BeamAnalysis.join()
+            statistical_analyser.run_SimulationInstances(pool_admin, result_cache)
+            SimInstances = statistical_analyser.SimInstances # The number of simulation instances is only known after the simulation if the simulation instances were run until the results converged.
 
             timing_studies.end_PooledProcesses = time.time()
             
@@ -2492,7 +3184,10 @@ def main(): # This function is one of the functions that are at the highest leve
             print("Execution time of all pooled processes as a whole =", timing_studies.end_PooledProcesses - timing_studies.start_PooledProcesses, "s")
             print()
 
-            statistical_analyser.alpha_beam_dict = dict(zip(statistical_analyser.SimInstances_List, PoolResult_BeamAnalysis)) # The output of the map() method was a list, so we can cast it back into the alpha_beam_dict dictionary.
+            # NOTE: The statistical_analyser.alpha_beam_dict dictionary now has a SimulationInstanceResult object from the ResultAdmin.py script for each simulation instance rather than an AlphaParticles object. These objects have the same names for the results as the AlphaParticles objects and the same get_Results() method.
+            # NOTE: Before the simulation instances were split into chunks of alpha particles, each simulation instance was one task for the pooled processes. The pool could not have more tasks than simulation instances, so CPU cores were left idle when there were fewer simulation instances than CPU cores, and while the slowest simulation instances finished.
+            # PoolResult_BeamAnalysis = pool_admin.map(statistical_analyser.process_SimulationInstance, statistical_analyser.SimInstances_List) # A list is input into the map() method and another list is output. This means that we can treat "PoolResult_BeamAnalysis" as a list.
+            # statistical_analyser.alpha_beam_dict = dict(zip(statistical_analyser.SimInstances_List, PoolResult_BeamAnalysis)) # The output of the map() method was a list, so we can cast it back into the alpha_beam_dict dictionary.
        
         # REFERENCES:
             # Python Software Foundation (2020). multiprocessing — Process-based parallelism, https://docs.python.org/3/library/multiprocessing.html.
@@ -2627,7 +3322,7 @@ def main(): # This function is one of the functions that are at the highest leve
         if __name__ == "__main__":
             timing_studies.start_main_WhetherOrNotReadInputsFromFile_Input = time.time()
 
-        WhetherOrNotReadInputsFromFile = input("Would you like to read inputs from InputsForRTGame.txt? (y/n) ")
+        WhetherOrNotReadInputsFromFile = input("Would you like to read inputs from InputsForRTGame.txt? (y/n) ") if job is None else "y" # The inputs of a job are read in the same way as the inputs in the input file.
         
         if __name__ == "__main__":
             timing_studies.end_main_WhetherOrNotReadInputsFromFile_Input = time.time()
@@ -2645,16 +3340,20 @@ def main(): # This function is one of the functions that are at the highest leve
             exit()
         
         if WhetherOrNotReadInputsFromFile in set(["y", "Y"]):
-            InitialKineticEnergy, InitialParticleNumber, RandomDistribution, WhetherOrNotToSeed, BeamHeight, BeamWidth = program_admin.get_InputsForRTGameFromFile()
+            InitialKineticEnergy, InitialParticleNumber, RandomDistribution, WhetherOrNotToSeed, BeamHeight, BeamWidth = program_admin.get_InputsForRTGameFromFile(None if job is None else BatchAdmin.get_InputFileLines(job))
             
             try:
                 program_admin.Seed = int(program_admin.InputFileLines_RTGame[4].replace("Seed = ", ""))
+                assert program_admin.Seed >= 0 # numpy's random number generators only accept seeds that are 0 or greater.
                 
                 if WhetherOrNotToSeed in set(["y", "Y"]):
-                    random.seed(a = program_admin.Seed, version = 2) # These inputs are not accessed directly via the main() function as are the other inputs in the line above.
+                    pass # The seed is passed to the random number generator of each simulation instance via the make_RandomNumberGenerator() method of the AlphaParticles class.
+                    # NOTE: Before the RandomNumberAdmin.py script was made ...
+                    # random.seed(a = program_admin.Seed, version = 2) # These inputs are not accessed directly via the main() function as are the other inputs in the line above.
                 
                 elif WhetherOrNotToSeed in set(["n", "N"]):
                     print("The random number generators will *not* be seeded.")
+                    program_admin.Seed = None # ... so that the seed in the input file is not used.
             
             except:
                 print("Error: An invalid seed was given. Please give a valid seed. The program will now exit.")
@@ -2692,6 +3391,9 @@ def main(): # This function is one of the functions that are at the highest leve
                 print("Error: The beam's width must be greater than 0.0 cm.")
                 print("Please check the input file named 'InputsForRTGame.txt'. The program will now exit.")
                 exit()
+
+            if RandomDistribution == "discrete": # The input file does not have the discretisation. Ask for it now rather than in the middle of the simulation.
+                program_admin.get_AmountOfNumbersForDiscreteDistribution(None if job is None else job["Number of possible random numbers"])
             
 
             ### Tell me what the program read from the input file so that I know whether or not the program is doing what I expect it to be doing.
@@ -2714,75 +3416,130 @@ def main(): # This function is one of the functions that are at the highest leve
 
         
         alpha_RT_game = AlphaRTGame(InitialKineticEnergy, InitialParticleNumber, RandomDistribution, AtomicNumber, AtomicWeight, MassDensity)
+        alpha_RT_game.Seed, alpha_RT_game.AmountOfNumbers = program_admin.Seed, program_admin.AmountOfNumbers # Pass the inputs for the random number generators into the game.
 
         
         ## Make the medium. Simulate the alpha beam travelling through the tissue and depositing energy into it.
         alpha_RT_game.make_Medium()
         alpha_RT_game.initialise_Simulation(0) # Prepare the arrays, lists and other variables that are to be used in the simulation using what was defined in the class's __init__() method.
 
+        RTGame_CacheKey = result_cache.get_Key(alpha_RT_game.get_CacheInputs()) if (result_cache is not None) and (alpha_RT_game.Seed is not None) else None # The size of the beam is not part of the key because it is only used after the simulation.
+        RTGame_CachedResult = result_cache.load(RTGame_CacheKey) if RTGame_CacheKey is not None else None
+
+        if RTGame_CachedResult is not None: # The furthest x-position of each alpha particle and the energy deposit accumulators of the chunks are all that the dose needs.
+            print("The results of this simulation were found in the result cache.\n")
+            alpha_RT_game.PositionXArray, alpha_RT_game.energy_deposit_accumulators = RTGame_CachedResult
+
         ################################### Simulate the alpha particles using multiprocessing ###################################
-        if __name__ == "__main__":
-            ### Divide the number of alpha particles equally amongst all of the pooled processes that are going to be made.
-            NumOfProcesses = min(int(MaxCPUCoresToUse), alpha_RT_game.InitialParticleNumber)
-            
-            print("The simulation of the total number of alpha particles in the beam will be equally distributed to", NumOfProcesses, "pooled processes.\n")
-            
-            ProcessList = list(range(0, NumOfProcesses))
-            ProcessDict_InfoList = {process : [] for process in ProcessList}
+        elif __name__ == "__main__":
+            ### Split the alpha particles into chunks. Each chunk is a task for the pooled processes. A pooled process that finishes its chunk takes the next one, so there can be more chunks than pooled processes.
+            ProcessDict_InfoList = alpha_RT_game.split_ParticlesIntoChunks() # The indices that are going to be used to extract particles from alpha_RT_game.particle_store for each chunk. The ID of an alpha particle is its row.
+            ProcessList = list(range(0, alpha_RT_game.NumberOfChunks))
+            SeedSequences = RandomNumberAdmin.get_SeedSequences(alpha_RT_game.Seed, 1, alpha_RT_game.NumberOfChunks) # One SeedSequence per chunk. The radiotherapy game is one simulation instance.
 
-            for StartParticle in range(0, NumOfProcesses):
-                for particle in range(StartParticle, alpha_RT_game.InitialParticleNumber, NumOfProcesses):
-                    ProcessDict_InfoList[StartParticle].append(particle) # Get the indices that are going to be used to extract particles from alpha_RT_game.AlphaParticlesInfoList_ID_X_Momentum for each pooled process.
+            print("The simulation of the total number of alpha particles in the beam will be split into", alpha_RT_game.NumberOfChunks, "chunks for up to", pool_admin.NumberOfProcesses, "pooled processes.\n")
 
-                ProcessDict_InfoList[StartParticle] = np.array(ProcessDict_InfoList[StartParticle])
+            # NOTE: Before the split_ParticlesIntoChunks() method was made, there was one chunk of alpha particles per pooled process. So the random numbers of each alpha particle depended on the number of CPU cores.
+            # NumOfProcesses = min(int(MaxCPUCoresToUse), alpha_RT_game.InitialParticleNumber)
+            # print("The simulation of the total number of alpha particles in the beam will be equally distributed to", NumOfProcesses, "pooled processes.\n")
+            # ProcessList = list(range(0, NumOfProcesses))
+            # ProcessDict_InfoList = {process : [] for process in ProcessList}
+            # for StartParticle in range(0, NumOfProcesses):
+            #     for particle in range(StartParticle, alpha_RT_game.InitialParticleNumber, NumOfProcesses):
+            #         ProcessDict_InfoList[StartParticle].append(particle) # Get the indices that are going to be used to extract particles from alpha_RT_game.AlphaParticlesInfoList_ID_X_Momentum for each pooled process.
+            #     ProcessDict_InfoList[StartParticle] = np.array(ProcessDict_InfoList[StartParticle])
 
             
-            alpha_RT_game.AlphaParticlesInfoList_ID_X_Momentum_ForProcesses = {process : [] for process in ProcessList} # Initialise a dictionary for use as the iterable in the mp.Pool().map() method.
+            ChunkTasks = [(process, alpha_RT_game.particle_store.take(ProcessDict_InfoList[process]), SeedSequences[(0, process)]) for process in ProcessList] # The iterable for the imap() method. Each task only has the alpha particles and the SeedSequence of its own chunk.
+            alpha_RT_game.release_BeamArrays() # alpha_RT_game is pickled with every task, so the arrays of the whole beam are deleted first.
+            # NOTE: Before the release_BeamArrays() method was made, the particle store of every chunk, as well as that of the whole beam, was pickled with every task.
+            # alpha_RT_game.particle_store_dict = {process : [] for process in ProcessList} # Initialise a dictionary for use as the iterable in the mp.Pool().map() method.
             
-            for process in ProcessList:
-                alpha_RT_game.AlphaParticlesInfoList_ID_X_Momentum_ForProcesses[process] = alpha_RT_game.AlphaParticlesInfoList_ID_X_Momentum[ProcessDict_InfoList[process], :]
+            # for process in ProcessList:
+            #     alpha_RT_game.particle_store_dict[process] = alpha_RT_game.particle_store.take(ProcessDict_InfoList[process])
             
             
-            ### Make and run the pooled processes.
-            pool_SimulateAlphaParticles = mp.Pool(processes = NumOfProcesses)
+            ### Make the shared memory block that the pooled processes write the furthest x-position of each alpha particle into. Its size is known from the number of alpha particles in the beam.
+            alpha_RT_game.MaximumPositionsX_SharedArray = SharedMemoryAdmin.SharedArray((alpha_RT_game.InitialParticleNumber,))
 
-            PoolResult_AlphaRTGame_Particles = pool_SimulateAlphaParticles.map(alpha_RT_game.process_SimulationForAlphaParticles, ProcessList) # Each pooled process takes a subset of all the alpha particles and simulates them.
-            # PoolResult_AlphaRTGame_Particles is a list of tuples of numpy arrays: [(np.array(), np.array()), (np.array(), np.array()), (np.array(), np.array()), ...].
-
-            pool_SimulateAlphaParticles.close()
-            pool_SimulateAlphaParticles.join()
-
-            ### The mp.Pool().map() method above returns a list of NumOfProcesses tuples. Each tuple has an alpha_RT_game.PositionXArray array and an alpha_RT_game.AlphaParticleMomentumMagnitudes_List array. We must extract them from each tuple and merge them into one alpha_RT_game.PositionXArray array and one alpha_RT_game.AlphaParticleMomentumMagnitudes_List array.
-            # Initialise the numpy arrays because numpy concatenation requires that the arrays being concatenated have the same shape along the axis of concatenation.
-            alpha_RT_game.PositionXArray = PoolResult_AlphaRTGame_Particles[0][0][0:(len(PoolResult_AlphaRTGame_Particles[0][1]))] # For some reason, a row of 0's appears in this array. However, the array for the AlphaParticleMomentumMagnitudes variable has the correct shape.
-            alpha_RT_game.AlphaParticleMomentumMagnitudes = PoolResult_AlphaRTGame_Particles[0][1]
-            
-            
-            for process in range(1, NumOfProcesses):
-                ### Merge the PositionXArray arrays from all pooled processes together. We had split the total number of alpha particles amongst pooled processes. Now we are bringing them back together. The IF-ELIF statements below are for making sure that the numpy arrays being concatenated have the same shape along the axis of concatenation.
-                if PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] == alpha_RT_game.PositionXArray.shape[1]:
-                    alpha_RT_game.PositionXArray = np.concatenate((alpha_RT_game.PositionXArray, PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))]), axis = 0)
+            ### Make and run the pooled processes.
+            # NOTE: Before the PoolAdmin.py script was made, a new pool was made here and closed after the alpha particles were simulated.
+            # pool_SimulateAlphaParticles = mp.Pool(processes = NumOfProcesses)
+            # PoolResult_AlphaRTGame_Particles = pool_SimulateAlphaParticles.map(alpha_RT_game.process_SimulationForAlphaParticles, ProcessList)
+            # pool_SimulateAlphaParticles.close()
+            # pool_SimulateAlphaParticles.join()
+
+            alpha_RT_game.progress_counter = ProgressAdmin.ProgressCounter(len(ProcessList)) # The pooled processes write the progress of their chunks into shared memory, and the main process prints it.
+            PoolResult_AlphaRTGame_Particles = []
+            for chunk_result in ProgressAdmin.report_Progress(pool_admin.imap(alpha_RT_game.process_SimulationForAlphaParticles, ChunkTasks), alpha_RT_game.progress_counter, "the chunks of alpha particles"): # The results come back in the order of the chunks, as with the map() method.
+                alpha_RT_game.progress_counter.set_Progress(len(PoolResult_AlphaRTGame_Particles), 100.0)
+                PoolResult_AlphaRTGame_Particles.append(chunk_result)
+
+            alpha_RT_game.progress_counter.close()
+            alpha_RT_game.progress_counter = None
+            # NOTE: Before the ProgressAdmin.py script was made ...
+            # PoolResult_AlphaRTGame_Particles = pool_admin.map(alpha_RT_game.process_SimulationForAlphaParticles, ProcessList) # Each chunk of alpha particles is simulated by whichever pooled process is free. The map() method still gives back the results in the order of the chunks, so the momentum lost in each chunk is always added up in the same order.
+            # PoolResult_AlphaRTGame_Particles is a list of EnergyDepositAccumulator objects, one for each chunk.
+
+            ### The furthest x-positions are already in one array in the shared memory block, so PositionXArray is just a view of it. The name of the block is unlinked now because no other process needs it. The memory is freed when the main process closes the block at the end of the game.
+            MaximumPositionsX_SharedArray, alpha_RT_game.MaximumPositionsX_SharedArray = alpha_RT_game.MaximumPositionsX_SharedArray, None # Take the block out of the alpha_RT_game object so that it is not pickled again when alpha_RT_game is sent to the pooled processes of the calculate_DoseToMedium() method.
+            alpha_RT_game.PositionXArray = MaximumPositionsX_SharedArray.Array[:, np.newaxis]
+            MaximumPositionsX_SharedArray.unlink()
+
+            alpha_RT_game.energy_deposit_accumulators = PoolResult_AlphaRTGame_Particles # The calculate_DoseToMedium() method adds up the momentum lost in all of the pooled processes.
+
+            if RTGame_CacheKey is not None: # Keep the results before the dose is calculated from them.
+                result_cache.save(RTGame_CacheKey, (np.array(alpha_RT_game.PositionXArray), alpha_RT_game.energy_deposit_accumulators)) # np.array() copies the furthest x-positions out of the shared memory block.
+
+            # NOTE: Before the EnergyDepositAdmin.py script was made ...
+            # ### Merge the AlphaParticleMomentumMagnitudes arrays from all pooled processes together. The merged array is made once with the largest number of simulation steps of all of the pooled processes, and the rows of each pooled process are copied into it. Rows of pooled processes that finished in fewer simulation steps are padded with 0s, as they were when the arrays were concatenated.
+            # alpha_RT_game.AlphaParticleMomentumMagnitudes = np.zeros((sum(shared_array.Shape[0] for shared_array in PoolResult_AlphaRTGame_Particles), max(shared_array.Shape[1] for shared_array in PoolResult_AlphaRTGame_Particles)))
+            
+            # Row = 0 # The first row of the merged array that the rows of the next pooled process are copied into.
+            # for shared_array in PoolResult_AlphaRTGame_Particles: # The pooled processes are in order, so the rows are in the same order as when the arrays were concatenated.
+            #     alpha_RT_game.AlphaParticleMomentumMagnitudes[Row:(Row + shared_array.Shape[0]), 0:shared_array.Shape[1]] = shared_array.Array
+            #     Row = Row + shared_array.Shape[0]
+
+            #     shared_array.close()
+            #     shared_array.unlink()
+
+            # NOTE: Before the SharedMemoryAdmin.py script was made ... The pooled processes returned their arrays, which were pickled, and they were merged by concatenating them one pooled process at a time.
+            # PoolResult_AlphaRTGame_Particles = pool_SimulateAlphaParticles.map(alpha_RT_game.process_SimulationForAlphaParticles, ProcessList) # Each pooled process takes a subset of all the alpha particles and simulates them.
+            # # PoolResult_AlphaRTGame_Particles is a list of tuples of numpy arrays: [(np.array(), np.array()), (np.array(), np.array()), (np.array(), np.array()), ...].
+
+            # ### The mp.Pool().map() method above returns a list of NumOfProcesses tuples. Each tuple has an alpha_RT_game.PositionXArray array and an alpha_RT_game.AlphaParticleMomentumMagnitudes_List array. We must extract them from each tuple and merge them into one alpha_RT_game.PositionXArray array and one alpha_RT_game.AlphaParticleMomentumMagnitudes_List array.
+            # # Initialise the numpy arrays because numpy concatenation requires that the arrays being concatenated have the same shape along the axis of concatenation.
+            # alpha_RT_game.PositionXArray = PoolResult_AlphaRTGame_Particles[0][0][0:(len(PoolResult_AlphaRTGame_Particles[0][1]))] # For some reason, a row of 0's appears in this array. However, the array for the AlphaParticleMomentumMagnitudes variable has the correct shape.
+            # alpha_RT_game.AlphaParticleMomentumMagnitudes = PoolResult_AlphaRTGame_Particles[0][1]
+            
+            
+            # for process in range(1, NumOfProcesses):
+            #     ### Merge the PositionXArray arrays from all pooled processes together. We had split the total number of alpha particles amongst pooled processes. Now we are bringing them back together. The IF-ELIF statements below are for making sure that the numpy arrays being concatenated have the same shape along the axis of concatenation.
+            #     if PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] == alpha_RT_game.PositionXArray.shape[1]:
+            #         alpha_RT_game.PositionXArray = np.concatenate((alpha_RT_game.PositionXArray, PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))]), axis = 0)
                 
-                elif PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] < alpha_RT_game.PositionXArray.shape[1]:
-                    _ = np.concatenate((PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))], np.zeros((PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[0], alpha_RT_game.PositionXArray.shape[1] - PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1]))), axis = 1)
-                    alpha_RT_game.PositionXArray = np.concatenate((alpha_RT_game.PositionXArray, _), axis = 0)
+            #     elif PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] < alpha_RT_game.PositionXArray.shape[1]:
+            #         _ = np.concatenate((PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))], np.zeros((PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[0], alpha_RT_game.PositionXArray.shape[1] - PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1]))), axis = 1)
+            #         alpha_RT_game.PositionXArray = np.concatenate((alpha_RT_game.PositionXArray, _), axis = 0)
                 
-                elif PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] > alpha_RT_game.PositionXArray.shape[1]:
-                    _ = np.concatenate((alpha_RT_game.PositionXArray, np.zeros((alpha_RT_game.PositionXArray.shape[0], PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] - alpha_RT_game.PositionXArray.shape[1]))), axis = 1)
-                    alpha_RT_game.PositionXArray = np.concatenate((_, PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))]), axis = 0)
+            #     elif PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] > alpha_RT_game.PositionXArray.shape[1]:
+            #         _ = np.concatenate((alpha_RT_game.PositionXArray, np.zeros((alpha_RT_game.PositionXArray.shape[0], PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))].shape[1] - alpha_RT_game.PositionXArray.shape[1]))), axis = 1)
+            #         alpha_RT_game.PositionXArray = np.concatenate((_, PoolResult_AlphaRTGame_Particles[process][0][0:(len(PoolResult_AlphaRTGame_Particles[process][1]))]), axis = 0)
                 
                 
-                ### Merge the AlphaParticleMomentumMagnitudes arrays from all pooled processes together. We had split the total number of alpha particles amongst pooled processes. Now we are bringing them back together. The IF-ELIF statements below are for making sure that the numpy arrays being concatenated have the same shape along the axis of concatenation.
-                if PoolResult_AlphaRTGame_Particles[process][1].shape[1] == alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]:
-                    alpha_RT_game.AlphaParticleMomentumMagnitudes = np.concatenate((alpha_RT_game.AlphaParticleMomentumMagnitudes, PoolResult_AlphaRTGame_Particles[process][1]), axis = 0)
+            #     ### Merge the AlphaParticleMomentumMagnitudes arrays from all pooled processes together. We had split the total number of alpha particles amongst pooled processes. Now we are bringing them back together. The IF-ELIF statements below are for making sure that the numpy arrays being concatenated have the same shape along the axis of concatenation.
+            #     if PoolResult_AlphaRTGame_Particles[process][1].shape[1] == alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]:
+            #         alpha_RT_game.AlphaParticleMomentumMagnitudes = np.concatenate((alpha_RT_game.AlphaParticleMomentumMagnitudes, PoolResult_AlphaRTGame_Particles[process][1]), axis = 0)
                 
-                elif PoolResult_AlphaRTGame_Particles[process][1].shape[1] < alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]:
-                    _ = np.concatenate((PoolResult_AlphaRTGame_Particles[process][1], np.zeros((PoolResult_AlphaRTGame_Particles[process][1].shape[0], alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1] - PoolResult_AlphaRTGame_Particles[process][1].shape[1]))), axis = 1)
-                    alpha_RT_game.AlphaParticleMomentumMagnitudes = np.concatenate((alpha_RT_game.AlphaParticleMomentumMagnitudes, _), axis = 0)
+            #     elif PoolResult_AlphaRTGame_Particles[process][1].shape[1] < alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]:
+            #         _ = np.concatenate((PoolResult_AlphaRTGame_Particles[process][1], np.zeros((PoolResult_AlphaRTGame_Particles[process][1].shape[0], alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1] - PoolResult_AlphaRTGame_Particles[process][1].shape[1]))), axis = 1)
+            #         alpha_RT_game.AlphaParticleMomentumMagnitudes = np.concatenate((alpha_RT_game.AlphaParticleMomentumMagnitudes, _), axis = 0)
                 
-                elif PoolResult_AlphaRTGame_Particles[process][1].shape[1] > alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]:
-                    _ = np.concatenate((alpha_RT_game.AlphaParticleMomentumMagnitudes, np.zeros((alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[0], PoolResult_AlphaRTGame_Particles[process][1].shape[1] - alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]))), axis = 1)
-                    alpha_RT_game.AlphaParticleMomentumMagnitudes = np.concatenate((_, PoolResult_AlphaRTGame_Particles[process][1]), axis = 0)
+            #     elif PoolResult_AlphaRTGame_Particles[process][1].shape[1] > alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]:
+            #         _ = np.concatenate((alpha_RT_game.AlphaParticleMomentumMagnitudes, np.zeros((alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[0], PoolResult_AlphaRTGame_Particles[process][1].shape[1] - alpha_RT_game.AlphaParticleMomentumMagnitudes.shape[1]))), axis = 1)
+            #         alpha_RT_game.AlphaParticleMomentumMagnitudes = np.concatenate((_, PoolResult_AlphaRTGame_Particles[process][1]), axis = 0)
+
+            
 
             
         # REFERENCES:
@@ -2804,6 +3561,14 @@ def main(): # This function is one of the functions that are at the highest leve
 
         alpha_RT_game.game_Outcome(DoseToDeposit_Gy)
 
+        if alpha_RT_game.RecordDoseProfile:
+            print("Kinetic energy lost by the alpha particles =", alpha_RT_game.KineticEnergyLost_Total, "J") # The depth profile adds up to this, not to the absorbed dose.
+            alpha_RT_game.plot_DoseProfile() # Plot the Bragg curve.
+
+        if (__name__ == "__main__") and (RTGame_CachedResult is None): # Stop using the shared memory block of the furthest x-positions. The views of it must be deleted first. There is no shared memory block if the results came from the result cache.
+            alpha_RT_game.PositionXArray = None
+            MaximumPositionsX_SharedArray.close()
+
         
         # Append the timing data from the methods used above.
         if __name__ == "__main__":
@@ -2851,17 +3616,22 @@ def main(): # This function is one of the functions that are at the highest leve
         program_admin.present_AttenuationQuizDetails()
         
         ### Prepare the quiz.
-        ChosenMaterials_DF = program_admin.choose_MediaForAttenuationQuiz()
-        InitialKineticEnergy, InitialParticleNumber, RandomDistribution = program_admin.choose_AlphaBeamCharacteristicsForAttenuationQuiz()
+        quiz_random_number_generator = None # The user gets a different quiz each time, so the random standard library is used.
+        if (job is not None) and (job["Seed"] is not None): # A seeded job asks the same question each time that it is run. The "basic" probability density function gives the same kind of random numbers as random.random().
+            quiz_random_number_generator = RandomNumberAdmin.RandomNumberGenerator("basic", None, np.random.SeedSequence(job["Seed"]))
+
+        ChosenMaterials_DF = program_admin.choose_MediaForAttenuationQuiz(None if job is None else job["Number of media"], quiz_random_number_generator)
+        InitialKineticEnergy, InitialParticleNumber, RandomDistribution = program_admin.choose_AlphaBeamCharacteristicsForAttenuationQuiz(quiz_random_number_generator)
         SimInstances = 1
 
         AtomicNumber, AtomicWeight, MassDensity = 1, 1, 1 # Dummy variables just for letting the AttenuationQuiz class inherit the constructor of the AlphaParticles class. These variables are not needed in the AttenuationQuiz class.
 
         attenuation_quiz = AttenuationQuiz(InitialKineticEnergy, InitialParticleNumber, RandomDistribution, AtomicNumber, AtomicWeight, MassDensity, ChosenMaterials_DF)
+        attenuation_quiz.Seed = None if job is None else job["Seed"] # The simulation of the quiz uses a SeedSequence that is spawned from the seed, so its random numbers are not the same as those of the quiz question.
 
         ### Ask the user the quiz question.
         # attenuation_quiz.ask_QuizQuestion(program_admin.get_ChosenMaterialName())
-        attenuation_quiz.ask_QuizQuestion()
+        attenuation_quiz.ask_QuizQuestion(None if job is None else job["Medium thicknesses"], quiz_random_number_generator)
         
         ### Run the simulation and calculate the correct thickness needed to transmit the specified number of alpha particles.
         attenuation_quiz.process_Simulation(0)
@@ -2907,10 +3677,201 @@ def main(): # This function is one of the functions that are at the highest leve
         return SimDistance_Option, SimInstances, timing_studies.ExecutionTime_main_SimDistance_Option_Input, timing_studies.ExecutionTime_main_WhetherOrNotReadInputsFromFile_Input, timing_studies.ExecutionTime_program_admin_get_InputsForAlphaBeam, timing_studies.ExecutionTime_program_admin_get_InputsForMedium, timing_studies.ExecutionTime_main_SimInstances_Input, timing_studies.ExecutionTime_statistical_analyser_plot_RandomMatrixOffDiagonals_All_HistogramBins_Input, timing_studies.ExecutionTime_main_AnalyseBeam_AppendTimingResults # These variables must be used outside of the main() function by the timing_studies object.
                 
         
+def process_SimulationChunk(SimulationChunkTask): # The task of the pooled processes in the beam analysis. Each task is one chunk of alpha particles of one simulation instance, from the get_SimulationChunkTask() method of the StatisticalAnalysis class. Only the AlphaParticles object of the simulation instance, which has not been simulated, and what the chunk itself needs are pickled, so a task is small however many chunks and simulation instances there are.
+    alpha_beam, instance, chunk, AlphaParticleIDs, seed_sequence, OffDiagonalHistogram_NumberOfBins, CollectOffDiagonalElements, progress_counter, ProgressTask = SimulationChunkTask
+
+    alpha_beam.progress_counter, alpha_beam.ProgressTask = progress_counter, ProgressTask # If there is a progress counter, the chunk writes its progress into its slot of it rather than printing it.
+    alpha_beam.process_Simulation(instance, AlphaParticleIDs, seed_sequence)
+
+    return ResultAdmin.SimulationChunkResult(alpha_beam, instance, chunk, OffDiagonalHistogram_NumberOfBins, CollectOffDiagonalElements) # The chunks are put back together in the main process by a SimulationInstanceReducer object.
+
+
+def process_SweepChunk(PointAndSimulationChunkTask): # The task of the pooled processes in a parameter sweep. Each task is one chunk of one simulation instance of one point of the sweep, so the chunks of every point can share the same queue of tasks. Only the number of the point and the task from the get_SimulationChunkTask() method of its StatisticalAnalysis object are pickled, not the StatisticalAnalysis object.
+    PointNumber, SimulationChunkTask = PointAndSimulationChunkTask
+
+    return PointNumber, process_SimulationChunk(SimulationChunkTask)
+    # NOTE: Before the process_SimulationChunk() function was made ...
+    # statistical_analyser, InstanceAndChunk = StatisticalAnalyserAndChunk
+    # return statistical_analyser.SweepPoint, statistical_analyser.process_SimulationChunk(InstanceAndChunk)
+
+
+def save_SweepPoint(statistical_analyser, PointResult, PointNumber, sweep_point, CheckpointFilePath, CompletedPoints): # Calculate the ranges of a point of a parameter sweep once every simulation instance of it is done, and write them to the checkpoint file. PointResult has the SimulationInstanceResult object of each simulation instance of the point. The row of the point is also added to CompletedPoints.
+    statistical_analyser.alpha_beam_dict = PointResult
+    statistical_analyser.get_DataFromSimulationInstances()
+
+    Row = dict(sweep_point)
+    Row.update(zip(SweepAdmin.ResultColumns, (statistical_analyser.calculate_and_get_Average(statistical_analyser.MeanRanges_Dict), 3 * statistical_analyser.calculate_and_get_PopulationStandardDeviation(statistical_analyser.MeanRanges_Dict), statistical_analyser.calculate_and_get_Average(statistical_analyser.MaximumRanges_Dict), 3 * statistical_analyser.calculate_and_get_PopulationStandardDeviation(statistical_analyser.MaximumRanges_Dict))))
+    SweepAdmin.append_Checkpoint(CheckpointFilePath, Row)
+    CompletedPoints[SweepAdmin.get_PointKey(Row)] = Row
+
+    print("Point {} of the sweep is done: {}, {} MeV, {} alpha particles. Mean range = {:.4e} m. Maximum range = {:.4e} m.".format(PointNumber + 1, Row["Material"], Row["Initial kinetic energy (MeV)"], Row["Initial particle number"], Row["Mean range (m)"], Row["Maximum range (m)"]))
+
+
+def run_Sweep(job): # Run a parameter sweep of the beam analysis (see the SweepAdmin.py script). The chunks of all of the points that are not in the checkpoint file yet are put into one queue for the pool, so the pooled processes are kept busy across the points instead of waiting for the slowest simulation instance of each point in turn.
+    program_admin = ProgramAdmin()
+
+    try:
+        MaterialLibrary = [tuple(Row) for Row in program_admin.read_MaterialLibrary().iloc[:, 0:4].itertuples(index = False)] if (job.get("Materials") is not None) else []
+        SweepPoints = SweepAdmin.make_SweepPoints(job, SweepAdmin.get_Materials(job, MaterialLibrary))
+
+    except (KeyError, TypeError) as error:
+        print("Error: The media of the sweep are not formatted correctly:", error)
+        exit()
+
+    if job["Probability density function"] == "discrete":
+        program_admin.get_AmountOfNumbersForDiscreteDistribution(job["Number of possible random numbers"])
+
+    CheckpointFilePath = job.get("Checkpoint file", DirectoryToSaveTo + "SweepCheckpoint_" + timestamp + ".csv") # Without a checkpoint file of its own, a sweep cannot be continued by running it again, but the points that were done are still kept.
+    CompletedPoints = SweepAdmin.read_Checkpoint(CheckpointFilePath)
+
+    statistical_analysers = {} # The StatisticalAnalysis object of each point that is not done yet.
+    simulation_instance_reducers = {}
+    SweepTasks = []
+    PointResults = {} # The SimulationInstanceResult object of each simulation instance of each point that is not done yet.
+    CacheKeys = {}
+
+    for PointNumber, sweep_point in enumerate(SweepPoints):
+        if SweepAdmin.get_PointKey(sweep_point) in CompletedPoints:
+            continue
+
+        statistical_analyser = StatisticalAnalysis(sweep_point["Initial kinetic energy (MeV)"], sweep_point["Initial particle number"], job["Probability density function"], sweep_point["Atomic number"], sweep_point["Atomic weight (g/mol)"], sweep_point["Mass density (g/cm^3)"], 0)
+        statistical_analyser.Seed, statistical_analyser.AmountOfNumbers = sweep_point["Seed"], program_admin.AmountOfNumbers # Every point uses the same seed, so the differences between the points are not hidden by different random numbers.
+        statistical_analyser.CollectOffDiagonalElements = False # The table only has the ranges, so nothing about the off-diagonal elements is sent back.
+        statistical_analyser.SimInstances, statistical_analyser.alpha_beam_dict, statistical_analyser.MaximumRanges_Dict, statistical_analyser.ParticleNumDict_Distance_Dict, statistical_analyser.MeanRanges_Dict = 0, {}, {}, {}, {}
+        statistical_analyser.add_SimulationInstances(sweep_point["Number of simulation instances"])
+        statistical_analyser.ProgressTasks = {} # The slots of the progress counter of the chunks of this point. They are numbered once the chunks of every point are known.
+        statistical_analyser.make_SimulationChunks()
+
+        statistical_analysers[PointNumber] = statistical_analyser
+        PointResults[PointNumber] = {}
+
+        for instance in statistical_analyser.SimInstances_List:
+            CacheKeys[(PointNumber, instance)] = statistical_analyser.get_CacheKey(result_cache, instance)
+            CachedResult = result_cache.load(CacheKeys[(PointNumber, instance)]) if CacheKeys[(PointNumber, instance)] is not None else None
+
+            if CachedResult is not None: # Only the simulation instances that are not in the result cache are run.
+                PointResults[PointNumber][instance] = CachedResult
+                continue
+
+            simulation_instance_reducers[(PointNumber, instance)] = ResultAdmin.SimulationInstanceReducer(statistical_analyser.alpha_beam_dict[instance], instance, statistical_analyser.NumberOfChunks, statistical_analyser.OffDiagonalHistogram_NumberOfBins, statistical_analyser.SeedSequences[(instance, statistical_analyser.NumberOfChunks)], statistical_analyser.CollectOffDiagonalElements)
+            SweepTasks.extend((PointNumber, instance, chunk) for chunk in range(0, statistical_analyser.NumberOfChunks))
+
+        if len(PointResults[PointNumber]) == statistical_analyser.SimInstances: # The whole point was in the result cache.
+            save_SweepPoint(statistical_analysers.pop(PointNumber), PointResults.pop(PointNumber), PointNumber, sweep_point, CheckpointFilePath, CompletedPoints)
+
+    print("{} of the {} points of the sweep are already in the checkpoint file {} or the result cache. The other {} points will be split into {} chunks for up to {} pooled processes.\n".format(len(SweepPoints) - len(statistical_analysers), len(SweepPoints), CheckpointFilePath, len(statistical_analysers), len(SweepTasks), pool_admin.NumberOfProcesses))
+    SweepTasks.sort(key = lambda SweepTask : statistical_analysers[SweepTask[0]].InitialParticleNumber * statistical_analysers[SweepTask[0]].InitialKineticEnergy, reverse = True) # Start the chunks that are likely to take the longest first (more alpha particles with more energy to lose), so that the pooled processes do not wait for one long chunk at the end. sort() is stable, so the chunks of a point stay in order.
+
+    progress_counter = ProgressAdmin.ProgressCounter(len(SweepTasks)) # One slot for each chunk of every point.
+    for Task, (PointNumber, instance, chunk) in enumerate(SweepTasks):
+        statistical_analysers[PointNumber].progress_counter = progress_counter
+        statistical_analysers[PointNumber].ProgressTasks[(instance, chunk)] = Task
+
+    PointAndSimulationChunkTasks = ((PointNumber, statistical_analysers[PointNumber].get_SimulationChunkTask(instance, chunk)) for PointNumber, instance, chunk in SweepTasks) # The tasks are only made when the pool takes them.
+    for PointNumber, chunk_result in ProgressAdmin.report_Progress(pool_admin.imap_unordered(process_SweepChunk, PointAndSimulationChunkTasks), progress_counter, "the sweep"):
+        progress_counter.set_Progress(statistical_analysers[PointNumber].ProgressTasks[(chunk_result.Instance, chunk_result.Chunk)], 100.0)
+        if not simulation_instance_reducers[(PointNumber, chunk_result.Instance)].add_ChunkResult(chunk_result):
+            continue
+
+        PointResults[PointNumber][chunk_result.Instance] = simulation_instance_reducers.pop((PointNumber, chunk_result.Instance)).get_Result()
+        if CacheKeys[(PointNumber, chunk_result.Instance)] is not None:
+            result_cache.save(CacheKeys[(PointNumber, chunk_result.Instance)], PointResults[PointNumber][chunk_result.Instance])
+
+        if len(PointResults[PointNumber]) == statistical_analysers[PointNumber].SimInstances:
+            save_SweepPoint(statistical_analysers.pop(PointNumber), PointResults.pop(PointNumber), PointNumber, SweepPoints[PointNumber], CheckpointFilePath, CompletedPoints)
+
+    progress_counter.close()
+
+    SweepAdmin.save_Table(DirectoryToSaveTo + "SweepTable_" + timestamp + ".csv", [CompletedPoints[SweepAdmin.get_PointKey(sweep_point)] for sweep_point in SweepPoints])
+    print("The table of the sweep is in {}.".format(DirectoryToSaveTo))
+
+
+def run_Jobs(Jobs, StopOnError = False): # Run the jobs of a job spec file one after the other in this process. Every job uses the same pool of processes. Each job saves its files into its own folder inside the folder of this run of the program. This function gives back the exit code of the program rather than exiting, so that one job that fails does not stop the others.
+    global DirectoryToSaveTo # The methods of the classes save their files into the folder named by this global variable.
+    DirectoryToSaveTo_Batch = DirectoryToSaveTo
+    ExitCode = BatchAdmin.ExitCode_Success
+    JobSummaries = []
+
+    for JobNumber, job in enumerate(Jobs):
+        DirectoryToSaveTo = DirectoryToSaveTo_Batch + "{}_{}/".format(JobNumber + 1, job["name"])
+        os.makedirs(DirectoryToSaveTo, exist_ok = True)
+
+        print("#" * 100)
+        print("Job {} of {}: {}".format(JobNumber + 1, len(Jobs), job["name"]))
+        print("#" * 100)
+
+        start_Job = time.time()
+        try:
+            if job["mode"] == "s":
+                run_Sweep(job)
+
+            else:
+                main(job)
+
+            ExitCode_Job = BatchAdmin.ExitCode_Success
+
+        except SystemExit: # The checks of the inputs tell the user what is wrong and then use exit(), which raises SystemExit.
+            ExitCode_Job = BatchAdmin.ExitCode_JobFailed
+
+        except Exception:
+            traceback.print_exc()
+            ExitCode_Job = BatchAdmin.ExitCode_JobFailed
+
+            pool_admin.terminate() # The pooled processes may still be running tasks of the job that failed. Make a new pool rather than letting the next job wait for them.
+            pool_admin.make_Pool()
+
+        plt.close("all") # The figures of the job have been saved. Without this, the figures of every job would be kept in memory until the program exits.
+        JobSummaries.append((JobNumber + 1, job["name"], job["mode"], ExitCode_Job, time.time() - start_Job))
+
+        if ExitCode_Job != BatchAdmin.ExitCode_Success:
+            print("Error: Job {} ({}) failed.".format(JobNumber + 1, job["name"]))
+            ExitCode = ExitCode_Job
+
+            if StopOnError:
+                break
+
+        print()
+
+    DirectoryToSaveTo = DirectoryToSaveTo_Batch
+    BatchAdmin.save_JobSummary(DirectoryToSaveTo + "JobSummary_" + timestamp + ".txt", JobSummaries)
+    print("{} of {} jobs succeeded. Please check the outputted files. They are in a folder named {} in the same directory as the program file.".format(sum(1 for JobSummary in JobSummaries if JobSummary[3] == BatchAdmin.ExitCode_Success), len(Jobs), DirectoryToSaveTo))
+
+    return ExitCode
+
+    # REFERENCES:
+        # Python Software Foundation (2020). sys.exit, https://docs.python.org/3/library/sys.html#sys.exit.
+        # Python Software Foundation (2020). traceback — Print or retrieve a stack traceback, https://docs.python.org/3/library/traceback.html.
+        # Hunter, J., Dale, D., Firing, E., Droettboom, M., & The Matplotlib development team. (2020). matplotlib.pyplot.close, https://matplotlib.org/api/_as_gen/matplotlib.pyplot.close.html.
+
+
 if __name__ == "__main__": # This IF statement allows the program to be run by Python only if it is called by Python directly. The program will not run if it is called within another Python program.
     timing_studies.end_FunctionDefinition_main = time.time()
     timing_studies.append_TimingResults("main() function definition", timing_studies.end_FunctionDefinition_main - timing_studies.start_FunctionDefinition_main, "Once")
     
+    ### Make the pool of processes that every mode of the program uses. It is made here, after all of the classes have been defined, because processes started with the "fork" start method only know about what was defined before they were started. The processes start while the user is answering the questions in main().
+    Arguments = BatchAdmin.get_Arguments() # Without arguments, the program asks its questions in the command terminal as before.
+
+    PoolStartMethod = Arguments.StartMethod # None uses the default start method of the operating system. "fork", "spawn" or "forkserver" can be used instead.
+    if Arguments.NumberOfProcesses is not None:
+        MaxCPUCoresToUse = Arguments.NumberOfProcesses
+
+    pool_admin = PoolAdmin.PoolAdmin(MaxCPUCoresToUse, PoolStartMethod)
+    pool_admin.make_Pool()
+
+    result_cache = None if Arguments.NoCache else CacheAdmin.ResultCache(Arguments.CacheDirectory, Arguments.CacheSize_MB, CacheAdmin.get_CodeVersion(os.path.dirname(os.path.abspath(__file__)))) # The results of seeded simulations are kept between runs of the program. See the CacheAdmin.py script.
+
+    if Arguments.JobSpecFile is not None: # Run the jobs of the job spec file without asking any questions.
+        try:
+            Jobs = BatchAdmin.read_JobSpec(Arguments.JobSpecFile)
+
+        except BatchAdmin.JobSpecError as error:
+            print("Error:", error)
+            sys.exit(BatchAdmin.ExitCode_JobSpecError)
+
+        BatchAdmin.disable_Inputs()
+        plt.switch_backend("Agg") # The figures are only saved, so no display is needed.
+        sys.exit(run_Jobs(Jobs, Arguments.StopOnError)) # The pool is closed by the pool_admin object when the program exits.
+
     timing_studies.start_main = time.time()
     # NOTE: The main() function is called in the next line.
     SimDistance_Option, SimInstances, timing_studies.ExecutionTime_main_SimDistance_Option_Input, timing_studies.ExecutionTime_main_WhetherOrNotReadInputsFromFile_Input, timing_studies.ExecutionTime_program_admin_get_InputsForAlphaBeam, timing_studies.ExecutionTime_program_admin_get_InputsForMedium, timing_studies.ExecutionTime_main_SimInstances_Input, timing_studies.ExecutionTime_statistical_analyser_plot_RandomMatrixOffDiagonals_All_HistogramBins_Input, timing_studies.ExecutionTime_main_AnalyseBeam_AppendTimingResults = main() # The SimInstances variable must be used by the timing_studies object, which is outside of the main() funciton. Here is where code actually starts to be *executed*. The key to running the program is that the program's __name__ must be "__main__".
@@ -0,0 +1,189 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program lets the Alpha Particles 2.0 program run without a person at the command terminal, e.g., on a computer that runs many simulations one after the other. Before this program was made, every mode of the program asked its questions with input(). Now the program can be given a job spec file with the --jobs argument. The file has a list of jobs, and each job has the mode of the program and the same inputs that the InputsForBeamAnalysis.txt and InputsForRTGame.txt files have. The inputs of each job are turned into the lines of those input files, so they are read and checked by the same get_InputsForBeamAnalysisFromFile() and get_InputsForRTGameFromFile() methods of the ProgramAdmin class as when the user reads the inputs from the files.
+# The job spec file can be a JSON file or a TOML file. A JSON job spec file looks like this:
+# {"jobs" : [{"name" : "Hydrogen", "mode" : "a", "Initial kinetic energy of the alpha particles" : 1e-4, "Initial particle number" : 20, "Probability density function" : "basic", "Whether or not to seed" : "y", "Seed" : 0, "Atomic number of the medium" : 1, "Atomic weight of the medium" : 1, "Mass density of the medium" : 1, "Number of simulation instances" : 2},
+#            {"name" : "Tissue", "mode" : "g", "Initial kinetic energy of the alpha particles" : 1e-4, "Initial particle number" : 50, "Probability density function" : "basic", "Whether or not to seed" : "y", "Seed" : 0, "Beam height" : 1, "Beam width" : 1},
+#            {"name" : "Quiz", "mode" : "q", "Number of media" : 2, "Medium thicknesses" : [1e-9, 1e-9], "Seed" : 0}]}
+# The units are the same as in the input files (MeV, g/mol, g/cm^3, cm and m), but they are not written in the job spec file.
+# A quiz job can have a "Seed". Then the materials, the alpha particle beam and the transmission fraction of the quiz question, as well as the simulation of the quiz, are the same every time that the job is run.
+# A job can also be a parameter sweep of the beam analysis with the mode "s". See the SweepAdmin.py script.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The BatchAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the BatchAdmin program needs.
+import argparse
+import json
+import os
+import sys
+
+try: # tomllib is only in the standard library from Python 3.11. tomli is the same module for older versions of Python. Without either of them, only JSON job spec files can be read.
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# REFERENCES:
+    # Python Software Foundation (2020). argparse — Parser for command-line options, arguments and sub-commands, https://docs.python.org/3/library/argparse.html.
+    # Python Software Foundation (2020). json — JSON encoder and decoder, https://docs.python.org/3/library/json.html.
+    # Python Software Foundation (2022). tomllib — Parse TOML files, https://docs.python.org/3/library/tomllib.html.
+
+# The exit codes of the program when it runs a job spec file.
+ExitCode_Success = 0
+ExitCode_JobFailed = 1 # At least one job failed. The other jobs were still run, unless --stop-on-error was used.
+ExitCode_JobSpecError = 2 # The job spec file could not be read. No job was run. argparse uses the same exit code when the arguments are wrong.
+
+Modes = {"a" : "a", "beam analysis" : "a", "g" : "g", "radiotherapy game" : "g", "q" : "q", "attenuation quiz" : "q", "s" : "s", "sweep" : "s"} # The names that a job can give its mode, and the answer to the first question of the main() function that each name stands for. "s" is not a question of the main() function. It is run by the run_Sweep() function instead.
+
+# The lines of the InputsForBeamAnalysis.txt and InputsForRTGame.txt files, in order. Each line is (key in the job spec file, unit written after the value in the input file). The keys are the text before the "= " of the lines.
+InputFileLines_BeamAnalysis = (("Initial kinetic energy of the alpha particles", " MeV"), ("Initial particle number", ""), ("Probability density function", ""), ("Whether or not to seed", ""), ("Seed", ""), ("Atomic number of the medium", ""), ("Atomic weight of the medium", " g/mol"), ("Mass density of the medium", " g/cm^3"), ("Number of simulation instances", ""))
+InputFileLines_RTGame = (("Initial kinetic energy of the alpha particles", " MeV"), ("Initial particle number", ""), ("Probability density function", ""), ("Whether or not to seed", ""), ("Seed", ""), ("Beam height", " cm"), ("Beam width", " cm"))
+
+class JobSpecError(Exception): # The job spec file, or one of its jobs, is not formatted correctly.
+    pass
+
+
+def get_Arguments(ArgumentList = None): # Read the command-line arguments. ArgumentList is None for the arguments that the program was run with.
+    argument_parser = argparse.ArgumentParser(description = "Alpha Particles 2.0. Without arguments, the program asks its questions in the command terminal.")
+    argument_parser.add_argument("--jobs", dest = "JobSpecFile", default = None, help = "a JSON (.json) or TOML (.toml) file of jobs to run one after the other without asking any questions")
+    argument_parser.add_argument("--processes", dest = "NumberOfProcesses", type = int, default = None, help = "the number of pooled processes (default: the number of physical CPU cores minus 1)")
+    argument_parser.add_argument("--start-method", dest = "StartMethod", choices = ["fork", "spawn", "forkserver"], default = None, help = "the start method of the pooled processes (default: the default start method of the operating system)")
+    argument_parser.add_argument("--stop-on-error", dest = "StopOnError", action = "store_true", help = "do not run the rest of the jobs after a job fails")
+    argument_parser.add_argument("--cache-dir", dest = "CacheDirectory", default = "ResultCache/", help = "the folder of the results of seeded simulations that are kept so that they are not simulated again (default: ResultCache/)")
+    argument_parser.add_argument("--cache-size", dest = "CacheSize_MB", type = float, default = 500, help = "the maximum size of the result cache, in MB. The least recently used results are deleted first (default: 500)")
+    argument_parser.add_argument("--no-cache", dest = "NoCache", action = "store_true", help = "simulate everything again without reading or writing the result cache")
+
+    return argument_parser.parse_args(ArgumentList)
+
+    # REFERENCES:
+        # Python Software Foundation (2020). argparse.ArgumentParser.add_argument, https://docs.python.org/3/library/argparse.html#the-add-argument-method.
+
+
+def read_JobSpec(FilePath): # Read the jobs from a job spec file and check that each of them has what its mode needs. Each job is given back as a dictionary with its name and mode as well as its inputs.
+    try:
+        if FilePath.lower().endswith(".toml"):
+            if tomllib is None:
+                raise JobSpecError("TOML job spec files need Python 3.11 or the tomli module. Please use a JSON job spec file instead.")
+
+            with open(FilePath, "rb") as JobSpecFile: # tomllib only reads binary files.
+                JobSpec = tomllib.load(JobSpecFile)
+
+        else:
+            with open(FilePath, "r") as JobSpecFile:
+                JobSpec = json.load(JobSpecFile)
+
+    except OSError as error:
+        raise JobSpecError("The job spec file '{}' could not be read: {}".format(FilePath, error))
+
+    except ValueError as error: # Both json.JSONDecodeError and tomllib.TOMLDecodeError are ValueErrors.
+        raise JobSpecError("The job spec file '{}' is not formatted correctly: {}".format(FilePath, error))
+
+    if (not isinstance(JobSpec, dict)) or (not isinstance(JobSpec.get("jobs"), list)) or (len(JobSpec["jobs"]) == 0):
+        raise JobSpecError("The job spec file must have a list of at least one job named 'jobs'.")
+
+    return [check_Job(job, JobNumber) for JobNumber, job in enumerate(JobSpec["jobs"])]
+
+
+def check_Job(job, JobNumber): # Check what the main() function cannot check itself because it would otherwise have asked the user for it. The inputs that are also in the input files are checked by the main() function.
+    if not isinstance(job, dict):
+        raise JobSpecError("Job {} must be a table of inputs.".format(JobNumber + 1))
+
+    job = dict(job) # Do not change the job spec that was given.
+    job["name"] = "".join(Character if (Character.isalnum() or Character in "-_.") else "_" for Character in str(job.get("name", "Job"))) # The name is used for the folder of the outputted files of the job.
+
+    if str(job.get("mode", "")).lower() not in Modes:
+        raise JobSpecError("Job {} ({}) must have a mode. The options are: {}.".format(JobNumber + 1, job["name"], ", ".join(Modes)))
+
+    job["mode"] = Modes[str(job["mode"]).lower()]
+
+    if job["mode"] in set(["a", "g"]):
+        job.setdefault("Seed", 0) # The input files always have a seed, even if it is not used.
+
+        for Key, _ in (InputFileLines_BeamAnalysis if job["mode"] == "a" else InputFileLines_RTGame):
+            if Key not in job:
+                raise JobSpecError("Job {} ({}) does not have the input '{}'.".format(JobNumber + 1, job["name"], Key))
+
+        if (job["mode"] == "a") and (job["Number of simulation instances"] == 0) and ("Target relative uncertainty" not in job):
+            raise JobSpecError("Job {} ({}) has 0 simulation instances, so it needs the input 'Target relative uncertainty'.".format(JobNumber + 1, job["name"]))
+
+        if (job["Probability density function"] == "discrete") and (not is_IntegerAtLeast(job.get("Number of possible random numbers"), 2)):
+            raise JobSpecError("Job {} ({}) uses the discrete probability density function, so it needs the input 'Number of possible random numbers', an integer greater than 1.".format(JobNumber + 1, job["name"]))
+
+        if (job["mode"] == "a") and (not is_IntegerAtLeast(job.setdefault("Number of bins of the histograms", 500), 1)): # The same default as when the user does not give a valid number of bins.
+            raise JobSpecError("Job {} ({}) must have an integer greater than 0 for 'Number of bins of the histograms'.".format(JobNumber + 1, job["name"]))
+
+    elif job["mode"] == "s":
+        job.setdefault("Seed", 0)
+
+        for Key in ("Initial kinetic energies", "Initial particle numbers"):
+            if (not isinstance(job.get(Key), list)) or (len(job[Key]) == 0) or (not all(isinstance(Value, (int, float)) and (Value > 0) for Value in job[Key])):
+                raise JobSpecError("Job {} ({}) must have a list of numbers greater than 0 for '{}'.".format(JobNumber + 1, job["name"], Key))
+
+        if not all(is_IntegerAtLeast(Value, 1) for Value in job["Initial particle numbers"]):
+            raise JobSpecError("Job {} ({}) must have a list of integers greater than 0 for 'Initial particle numbers'.".format(JobNumber + 1, job["name"]))
+
+        if ("Materials" not in job) and (not all(isinstance(job.get(Key), list) and (len(job[Key]) > 0) for Key in ("Atomic numbers", "Atomic weights", "Mass densities"))):
+            raise JobSpecError("Job {} ({}) must have either 'Materials' or lists of 'Atomic numbers', 'Atomic weights' and 'Mass densities'.".format(JobNumber + 1, job["name"]))
+
+        if (job.get("Probability density function") not in set(["basic", "discrete", "triangular", "uniform"])) or (job.get("Whether or not to seed") not in set(["y", "Y", "n", "N"])) or (not isinstance(job["Seed"], int)) or (job["Seed"] < 0):
+            raise JobSpecError("Job {} ({}) must have a valid 'Probability density function', 'Whether or not to seed' and 'Seed', as in the input files.".format(JobNumber + 1, job["name"]))
+
+        if not is_IntegerAtLeast(job.get("Number of simulation instances"), 1):
+            raise JobSpecError("Job {} ({}) must have an integer greater than 0 for 'Number of simulation instances'.".format(JobNumber + 1, job["name"]))
+
+        if (job["Probability density function"] == "discrete") and (not is_IntegerAtLeast(job.get("Number of possible random numbers"), 2)):
+            raise JobSpecError("Job {} ({}) uses the discrete probability density function, so it needs the input 'Number of possible random numbers', an integer greater than 1.".format(JobNumber + 1, job["name"]))
+
+    elif job["mode"] == "q":
+        if not is_IntegerAtLeast(job.get("Number of media"), 1):
+            raise JobSpecError("Job {} ({}) must have an integer greater than 0 for 'Number of media'.".format(JobNumber + 1, job["name"]))
+
+        if (not isinstance(job.get("Medium thicknesses"), list)) or (len(job["Medium thicknesses"]) < job["Number of media"]):
+            raise JobSpecError("Job {} ({}) must have a list of at least 'Number of media' thicknesses, in m, for 'Medium thicknesses'.".format(JobNumber + 1, job["name"]))
+
+        job.setdefault("Seed", None) # Without a seed, the quiz asks a different question each time that it is run, as when the user runs it.
+
+        if (job["Seed"] is not None) and (not is_IntegerAtLeast(job["Seed"], 0)):
+            raise JobSpecError("Job {} ({}) must have an integer that is at least 0 for 'Seed', or no 'Seed'.".format(JobNumber + 1, job["name"]))
+
+    return job
+
+
+def is_IntegerAtLeast(Value, Minimum):
+    return isinstance(Value, int) and (not isinstance(Value, bool)) and (Value >= Minimum)
+
+
+def get_InputFileLines(job): # The lines of the input file that the inputs of the job would have been in.
+    if job["mode"] == "a":
+        InputFileLines = ["{} = {}{}\n".format(Key, job[Key], Unit) for Key, Unit in InputFileLines_BeamAnalysis]
+
+        if "Target relative uncertainty" in job:
+            InputFileLines.append("Target relative uncertainty = {}\n".format(job["Target relative uncertainty"]))
+
+        return InputFileLines
+
+    return ["{} = {}{}\n".format(Key, job[Key], Unit) for Key, Unit in InputFileLines_RTGame]
+
+
+def disable_Inputs(): # Any question that the program still asks gets an empty answer straight away instead of waiting forever for an answer that will not come. input() raises an EOFError, which the program treats as an invalid answer.
+    sys.stdin = open(os.devnull, "r")
+
+    # REFERENCES:
+        # Python Software Foundation (2020). input, https://docs.python.org/3/library/functions.html#input.
+
+
+def save_JobSummary(FilePath, JobSummaries): # Write one line for each job that was run: its number, name, mode, exit code and execution time.
+    with open(FilePath, "w") as SummaryFile:
+        SummaryFile.write("Job, Name, Mode, Exit code, Execution time (s)\n")
+
+        for JobSummary in JobSummaries:
+            SummaryFile.write("{}, {}, {}, {}, {}\n".format(*JobSummary))
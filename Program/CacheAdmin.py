@@ -0,0 +1,148 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program keeps the results of the simulations of the Alpha Particles 2.0 program on the disk so that they do not have to be simulated again. Before this program was made, every run of the program simulated everything from scratch, even if the same inputs and seed had been simulated before, because each run saves its files into a new Data_<timestamp>/ folder that is never read again.
+# Each result is saved in its own file in the cache folder. The name of the file is the SHA-256 hash of the inputs that decide the result (e.g., the initial kinetic energy, the initial particle number, the probability density function, the medium, the seed and the simulation instance), written in the same way every time, together with a hash of the source code of the program. So a result is found again only if it was made from the same inputs by the same code, and changing any script of the program makes a new set of results.
+# Only seeded simulations are kept, because a simulation without a seed gives different results every time. The beam analysis keeps one file per simulation instance, and the random numbers of a simulation instance do not depend on how many simulation instances are run, so a run with more simulation instances than before only simulates the ones that are missing.
+# The cache folder is kept below a maximum size. When it is larger, the files that were used least recently are deleted first. A file is marked as used by updating its modification time whenever it is read.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The CacheAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the CacheAdmin program needs.
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import numpy as np
+
+# REFERENCES:
+    # Python Software Foundation (2020). hashlib — Secure hashes and message digests, https://docs.python.org/3/library/hashlib.html.
+    # Python Software Foundation (2020). pickle — Python object serialization, https://docs.python.org/3/library/pickle.html.
+    # Python Software Foundation (2020). tempfile — Generate temporary files and directories, https://docs.python.org/3/library/tempfile.html.
+
+CacheFileExtension = ".pkl"
+
+def get_CodeVersion(ProgramDirectory): # A hash of every script of the program. It is part of the key of every result, so the results of an older version of the program are not used.
+    code_hash = hashlib.sha256()
+
+    for FilePath in sorted(glob.glob(os.path.join(ProgramDirectory, "*.py"))):
+        code_hash.update(os.path.basename(FilePath).encode())
+        with open(FilePath, "rb") as ScriptFile:
+            code_hash.update(ScriptFile.read())
+
+    return code_hash.hexdigest()
+
+
+def normalise_Input(Value): # Write an input in the same way every time. numpy numbers and arrays are turned into Python numbers and lists, which the json module can write.
+    if isinstance(Value, np.ndarray):
+        return Value.tolist()
+
+    if isinstance(Value, np.generic):
+        return Value.item()
+
+    return Value
+
+
+class ResultCache:
+    def __init__(self, DirectoryPath, MaximumSize_MB, CodeVersion):
+        self.DirectoryPath = DirectoryPath
+        self.MaximumSize_Bytes = int(MaximumSize_MB * 1e6)
+        self.CodeVersion = CodeVersion
+
+        os.makedirs(self.DirectoryPath, exist_ok = True)
+
+
+    def get_Key(self, Inputs): # Inputs is a dictionary of the inputs that decide the result. The order of its keys does not matter.
+        InputsText = json.dumps({"Code version" : self.CodeVersion, "Inputs" : {Name : normalise_Input(Value) for Name, Value in Inputs.items()}}, sort_keys = True, default = normalise_Input)
+
+        return hashlib.sha256(InputsText.encode()).hexdigest()
+
+        # REFERENCES:
+            # Python Software Foundation (2020). json.dumps, https://docs.python.org/3/library/json.html#json.dumps.
+
+
+    def get_FilePath(self, Key):
+        return os.path.join(self.DirectoryPath, Key + CacheFileExtension)
+
+
+    def load(self, Key): # Give back the result with this key, or None if there is no such result.
+        FilePath = self.get_FilePath(Key)
+
+        try:
+            with open(FilePath, "rb") as CacheFile:
+                Result = pickle.load(CacheFile)
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError): # The file is damaged or was made by a different version of the program. Simulate the result again instead.
+            self.remove(FilePath)
+            return None
+
+        try:
+            os.utime(FilePath) # Mark the result as the most recently used one.
+        except OSError: # The file may have been deleted by another run of the program in the meantime.
+            pass
+
+        return Result
+
+        # REFERENCES:
+            # Python Software Foundation (2020). os.utime, https://docs.python.org/3/library/os.html#os.utime.
+
+
+    def save(self, Key, Result): # Keep a result. The result is written to a temporary file first and then renamed, so another run of the program never reads a file that is only partly written.
+        FileDescriptor, TemporaryFilePath = tempfile.mkstemp(dir = self.DirectoryPath, suffix = ".tmp")
+
+        try:
+            with os.fdopen(FileDescriptor, "wb") as CacheFile:
+                pickle.dump(Result, CacheFile, protocol = pickle.HIGHEST_PROTOCOL)
+
+            os.replace(TemporaryFilePath, self.get_FilePath(Key))
+
+        except OSError as error: # The cache only saves time, so a result that cannot be kept does not stop the program.
+            print("Warning: The result could not be saved in the result cache:", error)
+            self.remove(TemporaryFilePath)
+            return
+
+        self.remove_LeastRecentlyUsed()
+
+        # REFERENCES:
+            # Python Software Foundation (2020). os.replace, https://docs.python.org/3/library/os.html#os.replace.
+
+
+    def remove(self, FilePath):
+        try:
+            os.remove(FilePath)
+        except OSError:
+            pass
+
+
+    def remove_LeastRecentlyUsed(self): # Delete the least recently used results until the cache folder is no larger than its maximum size.
+        CacheFiles = []
+        for dir_entry in os.scandir(self.DirectoryPath):
+            if dir_entry.name.endswith(CacheFileExtension):
+                try:
+                    file_stat = dir_entry.stat()
+                except OSError:
+                    continue
+
+                CacheFiles.append((file_stat.st_mtime, file_stat.st_size, dir_entry.path))
+
+        TotalSize_Bytes = sum(CacheFile[1] for CacheFile in CacheFiles)
+        for _, FileSize_Bytes, FilePath in sorted(CacheFiles): # The oldest modification time is the least recently used result.
+            if TotalSize_Bytes <= self.MaximumSize_Bytes:
+                break
+
+            self.remove(FilePath)
+            TotalSize_Bytes = TotalSize_Bytes - FileSize_Bytes
+
+        # REFERENCES:
+            # Python Software Foundation (2020). os.scandir, https://docs.python.org/3/library/os.html#os.scandir.
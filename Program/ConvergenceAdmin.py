@@ -0,0 +1,82 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program decides when the beam analysis of the Alpha Particles 2.0 program has run enough simulation instances. Before this program was made, the user had to choose the number of simulation instances before the simulation started, and the average and standard deviation of the results were only calculated after every simulation instance had finished. Now the user can give a target relative uncertainty instead. The mean and standard deviation of the mean range and the maximum range are updated with Welford's algorithm as the simulation instances finish, and more simulation instances are run until 3 standard errors of the mean of both ranges are less than the target fraction of their means.
+# The 3 is the same number of standard deviations that the data file uses for the uncertainties of the ranges. The standard error of the mean (the standard deviation divided by the square root of the number of simulation instances) is used rather than the standard deviation itself because the standard deviation of the ranges of the simulation instances does not get smaller when more simulation instances are run, but the uncertainty of their average does.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The ConvergenceAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the ConvergenceAdmin program needs.
+import math
+
+# REFERENCES:
+    # Python Software Foundation (2020). math — Mathematical functions, https://docs.python.org/3/library/math.html.
+
+class RunningStatistics: # The mean and standard deviation of a quantity that are updated one value at a time, without keeping the values.
+    def __init__(self):
+        self.NumberOfValues = 0
+        self.Mean = 0.0
+        self.SumOfSquaredDifferences = 0.0 # The sum of the squared differences between the values and their mean so far.
+
+
+    def add(self, Value): # Welford's algorithm. Updating the mean and the sum of squared differences in this way does not lose precision when the values are much larger than their spread, as the ranges are.
+        self.NumberOfValues = self.NumberOfValues + 1
+        Difference_OldMean = Value - self.Mean
+        self.Mean = self.Mean + Difference_OldMean / self.NumberOfValues
+        self.SumOfSquaredDifferences = self.SumOfSquaredDifferences + Difference_OldMean * (Value - self.Mean)
+
+        # REFERENCES:
+            # Welford, B P (1962). Note on a Method for Calculating Corrected Sums of Squares and Products. Technometrics, 4(3), 419-420.
+
+
+    def get_PopulationStandardDeviation(self): # The same as statistics.pstdev() of all of the values so far.
+        if self.NumberOfValues == 0:
+            return 0.0
+
+        return math.sqrt(self.SumOfSquaredDifferences / self.NumberOfValues)
+
+
+    def get_StandardErrorOfMean(self): # The standard deviation of the values (with Bessel's correction) divided by the square root of the number of values. At least 2 values are needed.
+        if self.NumberOfValues < 2:
+            return math.inf
+
+        return math.sqrt(self.SumOfSquaredDifferences / (self.NumberOfValues - 1) / self.NumberOfValues)
+
+
+    def get_RelativeUncertainty(self, NumberOfStandardErrors = 3): # The uncertainty of the mean as a fraction of the mean.
+        if self.Mean == 0.0:
+            return math.inf
+
+        return NumberOfStandardErrors * self.get_StandardErrorOfMean() / abs(self.Mean)
+
+
+class ConvergenceMonitor: # Keeps the running statistics of the mean range and the maximum range of the simulation instances and decides whether they have converged.
+    def __init__(self, TargetRelativeUncertainty, MinimumNumberOfInstances = 3, NumberOfStandardErrors = 3):
+        self.TargetRelativeUncertainty = TargetRelativeUncertainty # e.g., 0.01 means that the uncertainty must be at most 1% of the mean.
+        self.MinimumNumberOfInstances = max(int(MinimumNumberOfInstances), 2) # The standard error of the mean cannot be estimated from 1 simulation instance, and it is not trustworthy from very few.
+        self.NumberOfStandardErrors = NumberOfStandardErrors
+
+        self.MeanRange_Statistics = RunningStatistics()
+        self.MaximumRange_Statistics = RunningStatistics()
+
+
+    def add_SimulationInstance(self, MeanRange, MaximumRange):
+        self.MeanRange_Statistics.add(MeanRange)
+        self.MaximumRange_Statistics.add(MaximumRange)
+
+
+    def get_RelativeUncertainties(self):
+        return self.MeanRange_Statistics.get_RelativeUncertainty(self.NumberOfStandardErrors), self.MaximumRange_Statistics.get_RelativeUncertainty(self.NumberOfStandardErrors)
+
+
+    def is_Converged(self): # Both ranges must have converged.
+        if self.MeanRange_Statistics.NumberOfValues < self.MinimumNumberOfInstances:
+            return False
+
+        return max(self.get_RelativeUncertainties()) <= self.TargetRelativeUncertainty
@@ -0,0 +1,184 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program keeps track of the momentum that the alpha particles lose to the electrons in the medium for the radiotherapy game of the Alpha Particles 2.0 program. Before this program was made, the momentum magnitude of each alpha particle was concatenated onto the AlphaParticleMomentumMagnitudes array at every simulation step, and a pool of processes summed the differences between its columns after the simulation. The sum of the differences between consecutive columns is just the sum of the first column minus the sum of the last column, so the momentum lost can be added up during the simulation instead, one simulation step at a time.
+# The momentum and kinetic energy that the alpha particles lose can also be put into depth bins (DepthHistogram) during the simulation. The kinetic energy lost in each depth bin gives the kinetic energy deposited per unit mass as a function of depth, i.e., the Bragg curve, without keeping the trajectories of the alpha particles.
+# NOTE: The kinetic energy deposit is not the absorbed dose of the radiotherapy game. The absorbed dose is calculated from the total momentum transferred, (Total momentum lost)^2 / (2 * Electron mass), which cannot be split into depth bins because the square of a sum is not the sum of the squares. The kinetic energy lost, (p_before^2 - p_after^2) / (2 * Alpha mass), can be split into depth bins, so the depth profile is of the kinetic energy lost. The KineticEnergyLost_Total running sum is kept so that the depth profile can be checked against a scalar of the same definition.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The EnergyDepositAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the EnergyDepositAdmin program needs.
+import copy
+import numpy as np
+
+# REFERENCES:
+    # Python Software Foundation (2020). copy — Shallow and deep copy operations, https://docs.python.org/3/library/copy.html.
+    # NumPy. (2020). NumPy v1.19.0. Retrieved from https://numpy.org/
+
+class DepthHistogram: # A histogram of something (e.g. kinetic energy lost) as a function of depth. The bins are either fixed (DepthBinEdges) or adaptive (BinWidth). An adaptive histogram starts with NumberOfBins bins of width BinWidth from a depth of 0 and doubles the width of its bins whenever something is added deeper than its last bin, so it always has NumberOfBins bins however far the alpha particles travel.
+    def __init__(self, DepthBinEdges = None, BinWidth = None, NumberOfBins = 100):
+        if DepthBinEdges is not None:
+            self.Adaptive = False
+            self.DepthBinEdges = np.array(DepthBinEdges, dtype = float)
+            self.Counts = np.zeros(self.DepthBinEdges.shape[0] - 1)
+
+        elif BinWidth is not None:
+            self.Adaptive = True
+            self.BinWidth = float(BinWidth) # Units: m.
+            self.NumberOfBins = int(NumberOfBins) + int(NumberOfBins) % 2 # The number of bins must be even so that pairs of bins can be merged when the bins are made wider.
+            self.Counts = np.zeros(self.NumberOfBins)
+
+        else:
+            print("Error: A depth histogram needs either bin edges or a bin width. The program will now exit.")
+            exit()
+
+
+    def make_BinsWider(self): # Merge each pair of neighbouring bins into one bin of twice the width. The bins in the second half of the histogram are then empty.
+        self.Counts = np.concatenate((self.Counts.reshape(-1, 2).sum(axis = 1), np.zeros(self.NumberOfBins // 2)))
+        self.BinWidth = 2 * self.BinWidth
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.reshape, https://numpy.org/doc/stable/reference/generated/numpy.reshape.html.
+
+
+    def add(self, PositionsX, Weights): # Add each weight to the bin that its x-position is in. x-positions outside fixed bin edges are put into the first or last bin.
+        if PositionsX.shape[0] == 0:
+            return
+
+        if self.Adaptive:
+            while PositionsX.max() >= self.NumberOfBins * self.BinWidth: # Make the bins wider until the deepest x-position fits.
+                self.make_BinsWider()
+
+            Bins = np.clip((PositionsX // self.BinWidth).astype(int), 0, self.NumberOfBins - 1)
+
+        else:
+            Bins = np.clip(np.searchsorted(self.DepthBinEdges, PositionsX, side = "right") - 1, 0, self.Counts.shape[0] - 1)
+
+        self.Counts = self.Counts + np.bincount(Bins, weights = Weights, minlength = self.Counts.shape[0]) # np.bincount() adds up all of the weights that fall into the same bin, which plain fancy indexing with += would not do.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.bincount, https://numpy.org/doc/stable/reference/generated/numpy.bincount.html.
+            # The SciPy community (2020). numpy.searchsorted, https://numpy.org/doc/stable/reference/generated/numpy.searchsorted.html.
+
+
+    def get_DepthBinEdges(self):
+        if self.Adaptive:
+            return np.arange(0, self.NumberOfBins + 1) * self.BinWidth
+
+        return self.DepthBinEdges
+
+
+def merge_DepthHistograms(depth_histograms): # Add up the depth histograms of all of the pooled processes. Adaptive histograms that started with the same bin width have bin widths that are the same bin width doubled some number of times, so the narrower ones are made as wide as the widest one first.
+    merged_depth_histogram = copy.deepcopy(depth_histograms[0])
+
+    for depth_histogram in depth_histograms[1:]:
+        depth_histogram = copy.deepcopy(depth_histogram) # Do not change the histograms that were given.
+
+        if merged_depth_histogram.Adaptive:
+            while merged_depth_histogram.BinWidth < depth_histogram.BinWidth:
+                merged_depth_histogram.make_BinsWider()
+
+            while depth_histogram.BinWidth < merged_depth_histogram.BinWidth:
+                depth_histogram.make_BinsWider()
+
+        merged_depth_histogram.Counts = merged_depth_histogram.Counts + depth_histogram.Counts
+
+    return merged_depth_histogram
+
+    # REFERENCES:
+        # Python Software Foundation (2020). copy — Shallow and deep copy operations, https://docs.python.org/3/library/copy.html.
+
+
+class EnergyDepositAccumulator: # One of these is used by each pooled process of the radiotherapy game. It is small, so it is cheap to send back to the main process.
+    def __init__(self, AlphaParticleIDs, AlphaMass_kg, DepthBinEdges = None, DepthBinWidth = None, NumberOfDepthBins = 100):
+        self.AlphaParticleIDs = np.array(AlphaParticleIDs, dtype = int)
+
+        self.RowOfID = np.full(self.AlphaParticleIDs.max() + 1, -1, dtype = int) # Look-up array for finding the row of an alpha particle from its ID, as in the DepthSummaryStore class of the TrajectoryAdmin.py script.
+        self.RowOfID[self.AlphaParticleIDs] = np.arange(0, self.AlphaParticleIDs.shape[0])
+
+        self.MomentumTransferred_Total = 0.0 # Units: kg m/s. The running sum of the momentum magnitude lost by the alpha particles.
+        self.PreviousMomentumMagnitudeSum = None # The sum of the momentum magnitudes of the alpha particles in the beam when they were last recorded. None means that they have not been recorded yet.
+        self.NumberOfRecords = 0 # The number of times the momentum magnitudes have been recorded. This was the number of columns of the AlphaParticleMomentumMagnitudes array.
+        self.KineticEnergyLost_Total = 0.0 # Units: J. The running sum of the kinetic energy lost by the alpha particles since the first record. The kinetic energy depth profile must add up to this.
+        self.PreviousKineticEnergySum = None # The sum of the kinetic energies of the alpha particles in the beam when they were last recorded.
+
+        # The optional depth profiles of the momentum and kinetic energy lost. Each bin gets what the alpha particles lost while they were at a depth inside the bin.
+        self.AlphaMass_kg = AlphaMass_kg
+        self.RecordProfiles = (DepthBinEdges is not None) or (DepthBinWidth is not None)
+        if self.RecordProfiles:
+            self.MomentumTransferred_Profile = DepthHistogram(DepthBinEdges, DepthBinWidth, NumberOfDepthBins)
+            self.KineticEnergyTransferred_Profile = DepthHistogram(DepthBinEdges, DepthBinWidth, NumberOfDepthBins)
+            self.PreviousMomentumMagnitudes = np.zeros(self.AlphaParticleIDs.shape[0]) # The momentum magnitude and x-position of each alpha particle when it was last recorded. They are 0 for alpha particles that are not in the beam.
+            self.PreviousPositionsX = np.zeros(self.AlphaParticleIDs.shape[0])
+            self.PreviousRows = np.array([], dtype = int) # The rows of the alpha particles that were in the beam when they were last recorded.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.full, https://numpy.org/doc/stable/reference/generated/numpy.full.html.
+
+
+    def record_MomentumMagnitudes(self, AlphaParticleIDs, PositionsX, MomentumMagnitudes): # Record the momentum magnitudes of the alpha particles that are in the beam for one simulation step.
+        MomentumMagnitudeSum = MomentumMagnitudes.sum()
+
+        if self.PreviousMomentumMagnitudeSum is not None: # Alpha particles that left the beam since the last record are not in MomentumMagnitudes, so all of the momentum they had left counts as lost, as it did when their rows were padded with 0s.
+            self.MomentumTransferred_Total = self.MomentumTransferred_Total + (self.PreviousMomentumMagnitudeSum - MomentumMagnitudeSum)
+
+        self.PreviousMomentumMagnitudeSum = MomentumMagnitudeSum
+        self.NumberOfRecords = self.NumberOfRecords + 1
+
+        KineticEnergySum = (MomentumMagnitudes ** 2).sum() / (2 * self.AlphaMass_kg) # Units: J.
+        if self.PreviousKineticEnergySum is not None:
+            self.KineticEnergyLost_Total = self.KineticEnergyLost_Total + (self.PreviousKineticEnergySum - KineticEnergySum)
+
+        self.PreviousKineticEnergySum = KineticEnergySum
+
+        if self.RecordProfiles:
+            Rows = self.RowOfID[AlphaParticleIDs] # The IDs are integers in the particle store.
+
+            # Each alpha particle lost the difference between its momentum magnitudes at the last record and now at its x-position at the last record. Alpha particles that left the beam lost all of their momentum there. Setting the momentum magnitudes of the alpha particles that are in the beam before subtracting does both at once.
+            MomentumMagnitudes_Now = np.zeros(self.PreviousMomentumMagnitudes.shape[0])
+            MomentumMagnitudes_Now[Rows] = MomentumMagnitudes
+            self.add_ToProfiles(self.PreviousPositionsX[self.PreviousRows], self.PreviousMomentumMagnitudes[self.PreviousRows], MomentumMagnitudes_Now[self.PreviousRows])
+
+            self.PreviousMomentumMagnitudes[self.PreviousRows] = 0.0
+            self.PreviousMomentumMagnitudes[Rows] = MomentumMagnitudes
+            self.PreviousPositionsX[Rows] = PositionsX
+            self.PreviousRows = Rows
+
+
+    def add_ToProfiles(self, PositionsX, MomentumMagnitudes_Before, MomentumMagnitudes_After): # Add what each alpha particle lost at its x-position to the depth profiles. The kinetic energy of an alpha particle is p^2 / (2 * Alpha mass).
+        self.MomentumTransferred_Profile.add(PositionsX, MomentumMagnitudes_Before - MomentumMagnitudes_After)
+        self.KineticEnergyTransferred_Profile.add(PositionsX, (MomentumMagnitudes_Before ** 2 - MomentumMagnitudes_After ** 2) / (2 * self.AlphaMass_kg)) # Units: J.
+
+
+    def finish_Recording(self): # The alpha particles that were in the beam at the last record left the beam in the last simulation step. They lost the rest of their momentum where they were. This only affects the depth profile and KineticEnergyLost_Total. It does not affect MomentumTransferred_Total because the AlphaParticleMomentumMagnitudes array had no column after the last record.
+        if self.PreviousKineticEnergySum is not None:
+            self.KineticEnergyLost_Total = self.KineticEnergyLost_Total + self.PreviousKineticEnergySum
+            self.PreviousKineticEnergySum = 0.0
+
+        if self.RecordProfiles:
+            self.add_ToProfiles(self.PreviousPositionsX[self.PreviousRows], self.PreviousMomentumMagnitudes[self.PreviousRows], np.zeros(self.PreviousRows.shape[0]))
+            self.PreviousMomentumMagnitudes[self.PreviousRows] = 0.0
+            self.PreviousRows = np.array([], dtype = int)
+
+
+def get_MomentumTransferred_Total(energy_deposit_accumulators): # Add up the momentum lost in all of the pooled processes. When the AlphaParticleMomentumMagnitudes arrays of the pooled processes were merged, the arrays with fewer columns were padded with 0s. So the alpha particles of a pooled process that finished before the longest pooled process lost the momentum they had at their last record too.
+    NumberOfRecords_Maximum = max(energy_deposit_accumulator.NumberOfRecords for energy_deposit_accumulator in energy_deposit_accumulators)
+
+    MomentumTransferred_Total = 0.0
+    for energy_deposit_accumulator in energy_deposit_accumulators:
+        MomentumTransferred_Total = MomentumTransferred_Total + energy_deposit_accumulator.MomentumTransferred_Total
+
+        if (energy_deposit_accumulator.NumberOfRecords < NumberOfRecords_Maximum) and (energy_deposit_accumulator.PreviousMomentumMagnitudeSum is not None):
+            MomentumTransferred_Total = MomentumTransferred_Total + energy_deposit_accumulator.PreviousMomentumMagnitudeSum
+
+    return MomentumTransferred_Total
+
+
+def get_KineticEnergyLost_Total(energy_deposit_accumulators): # Add up the kinetic energy lost in all of the pooled processes. Every pooled process has finished recording, so the alpha particles of every pooled process have lost all of their kinetic energy and no padding is needed.
+    return sum(energy_deposit_accumulator.KineticEnergyLost_Total for energy_deposit_accumulator in energy_deposit_accumulators)
@@ -0,0 +1,32 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program keeps the quantities of each medium that the simulations of the Alpha Particles 2.0 program need at each simulation step, so that they are calculated once per medium rather than once per simulation instance, chunk or layer. The media are keyed by their atomic number, atomic weight and mass density, so the layers of the attenuation quiz and the points of a parameter sweep that have the same medium share its quantities, as do the simulation instances and chunks that a pooled process runs one after the other.
+# The cross-section of an alpha particle is CrossSectionConstant / p ** 2, its mean free path is MeanFreePathFactor * p ** 2 and its kinetic energy is KineticEnergyFactor_MeV * p ** 2, where p is its momentum magnitude. Because each of these is a constant times a power of p ** 2, they are calculated exactly from the constants below with one multiplication or division each, which is cheaper and more accurate than looking them up in a table of momenta and interpolating.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The MediumAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+MediumConstantsCache = {} # The MediumConstants of each medium that this process has used, keyed by (atomic number, atomic weight, mass density). Each pooled process has its own cache.
+
+class MediumConstants:
+    def __init__(self, AtomicNumber, AtomicWeight, MassDensity, AvogadrosNum, CrossSectionConstant):
+        self.ElectronSpatialDensity = AtomicNumber * (MassDensity * AvogadrosNum / AtomicWeight) # Units: cm^-3. The number of electrons in the medium per unit volume.
+        self.MeanFreePathFactor = (self.ElectronSpatialDensity * CrossSectionConstant) ** -1 # The mean free path of an alpha particle is (ElectronSpatialDensity * CrossSection) ** -1 = MeanFreePathFactor * p ** 2.
+
+        # REFERENCES:
+            # Nave, C R Scattering Cross Section, http://hyperphysics.phy-astr.gsu.edu/hbase/Nuclear/crosec.html.
+
+
+def get_MediumConstants(AtomicNumber, AtomicWeight, MassDensity, AvogadrosNum, CrossSectionConstant): # Give back the MediumConstants of a medium, making them only the first time that the medium is used. AvogadrosNum and CrossSectionConstant are the same for every medium, so they are not part of the key.
+    MediumKey = (float(AtomicNumber), float(AtomicWeight), float(MassDensity)) # An atomic number of 7 and 7.0 are the same medium.
+
+    if MediumKey not in MediumConstantsCache:
+        MediumConstantsCache[MediumKey] = MediumConstants(MediumKey[0], MediumKey[1], MediumKey[2], AvogadrosNum, CrossSectionConstant)
+
+    return MediumConstantsCache[MediumKey]
@@ -0,0 +1,99 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program keeps the state of the alpha particles that are in the beam for the Alpha Particles 2.0 program. Before this program was made, the state was one float64 array, AlphaParticlesInfoList_ID_X_Momentum, whose columns had to be remembered by number: 0 was the ID, 1 was the x-position, 2 to 4 were the momentum vector, 5 was the momentum magnitude, 6 was the cross-section, 7 was the mean free path and, in the attenuation quiz, 8 to 12 were the atomic number, atomic weight and mass density of the medium, the medium and the NextThicknessCheckPoint. The IDs and media were stored as floats, and the whole array was copied at every simulation step to remove the alpha particles that had left the beam.
+# The ParticleStore class keeps each of these as its own array with its own name and data type instead, e.g., particle_store.PositionX and particle_store.Momentum. Each method of a simulation step only reads and writes the arrays that it needs. The IDs and media are integers.
+# The arrays are made once for all of the alpha particles. The alpha particles that are in the beam are the first Count rows, so Count is a watermark of the active rows. When alpha particles leave the beam, the alpha particles after the first one that left are moved up in their arrays (stable compaction). No new arrays are made, the rows before the first alpha particle that left are not copied, and the alpha particles stay in the same order, so seeded simulations give the same results as when the whole array was copied.
+# The x-positions, mean free paths and properties of the media can be kept as float32 to halve the memory that they use. The momentum vectors, momentum magnitudes and cross-sections are always float64, because the squares of momenta in kg m/s (about 1e-40 to 1e-45) are smaller than the smallest float32 number.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The ParticleAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the ParticleAdmin program needs.
+import numpy as np
+
+# REFERENCES:
+    # NumPy. (2020). NumPy v1.19.0. Retrieved from https://numpy.org/
+
+# The fields of the alpha particles as (name, data type, shape of the field of one alpha particle). A data type of None means the float type of the store, which can be float32.
+BeamFields = (("ID", np.int64, ()), ("PositionX", None, ()), ("Momentum", np.float64, (3,)), ("MomentumMagnitude", np.float64, ()), ("CrossSection", np.float64, ()), ("MeanFreePath", None, ()))
+MediumFields = (("AtomicNumber", None, ()), ("AtomicWeight", None, ()), ("MassDensity", None, ()), ("WhichMedium", np.int64, ()), ("NextThicknessCheckPoint", None, ())) # The extra fields of the attenuation quiz, in which each alpha particle can be in a different medium.
+
+class ParticleStore:
+    def __init__(self, NumberOfParticles, Fields = BeamFields, FloatType = np.float64):
+        self.FloatType = np.dtype(FloatType)
+        self.Arrays = {Name : np.zeros((int(NumberOfParticles),) + Shape, dtype = self.FloatType if DataType is None else DataType) for Name, DataType, Shape in Fields}
+        self.Count = int(NumberOfParticles) # The number of alpha particles in the beam. They are the first Count rows of the arrays.
+        self.ScratchArrays = {} # Arrays for the intermediate results of the methods of a simulation step, made the first time that they are needed (see the get_ScratchArray() method).
+
+        # REFERENCES:
+            # The SciPy community (2020). Data type objects (dtype), https://numpy.org/doc/stable/reference/arrays.dtypes.html.
+
+
+    def __getattr__(self, Name): # particle_store.PositionX gives back a view of the rows of the alpha particles that are in the beam, so it can be read and written like an array. This method is only used for names that are not normal attributes.
+        Arrays = self.__dict__.get("Arrays")
+        if (Arrays is None) or (Name not in Arrays): # e.g., while the store is being unpickled.
+            raise AttributeError(Name)
+
+        return Arrays[Name][0:self.Count]
+
+
+    def __setattr__(self, Name, Value): # particle_store.PositionX = ... and particle_store.PositionX += ... write into the rows of the alpha particles that are in the beam rather than replacing the array.
+        Arrays = self.__dict__.get("Arrays")
+        if (Arrays is not None) and (Name in Arrays):
+            Arrays[Name][0:self.Count] = Value
+
+        else:
+            object.__setattr__(self, Name, Value)
+
+        # REFERENCES:
+            # Python Software Foundation (2020). Customizing attribute access, https://docs.python.org/3/reference/datamodel.html#customizing-attribute-access.
+
+
+    def __getstate__(self): # Only the alpha particles that are in the beam are pickled, e.g., when a chunk of alpha particles is sent to a pooled process.
+        State = dict(self.__dict__)
+        State["Arrays"] = {Name : Array[0:self.Count].copy() for Name, Array in self.Arrays.items()}
+        State["ScratchArrays"] = {} # The scratch arrays are remade when they are needed.
+
+        return State
+
+
+    def __setstate__(self, State):
+        self.__dict__.update(State)
+
+
+    def take(self, Rows): # Make a new store with some of the alpha particles, e.g., a chunk of alpha particles for a pooled process.
+        particle_store = ParticleStore.__new__(ParticleStore)
+        particle_store.__dict__.update({"FloatType" : self.FloatType, "Arrays" : {Name : Array[0:self.Count][Rows] for Name, Array in self.Arrays.items()}, "Count" : len(Rows), "ScratchArrays" : {}})
+
+        return particle_store
+
+
+    def get_ScratchArray(self, Name): # Give back a float64 array with one row for each alpha particle in the beam, for an intermediate result that is overwritten at each simulation step. The array is made once, as long as the arrays of the fields, and is reused.
+        if Name not in self.ScratchArrays:
+            self.ScratchArrays[Name] = np.empty(next(iter(self.Arrays.values())).shape[0])
+
+        return self.ScratchArrays[Name][0:self.Count]
+
+
+    def remove(self, KeepMask): # Remove the alpha particles whose KeepMask is False from the beam. The alpha particles that are kept are moved up in their arrays, starting from the row of the first alpha particle that is removed, so the alpha particles stay in the same order.
+        NewCount = int(np.count_nonzero(KeepMask))
+        if NewCount == self.Count:
+            return
+
+        FirstRemovedRow = int(np.argmin(KeepMask)) # KeepMask is False at this row, because at least one alpha particle is removed.
+        KeptRows = FirstRemovedRow + np.flatnonzero(KeepMask[FirstRemovedRow:]) # The alpha particles that are kept from the first removed row onwards.
+
+        for Array in self.Arrays.values():
+            Array[FirstRemovedRow:NewCount] = Array[KeptRows] # The fancy indexing makes a copy of the kept rows first, so rows that are moved do not overwrite rows that are still to be moved.
+
+        self.Count = NewCount
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.argmin, https://numpy.org/doc/stable/reference/generated/numpy.argmin.html.
+            # The SciPy community (2020). numpy.flatnonzero, https://numpy.org/doc/stable/reference/generated/numpy.flatnonzero.html.
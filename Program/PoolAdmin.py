@@ -0,0 +1,95 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program keeps one pool of processes for the whole of a run of the Alpha Particles 2.0 program. Before this program was made, the beam analysis and the radiotherapy game each made a new mp.Pool() when they were run and closed it straight after, so the time it takes to start the processes was spent every time. The PoolAdmin object makes the pool once, warms it up by giving every process a trivial task, and then every mode of the program (and every run of a mode in the same session) sends its work to the same processes. The pool is closed when the program exits.
+# The start method of the processes ("fork", "spawn" or "forkserver") can be chosen. None means the default start method of the operating system.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The PoolAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the PoolAdmin program needs.
+import atexit
+import multiprocessing as mp
+import os
+
+# REFERENCES:
+    # Python Software Foundation (2020). atexit — Exit handlers, https://docs.python.org/3/library/atexit.html.
+    # Python Software Foundation (2020). multiprocessing — Process-based parallelism, https://docs.python.org/3/library/multiprocessing.html.
+
+def get_ProcessID(_): # The trivial task that warms up the pool. It must be defined at the top level of a module so that it can be pickled.
+    return os.getpid()
+
+
+class PoolAdmin:
+    def __init__(self, NumberOfProcesses, StartMethod = None):
+        self.NumberOfProcesses = max(int(NumberOfProcesses), 1)
+        self.StartMethod = StartMethod
+        self.Pool = None # The pool is made when it is first needed, so that the processes are not started before the classes that they are going to run are defined.
+
+        atexit.register(self.close) # Close the pool when the program exits, including when exit() is used after an error.
+
+        # REFERENCES:
+            # Python Software Foundation (2020). atexit.register, https://docs.python.org/3/library/atexit.html#atexit.register.
+
+
+    def make_Pool(self): # Make the pool and warm it up.
+        if self.Pool is not None:
+            return
+
+        try:
+            context = mp.get_context(self.StartMethod) # A context has the same API as the multiprocessing module but uses its own start method, so the start method of the whole program does not have to be set globally.
+        except ValueError:
+            print("Error: \"{}\" is not a start method that multiprocessing can use on this computer. The program will now exit.".format(self.StartMethod))
+            exit()
+
+        self.Pool = context.Pool(processes = self.NumberOfProcesses)
+        self.ProcessIDs = sorted(set(self.Pool.map(get_ProcessID, range(0, self.NumberOfProcesses), chunksize = 1))) # Give each process a trivial task so that all of them have started before the first real task is sent. Processes that are not ready yet may leave their task to a process that is, so there may be fewer process IDs than processes.
+
+        # REFERENCES:
+            # Python Software Foundation (2020). Contexts and start methods, https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.
+
+
+    def get_Pool(self):
+        self.make_Pool()
+        return self.Pool
+
+
+    def map(self, Function, Iterable, chunksize = 1): # The same as the map() method of mp.Pool(). Each task of the program is a whole simulation, so by default the tasks are sent to the processes one at a time.
+        return self.get_Pool().map(Function, Iterable, chunksize = chunksize)
+
+
+    def imap(self, Function, Iterable, chunksize = 1): # The same as the imap() method of mp.Pool(). The results are given back in the order of the tasks, like the map() method, but each one can be used as soon as it and the tasks before it are done.
+        return self.get_Pool().imap(Function, Iterable, chunksize = chunksize)
+
+        # REFERENCES:
+            # Python Software Foundation (2020). multiprocessing.pool.Pool.imap, https://docs.python.org/3/library/multiprocessing.html#multiprocessing.pool.Pool.imap.
+
+
+    def imap_unordered(self, Function, Iterable, chunksize = 1): # The same as the imap_unordered() method of mp.Pool(). Each result is given back as soon as its task is done, in whatever order the tasks finish, and a process takes the next task as soon as it is free.
+        return self.get_Pool().imap_unordered(Function, Iterable, chunksize = chunksize)
+
+        # REFERENCES:
+            # Python Software Foundation (2020). multiprocessing.pool.Pool.imap_unordered, https://docs.python.org/3/library/multiprocessing.html#multiprocessing.pool.Pool.imap_unordered.
+
+
+    def close(self): # End the pool. It is made again if it is needed after this.
+        if self.Pool is None:
+            return
+
+        self.Pool.close() # These two methods are required to end the pool.
+        self.Pool.join()
+        self.Pool = None
+
+
+    def terminate(self): # End the pool without waiting for the tasks that have not finished, e.g., after an error.
+        if self.Pool is None:
+            return
+
+        self.Pool.terminate()
+        self.Pool.join()
+        self.Pool = None
@@ -0,0 +1,67 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program shows the progress of the simulations of the Alpha Particles 2.0 program that are run by the pooled processes. Before this program was made, each pooled process printed the progress of its own simulation instance or chunk, and the show_Progress() method worked out the progress and read the clock twice at every simulation step.
+# Now a simulation only works out its progress every ProgressStepInterval simulation steps (see the show_Progress() method of the AlphaParticles class). A pooled process writes the progress of its task into its own slot of a ProgressCounter, which is a shared memory block that the main process made. It does not print anything. While the main process waits for the results of the tasks, it prints the progress of all of the tasks together at most once every few seconds, using a monotonic clock.
+# Each slot is written by one pooled process at a time and is only read by the main process, so no lock is needed. A value that is read while it is being written is at worst the progress of one sample earlier.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The ProgressAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the ProgressAdmin program needs.
+import multiprocessing as mp
+import time
+import SharedMemoryAdmin # The slots of the progress counter are a shared memory block.
+
+# REFERENCES:
+    # Python Software Foundation (2020). time.monotonic, https://docs.python.org/3/library/time.html#time.monotonic.
+
+class ProgressCounter: # It is made by the main process and is pickled with the tasks of the pooled processes, which attach to the same shared memory block.
+    def __init__(self, NumberOfTasks):
+        self.shared_array = SharedMemoryAdmin.SharedArray((NumberOfTasks,)) # The progress of each task, in %. Every task starts at 0%.
+
+
+    def set_Progress(self, Task, Progress_Percentage):
+        self.shared_array.Array[Task] = Progress_Percentage
+
+
+    def get_Progress(self): # The progress of all of the tasks together, in %.
+        if self.shared_array.Array.shape[0] == 0:
+            return 100.0
+
+        return float(self.shared_array.Array.mean())
+
+
+    def close(self): # Free the shared memory block. This must only be done by the main process, once the pooled processes have finished all of the tasks.
+        self.shared_array.close()
+        self.shared_array.unlink()
+
+
+def report_Progress(ResultIterator, progress_counter, Description, ReportInterval_s = 2.5): # Give back the results of an iterator from the imap() or imap_unordered() method of the pool, and print the progress of the tasks whenever no result has come back for ReportInterval_s seconds.
+    NextReport = time.monotonic() + ReportInterval_s
+
+    while True:
+        try:
+            Result = ResultIterator.next(timeout = max(NextReport - time.monotonic(), 0.0))
+
+        except StopIteration:
+            return
+
+        except mp.TimeoutError: # No task has finished since the last report.
+            print("\tThe progress of {} is {:0.2f}% ...".format(Description, progress_counter.get_Progress()))
+            NextReport = time.monotonic() + ReportInterval_s
+            continue
+
+        if time.monotonic() >= NextReport: # Tasks that finish often must not stop the progress from being printed.
+            print("\tThe progress of {} is {:0.2f}% ...".format(Description, progress_counter.get_Progress()))
+            NextReport = time.monotonic() + ReportInterval_s
+
+        yield Result
+
+    # REFERENCES:
+        # Python Software Foundation (2020). multiprocessing.pool.IMapIterator.next, https://docs.python.org/3/library/multiprocessing.html#multiprocessing.pool.IMapIterator.next.
@@ -0,0 +1,90 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program manages the generation of random numbers for the Alpha Particles 2.0 program. Each simulation instance (or pooled process) gets its own numpy random number generator, which fills whole arrays of random numbers per call instead of one number per call. All of the random numbers used in a simulation come from this one generator, so the simulation can be seeded from a single seed.
+# The generators are seeded from numpy SeedSequence objects. One root SeedSequence is made from the seed (or from fresh entropy from the operating system if there is no seed), and SeedSequence.spawn() gives each simulation instance, and each chunk of alpha particles of a simulation instance, its own child SeedSequence. The children of a SeedSequence give statistically independent streams of random numbers, and the child of each chunk only depends on the seed, the simulation instance and the chunk, so the results do not depend on the number of CPU cores or the order in which the pooled processes run the chunks.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The RandomNumberAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the RandomNumberAdmin program needs.
+import numpy as np
+
+# REFERENCES:
+    # NumPy. (2020). NumPy v1.19.0. Retrieved from https://numpy.org/
+
+def get_SeedSequences(Seed, NumberOfInstances, NumberOfStreamsPerInstance): # Make the SeedSequence objects of all of the simulation instances and their chunks from one seed. The SeedSequence of stream "stream" of simulation instance "instance" is SeedSequences[(instance, stream)]. A Seed of None means fresh entropy from the operating system, which is kept in the entropy attribute of each SeedSequence so that the random numbers can be reproduced later.
+    root_seed_sequence = np.random.SeedSequence(Seed)
+
+    SeedSequences = {}
+    for instance, instance_seed_sequence in enumerate(root_seed_sequence.spawn(NumberOfInstances)):
+        for stream, stream_seed_sequence in enumerate(instance_seed_sequence.spawn(NumberOfStreamsPerInstance)):
+            SeedSequences[(instance, stream)] = stream_seed_sequence # spawn() numbers its children in order, so the SeedSequence of a stream does not depend on how many instances or streams there are.
+
+    return SeedSequences
+
+    # REFERENCES:
+        # The SciPy community (2020). numpy.random.SeedSequence, https://numpy.org/doc/stable/reference/random/bit_generators/generated/numpy.random.SeedSequence.html.
+        # The SciPy community (2020). Parallel Random Number Generation, https://numpy.org/doc/stable/reference/random/parallel.html.
+
+
+class RandomNumberGenerator: # This class wraps a numpy.random.Generator object. It must be fully configured when it is made because it is used inside pooled processes, where the user cannot be asked for inputs.
+    def __init__(self, RandomDistribution, AmountOfNumbers, seed_sequence): # seed_sequence is a numpy.random.SeedSequence object from the get_SeedSequences() function.
+        self.RandomDistribution = RandomDistribution # The probability density function that the user chose for the off-diagonal elements of the randomised 3x3 matrix. The options are "basic", "discrete", "triangular" and "uniform".
+        self.AmountOfNumbers = AmountOfNumbers # Only used for the "discrete" option. It is the end value of the integers that can be generated, so AmountOfNumbers + 1 numbers between and including 0 and 1 can be generated.
+
+        if self.RandomDistribution not in set(["basic", "discrete", "triangular", "uniform"]):
+            print("Error: The random distribution must be one of the following options: basic, discrete, triangular, uniform. The program will now exit.")
+            exit()
+
+        if (self.RandomDistribution == "discrete") and ((self.AmountOfNumbers is None) or (self.AmountOfNumbers <= 0)): # The user must be asked for AmountOfNumbers *before* the simulation starts.
+            print("Error: The discrete random distribution needs the number of random numbers that can be generated to be specified before the simulation starts. The program will now exit.")
+            exit()
+
+        self.Generator = np.random.default_rng(seed_sequence) # Each simulation instance (or chunk) has its own SeedSequence, so the instances do not generate the same random numbers as each other but the whole simulation can still be reproduced from one seed.
+        # NOTE: Before the get_SeedSequences() function was made, the seed and a stream number were given to numpy directly. Without a seed, each simulation instance got its own fresh entropy, so an unseeded simulation could not be reproduced.
+        # if Seed is None:
+        #     self.Generator = np.random.default_rng()
+        # else:
+        #     self.Generator = np.random.default_rng([Seed, StreamNumber])
+
+        # REFERENCES:
+            # The SciPy community (2020). Random Generator, https://numpy.org/doc/stable/reference/random/generator.html.
+            # The SciPy community (2020). numpy.random.default_rng, https://numpy.org/doc/stable/reference/random/generator.html#numpy.random.default_rng.
+
+
+    def randomNums_0to1(self, AmountOfRandomNums): # Generate AmountOfRandomNums random numbers between 0 and 1 using the probability density function that the user chose.
+        if self.RandomDistribution == "basic": # 0 but not 1 can be generated, like random.random().
+            return self.Generator.random(size = AmountOfRandomNums)
+
+        elif self.RandomDistribution == "discrete": # Numbers are generated with equal probability. The random numbers are fractions of the largest number that can be generated.
+            return self.Generator.integers(low = 0, high = self.AmountOfNumbers, size = AmountOfRandomNums, endpoint = True) / self.AmountOfNumbers
+
+        elif self.RandomDistribution == "triangular": # The probability of generating a number decreases linearly from a maximum at 0 to zero at 1.
+            return self.Generator.triangular(left = 0.0, mode = 0.0, right = 1.0, size = AmountOfRandomNums)
+
+        elif self.RandomDistribution == "uniform":
+            return self.Generator.uniform(low = 0.0, high = 1.0, size = AmountOfRandomNums)
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.random.Generator.random, https://numpy.org/doc/stable/reference/random/generated/numpy.random.Generator.random.html.
+            # The SciPy community (2020). numpy.random.Generator.integers, https://numpy.org/doc/stable/reference/random/generated/numpy.random.Generator.integers.html.
+            # The SciPy community (2020). numpy.random.Generator.triangular, https://numpy.org/doc/stable/reference/random/generated/numpy.random.Generator.triangular.html.
+            # The SciPy community (2020). numpy.random.Generator.uniform, https://numpy.org/doc/stable/reference/random/generated/numpy.random.Generator.uniform.html.
+
+
+    def randomNum_0to1(self): # Generate one random number between 0 and 1. This is for code that still needs one random number at a time.
+        return float(self.randomNums_0to1(1)[0])
+
+
+    def randomIndices_0or1(self, AmountOfRandomNums): # Generate AmountOfRandomNums random integers that are either 0 or 1. They are used for choosing the signs of the off-diagonal elements and which element of a pair is defined first.
+        return self.Generator.integers(low = 0, high = 2, size = AmountOfRandomNums)
+
+
+    def uniform(self, low, high, size): # Generate random numbers from a uniform distribution between low (included) and high (excluded). This is used for generating the free paths of the alpha particles.
+        return self.Generator.uniform(low = low, high = high, size = size)
@@ -0,0 +1,108 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program calculates the ranges of an alpha particle beam for the Alpha Particles 2.0 program: the maximum range, the mean range, the number of alpha particles remaining in the beam as a function of distance, and the thickness of medium that transmits a given number of alpha particles. Everything is calculated from the furthest x-position that each alpha particle reached. These x-positions are sorted once, so that each of the results can be found directly from the sorted x-positions instead of by searching through the number of alpha particles remaining in the beam at each distance.
+# It is used in the beam analysis mode, the radiotherapy game and the beam attenuation quiz.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The RangeEstimator program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the RangeEstimator program needs.
+import math
+import numpy as np
+
+# REFERENCES:
+    # Python Software Foundation (2020). math — Mathematical functions, https://docs.python.org/3/library/math.html.
+    # NumPy. (2020). NumPy v1.19.0. Retrieved from https://numpy.org/
+
+ResampleBatchSize = 2 ** 22 # The most x-positions that the get_BootstrapConfidenceInterval() method resamples at once, i.e., about 32 MB of float64s, plus the same again for their indices. A batch always has at least one resample.
+
+class RangeEstimator:
+    def __init__(self, MaximumPositionsX, InitialPositionX = 0.0):
+        self.MaximumPositionsX_Sorted = np.sort(np.asarray(MaximumPositionsX, dtype = float).ravel()) # The furthest x-position of each alpha particle, from the shortest to the longest. Sorting takes O(N log N) time and is only done once.
+        self.ParticleNumber = self.MaximumPositionsX_Sorted.shape[0] # The number of alpha particles in the beam at the start of the simulation.
+        self.InitialPositionX = InitialPositionX # All of the alpha particles start from here.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.sort, https://numpy.org/doc/stable/reference/generated/numpy.sort.html.
+
+
+    def get_MaximumRange(self): # The maximum range is the furthest distance an alpha particle in the beam has travelled.
+        return self.MaximumPositionsX_Sorted[-1]
+
+
+    def get_ParticleNumList_Distance(self, DistancesToCheck): # Calculate the number of alpha particles remaining in the beam at each distance of interest. An alpha particle is counted as remaining in the beam at a distance if its furthest x-position is beyond that distance.
+        # np.searchsorted() with side = "right" gives, for each distance, the number of sorted maximum x-positions that are less than or equal to that distance. These are the alpha particles that did not pass the distance.
+        return (self.ParticleNumber - np.searchsorted(self.MaximumPositionsX_Sorted, DistancesToCheck, side = "right")).tolist() # A list of Python integers, as the ParticleNumList_Distance list has always been.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.searchsorted, https://numpy.org/doc/stable/reference/generated/numpy.searchsorted.html.
+
+
+    def calculate_DepthFromSorted(self, MaximumPositionsX_Sorted, ParticleNumberTransmitted): # This method works on one sorted array or on many sorted arrays at once (one per row), which the get_BootstrapConfidenceInterval() method needs.
+        # Exactly ParticleNumberTransmitted alpha particles remain in the beam between the depths at which the (N - ParticleNumberTransmitted)th and (N - ParticleNumberTransmitted + 1)th alpha particles left the beam, where N is the number of alpha particles. The number of alpha particles in the beam drops approximately linearly with depth here, so we do linear interpolation between the two depths, i.e., take the middle of them.
+        ParticleNumberStopped = self.ParticleNumber - ParticleNumberTransmitted
+
+        if ParticleNumberStopped <= 0: # Every alpha particle is transmitted for any depth before the first alpha particle leaves the beam.
+            LowerDepth = np.full(MaximumPositionsX_Sorted.shape[:-1], self.InitialPositionX)
+        else:
+            LowerDepth = MaximumPositionsX_Sorted[..., ParticleNumberStopped - 1]
+
+        if ParticleNumberStopped >= self.ParticleNumber: # No alpha particle is transmitted beyond the maximum range.
+            UpperDepth = MaximumPositionsX_Sorted[..., -1]
+        else:
+            UpperDepth = MaximumPositionsX_Sorted[..., ParticleNumberStopped]
+
+        return (LowerDepth + UpperDepth) / 2
+
+        # REFERENCES:
+            # The SciPy community (2020). Indexing, https://numpy.org/doc/stable/reference/arrays.indexing.html.
+
+
+    def get_DepthForTransmittedNumber(self, ParticleNumberTransmitted): # Calculate the depth that ParticleNumberTransmitted alpha particles travel beyond. For example, the mean range is the depth for half of the alpha particles.
+        ParticleNumberTransmitted = min(max(ParticleNumberTransmitted, 0), self.ParticleNumber) # The number of alpha particles transmitted must be between 0 and the number of alpha particles in the beam.
+
+        # If ParticleNumberTransmitted is not a whole number, interpolate linearly between the depths for the whole numbers on either side of it.
+        LowerNumber, UpperNumber = math.floor(ParticleNumberTransmitted), math.ceil(ParticleNumberTransmitted)
+        Depth_LowerNumber = float(self.calculate_DepthFromSorted(self.MaximumPositionsX_Sorted, LowerNumber))
+        Depth_UpperNumber = float(self.calculate_DepthFromSorted(self.MaximumPositionsX_Sorted, UpperNumber))
+
+        return Depth_LowerNumber + (ParticleNumberTransmitted - LowerNumber) * (Depth_UpperNumber - Depth_LowerNumber)
+
+
+    def get_DepthForTransmittedFraction(self, TransmissionFraction): # The same as the get_DepthForTransmittedNumber() method but for a fraction of the alpha particles in the beam.
+        return self.get_DepthForTransmittedNumber(TransmissionFraction * self.ParticleNumber)
+
+
+    def get_BootstrapConfidenceInterval(self, ParticleNumberTransmitted, random_number_generator, NumberOfResamples = 1000, ConfidenceLevel = 0.95): # Estimate how uncertain the depth from the get_DepthForTransmittedNumber() method is. The alpha particles are resampled with replacement NumberOfResamples times, and the depth is recalculated for each resample. random_number_generator is a numpy.random.Generator object.
+        ParticleNumberTransmitted = int(round(min(max(ParticleNumberTransmitted, 0), self.ParticleNumber)))
+
+        # NOTE: Before, all of the resamples were made at once, as an array with one resample per row. For 10^6 alpha particles and 1000 resamples, that array used about 8 GB of memory.
+        # Resamples = self.MaximumPositionsX_Sorted[random_number_generator.integers(low = 0, high = self.ParticleNumber, size = (NumberOfResamples, self.ParticleNumber))] # One resample per row.
+        # Resamples.sort(axis = 1)
+        #
+        # DepthsOfResamples = self.calculate_DepthFromSorted(Resamples, ParticleNumberTransmitted)
+
+        # Now the resamples are made a batch at a time, and only the depth of each resample is kept, so the memory use is at most that of one batch however many resamples there are.
+        ResamplesPerBatch = max(ResampleBatchSize // max(self.ParticleNumber, 1), 1)
+        DepthsOfResamples = np.empty(NumberOfResamples)
+
+        for BatchStart in range(0, NumberOfResamples, ResamplesPerBatch):
+            BatchEnd = min(BatchStart + ResamplesPerBatch, NumberOfResamples)
+
+            Resamples = self.MaximumPositionsX_Sorted[random_number_generator.integers(low = 0, high = self.ParticleNumber, size = (BatchEnd - BatchStart, self.ParticleNumber))] # One resample per row.
+            Resamples.sort(axis = 1)
+
+            DepthsOfResamples[BatchStart:BatchEnd] = self.calculate_DepthFromSorted(Resamples, ParticleNumberTransmitted)
+
+        return tuple(np.quantile(DepthsOfResamples, [(1 - ConfidenceLevel) / 2, (1 + ConfidenceLevel) / 2])) # The lower and upper limits of the confidence interval.
+
+        # REFERENCES:
+            # Efron, B & Tibshirani, R J (1993). An Introduction to the Bootstrap. New York: Chapman & Hall.
+            # The SciPy community (2020). numpy.random.Generator.integers, https://numpy.org/doc/stable/reference/random/generated/numpy.random.Generator.integers.html.
+            # The SciPy community (2020). numpy.quantile, https://numpy.org/doc/stable/reference/generated/numpy.quantile.html.
@@ -0,0 +1,145 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program defines the results that each simulation instance of the beam analysis sends back from its pooled process to the main process of the Alpha Particles 2.0 program. Before this program was made, the pooled processes sent back whole AlphaParticles objects. These objects have the x-positions of the alpha particles, the info list and a list with one Python float for each off-diagonal element of each randomised 3x3 matrix, and all of it had to be pickled, sent to the main process and kept in its memory. The main process only needs the ranges, the number of alpha particles in the beam as a function of distance and the values of the off-diagonal elements (or a histogram of them) for its plots.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The ResultAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the ResultAdmin program needs.
+import copy
+import numpy as np
+
+# REFERENCES:
+    # Python Software Foundation (2020). copy — Shallow and deep copy operations, https://docs.python.org/3/library/copy.html.
+    # NumPy. (2020). NumPy v1.19.0. Retrieved from https://numpy.org/
+
+OffDiagonalElements = ("C_xy", "C_xz", "C_yx", "C_yz", "C_zx", "C_zy") # The names of the off-diagonal elements of the randomised 3x3 matrix in the order in which they are plotted.
+
+class SimulationInstanceResult: # The results of one simulation instance. __slots__ means that the objects of this class have no __dict__, so they are small and only have the attributes listed here.
+    __slots__ = ("Instance", "MaximumRange", "MeanRange", "MeanRange_ConfidenceInterval", "DistancesToCheck", "ParticleNumList_Distance", "OffDiagonalValues", "OffDiagonalHistogram_Counts", "OffDiagonalHistogram_BinEdges")
+
+    def __init__(self, alpha_beam, Instance, OffDiagonalHistogram_NumberOfBins = None, OffDiagonalHistogram_Counts = None, CollectOffDiagonalElements = True): # alpha_beam is the AlphaParticles object after its calculate_Data() method has been used. OffDiagonalHistogram_Counts is only given when the histograms were already made, e.g., by adding up the histograms of the chunks of a simulation instance. If CollectOffDiagonalElements is False, neither the values of the off-diagonal elements nor their histograms are kept, e.g., for a parameter sweep, which only needs the ranges.
+        self.Instance = Instance
+        self.MaximumRange = float(alpha_beam.MaximumRange)
+        self.MeanRange = float(alpha_beam.MeanRange)
+        self.MeanRange_ConfidenceInterval = alpha_beam.MeanRange_ConfidenceInterval
+
+        # The number of alpha particles in the beam as a function of distance. Arrays are much smaller to pickle and to keep in memory than lists of Python numbers.
+        self.DistancesToCheck = np.array(alpha_beam.DistancesToCheck)
+        self.ParticleNumList_Distance = np.array(alpha_beam.ParticleNumList_Distance, dtype = np.int64)
+
+        if not CollectOffDiagonalElements:
+            self.OffDiagonalValues, self.OffDiagonalHistogram_Counts, self.OffDiagonalHistogram_BinEdges = None, None, None
+
+        elif OffDiagonalHistogram_NumberOfBins is None: # Keep the values of the off-diagonal elements so that the user can choose the number of bins of the histograms after the simulation.
+            self.OffDiagonalValues = {OffDiagonalElement : np.array(getattr(alpha_beam, "RandomNumList_" + OffDiagonalElement)) for OffDiagonalElement in OffDiagonalElements}
+            self.OffDiagonalHistogram_Counts, self.OffDiagonalHistogram_BinEdges = None, None
+
+        else: # Only keep the histograms. Every simulation instance uses the same bin edges, so the histograms can be added together in the main process.
+            self.OffDiagonalValues = None
+            self.OffDiagonalHistogram_BinEdges = get_OffDiagonalHistogram_BinEdges(alpha_beam.C_xx, alpha_beam.C_yy, alpha_beam.C_zz, OffDiagonalHistogram_NumberOfBins)
+
+            if OffDiagonalHistogram_Counts is not None:
+                self.OffDiagonalHistogram_Counts = OffDiagonalHistogram_Counts
+            else:
+                self.OffDiagonalHistogram_Counts = {OffDiagonalElement : np.histogram(getattr(alpha_beam, "RandomNumList_" + OffDiagonalElement), bins = self.OffDiagonalHistogram_BinEdges[OffDiagonalElement])[0] for OffDiagonalElement in OffDiagonalElements}
+
+        # REFERENCES:
+            # Python Software Foundation (2020). __slots__, https://docs.python.org/3/reference/datamodel.html#slots.
+            # The SciPy community (2020). numpy.histogram, https://numpy.org/doc/stable/reference/generated/numpy.histogram.html.
+
+
+    def get_Results(self): # This method gives back the same results as the get_Results() method of the AlphaParticles class, so the StatisticalAnalysis class can collect them in the same way.
+        ParticleNumDict_Distance = dict(zip(self.DistancesToCheck.tolist(), self.ParticleNumList_Distance.tolist())) # Associate the distances with the number of particles in the beam considering that the distances are randomly generated.
+
+        return self.MaximumRange, ParticleNumDict_Distance, self.MeanRange
+
+
+def get_OffDiagonalHistogram_BinEdges(C_xx, C_yy, C_zz, NumberOfBins): # The absolute value of each off-diagonal element is at most 1 minus the diagonal element in the same column of the randomised 3x3 matrix, so the bin edges can be decided before the simulation starts.
+    DiagonalElement_Dict = {"C_xy" : C_xx, "C_xz" : C_xx, "C_yx" : C_yy, "C_yz" : C_yy, "C_zx" : C_zz, "C_zy" : C_zz}
+
+    return {OffDiagonalElement : np.linspace(-(1 - DiagonalElement_Dict[OffDiagonalElement]), 1 - DiagonalElement_Dict[OffDiagonalElement], int(NumberOfBins) + 1) for OffDiagonalElement in OffDiagonalElements}
+
+    # REFERENCES:
+        # The SciPy community (2020). numpy.linspace, https://numpy.org/doc/stable/reference/generated/numpy.linspace.html.
+
+
+class SimulationChunkResult: # The results of one chunk of alpha particles of a simulation instance. The ranges cannot be calculated from one chunk, so the furthest x-position of each alpha particle is sent back instead.
+    __slots__ = ("Instance", "Chunk", "AlphaParticleIDs", "MaximumPositionsX", "OffDiagonalValues", "OffDiagonalHistogram_Counts")
+
+    def __init__(self, alpha_beam, Instance, Chunk, OffDiagonalHistogram_NumberOfBins = None, CollectOffDiagonalElements = True): # alpha_beam is the AlphaParticles object after its process_Simulation() method has been used for the chunk. CollectOffDiagonalElements is the same as for the SimulationInstanceResult class.
+        self.Instance = Instance
+        self.Chunk = Chunk
+        self.AlphaParticleIDs = alpha_beam.trajectory_store.AlphaParticleIDs
+        self.MaximumPositionsX = alpha_beam.trajectory_store.get_MaximumPositionsX()
+
+        if not CollectOffDiagonalElements:
+            self.OffDiagonalValues, self.OffDiagonalHistogram_Counts = None, None
+
+        elif OffDiagonalHistogram_NumberOfBins is None:
+            self.OffDiagonalValues = {OffDiagonalElement : np.array(getattr(alpha_beam, "RandomNumList_" + OffDiagonalElement)) for OffDiagonalElement in OffDiagonalElements}
+            self.OffDiagonalHistogram_Counts = None
+
+        else:
+            OffDiagonalHistogram_BinEdges = get_OffDiagonalHistogram_BinEdges(alpha_beam.C_xx, alpha_beam.C_yy, alpha_beam.C_zz, OffDiagonalHistogram_NumberOfBins)
+            self.OffDiagonalValues = None
+            self.OffDiagonalHistogram_Counts = {OffDiagonalElement : np.histogram(getattr(alpha_beam, "RandomNumList_" + OffDiagonalElement), bins = OffDiagonalHistogram_BinEdges[OffDiagonalElement])[0] for OffDiagonalElement in OffDiagonalElements}
+
+
+class SimulationInstanceReducer: # This class puts the chunks of a simulation instance back together in the main process. The chunks can arrive in any order, so the furthest x-positions are put into the rows of their alpha particles and the values of the off-diagonal elements are kept until every chunk has arrived, so that they can be put together in the order of the chunks.
+    def __init__(self, alpha_beam, Instance, NumberOfChunks, OffDiagonalHistogram_NumberOfBins = None, analysis_seed_sequence = None, CollectOffDiagonalElements = True): # alpha_beam is the AlphaParticles object of the simulation instance in the main process. It has not been simulated. analysis_seed_sequence is the numpy SeedSequence for the random numbers that the analysis of the results needs, e.g., for the bootstrap confidence interval of the mean range. CollectOffDiagonalElements is the same as for the SimulationInstanceResult class.
+        self.alpha_beam = copy.copy(alpha_beam) # The results are calculated in a copy, so that the AlphaParticles object in the main process stays small.
+        self.Instance = Instance
+        self.NumberOfChunks = NumberOfChunks
+        self.OffDiagonalHistogram_NumberOfBins = OffDiagonalHistogram_NumberOfBins
+        self.analysis_seed_sequence = analysis_seed_sequence
+        self.CollectOffDiagonalElements = CollectOffDiagonalElements
+
+        self.MaximumPositionsX = np.full(alpha_beam.InitialParticleNumber, alpha_beam.InitialPositionX) # The ID of an alpha particle is its row.
+        self.OffDiagonalValues_Chunks = {} # The values of the off-diagonal elements of each chunk.
+        self.OffDiagonalHistogram_Counts = None # The histograms of all of the chunks added together.
+        self.NumberOfChunksReceived = 0
+
+
+    def add_ChunkResult(self, chunk_result): # Add the results of one chunk. This method gives back True once every chunk of the simulation instance has been added.
+        self.MaximumPositionsX[chunk_result.AlphaParticleIDs] = chunk_result.MaximumPositionsX
+
+        if not self.CollectOffDiagonalElements: # The chunk did not send back anything about the off-diagonal elements.
+            pass
+
+        elif chunk_result.OffDiagonalValues is not None:
+            self.OffDiagonalValues_Chunks[chunk_result.Chunk] = chunk_result.OffDiagonalValues
+
+        elif self.OffDiagonalHistogram_Counts is None:
+            self.OffDiagonalHistogram_Counts = chunk_result.OffDiagonalHistogram_Counts
+
+        else: # Adding up integer counts gives the same result in any order.
+            self.OffDiagonalHistogram_Counts = {OffDiagonalElement : self.OffDiagonalHistogram_Counts[OffDiagonalElement] + chunk_result.OffDiagonalHistogram_Counts[OffDiagonalElement] for OffDiagonalElement in OffDiagonalElements}
+
+        self.NumberOfChunksReceived = self.NumberOfChunksReceived + 1
+
+        return self.NumberOfChunksReceived == self.NumberOfChunks
+
+
+    def get_Result(self): # Calculate the results of the simulation instance from all of its chunks.
+        self.alpha_beam.PositionXArray = self.MaximumPositionsX[:, np.newaxis] # The calculate_Data() method only needs the furthest x-position of each alpha particle, as with the DepthSummaryStore class of the TrajectoryAdmin.py script.
+
+        if self.OffDiagonalValues_Chunks: # Put the values of the off-diagonal elements together in the order of the chunks, not in the order in which the chunks arrived.
+            for OffDiagonalElement in OffDiagonalElements:
+                setattr(self.alpha_beam, "RandomNumList_" + OffDiagonalElement, np.concatenate([self.OffDiagonalValues_Chunks[Chunk][OffDiagonalElement] for Chunk in sorted(self.OffDiagonalValues_Chunks)]))
+
+        if self.alpha_beam.BootstrapResamples > 0: # The bootstrap confidence interval needs a random number generator in the main process too.
+            self.alpha_beam.make_RandomNumberGenerator(self.analysis_seed_sequence)
+
+        self.alpha_beam.calculate_Data()
+
+        return SimulationInstanceResult(self.alpha_beam, self.Instance, self.OffDiagonalHistogram_NumberOfBins, self.OffDiagonalHistogram_Counts, self.CollectOffDiagonalElements)
+
+        # REFERENCES:
+            # Python Software Foundation (2020). setattr, https://docs.python.org/3/library/functions.html#setattr.
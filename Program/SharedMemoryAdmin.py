@@ -0,0 +1,85 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program lets the pooled processes of the Alpha Particles 2.0 program give their results to the main process through shared memory rather than by pickling them. A SharedArray object is a numpy array whose memory is a multiprocessing.shared_memory block. When a SharedArray object is pickled, e.g., because it is an attribute of an object that is sent to a pooled process or because a pooled process returns it, only the name, shape and data type of the block are pickled. The process that unpickles it attaches to the same block, so the numbers in the array are never copied between processes.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The SharedMemoryAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the SharedMemoryAdmin program needs.
+from multiprocessing import resource_tracker, shared_memory
+import sys
+import threading
+import numpy as np
+
+# REFERENCES:
+    # Python Software Foundation (2020). multiprocessing.shared_memory — Provides shared memory for direct access across processes, https://docs.python.org/3/library/multiprocessing.shared_memory.html.
+    # Python Software Foundation (2024). multiprocessing.shared_memory.SharedMemory (the track parameter), https://docs.python.org/3/library/multiprocessing.shared_memory.html#multiprocessing.shared_memory.SharedMemory.
+    # Python Software Foundation (2021). bpo-39959: (Windows and) POSIX shared memory is registered with the resource tracker when it is attached to, https://bugs.python.org/issue39959.
+    # NumPy. (2020). NumPy v1.19.0. Retrieved from https://numpy.org/
+
+AttachLock = threading.Lock() # Only one thread at a time may stop the resource tracker from registering a block, e.g., the main thread and the thread of a multiprocessing Pool that unpickles the results of the pooled processes.
+
+def attach_SharedMemoryBlock(Name): # Attach to the shared memory block that already has the name Name without registering it with the resource tracker.
+    # Only the process that made the block frees it, with the unlink() method. Before Python 3.13, attaching to a block registers it with the resource tracker as if the attaching process had made it. A pooled process with its own resource tracker would then free the block again when it exits, and unregistering it afterwards is not safe either, because a pooled process that was started with the spawn or forkserver start method shares the resource tracker of the main process, which would then not know the block when the main process unlinks it.
+    if sys.version_info >= (3, 13): # The block can be attached to without registering it.
+        return shared_memory.SharedMemory(name = Name, track = False)
+
+    register = resource_tracker.register
+
+    def register_UnlessAttached(name, rtype): # Every other block, e.g., one that another thread makes at the same time, is still registered.
+        if (rtype != "shared_memory") or (name.lstrip("/") != Name.lstrip("/")):
+            register(name, rtype)
+
+    with AttachLock:
+        resource_tracker.register = register_UnlessAttached
+        try:
+            return shared_memory.SharedMemory(name = Name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedArray:
+    def __init__(self, Shape, DataType = np.float64, Name = None): # Make a new shared memory block if Name is None. Otherwise, attach to the block that already has that name.
+        self.Shape = tuple(int(Length) for Length in Shape)
+        self.DataType = np.dtype(DataType)
+
+        if Name is None:
+            self.SharedMemoryBlock = shared_memory.SharedMemory(create = True, size = max(int(np.prod(self.Shape)) * self.DataType.itemsize, 1)) # A shared memory block cannot have a size of 0 bytes, e.g., when a pooled process has no alpha particles.
+            self.Array = np.ndarray(self.Shape, dtype = self.DataType, buffer = self.SharedMemoryBlock.buf)
+            self.Array[...] = 0 # A new shared memory block is not guaranteed to be filled with 0s on every operating system.
+
+        else:
+            self.SharedMemoryBlock = attach_SharedMemoryBlock(Name)
+            self.Array = np.ndarray(self.Shape, dtype = self.DataType, buffer = self.SharedMemoryBlock.buf)
+
+        self.Name = self.SharedMemoryBlock.name
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.ndarray, https://numpy.org/doc/stable/reference/generated/numpy.ndarray.html.
+
+
+    def __getstate__(self): # Only pickle what is needed to attach to the shared memory block.
+        return {"Name" : self.Name, "Shape" : self.Shape, "DataType" : self.DataType.str}
+
+
+    def __setstate__(self, State): # Attach to the shared memory block when unpickled.
+        self.__init__(State["Shape"], State["DataType"], State["Name"])
+
+        # REFERENCES:
+            # Python Software Foundation (2020). pickle — Python object serialization, https://docs.python.org/3/library/pickle.html#handling-stateful-objects.
+
+
+    def close(self): # Stop using the shared memory block in this process. Every numpy array that uses the block must have been deleted first.
+        self.Array = None
+        self.SharedMemoryBlock.close()
+
+
+    def unlink(self): # Free the shared memory block once no process needs it. This must only be done once, by the main process.
+        self.SharedMemoryBlock.unlink()
+
@@ -0,0 +1,91 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program makes the points of a parameter sweep of the beam analysis of the Alpha Particles 2.0 program and keeps the table of their results. Before this program was made, a range-energy table needed one run of the program, with all of its questions, for each initial kinetic energy and medium. A sweep is a job of a job spec file (see the BatchAdmin.py script) with the mode "s". Its points are every combination of the initial kinetic energies, initial particle numbers and media that it lists. The main script runs the simulation instances of all of the points with the same pool of processes at the same time, so the pooled processes are started once and are kept busy until the last point is done.
+# Each point is written to a checkpoint file as soon as it is done. If the sweep is run again with the same checkpoint file, e.g., after it was stopped, the points that are already in the checkpoint file are not run again. The results of all of the points are then written to one table in the order of the points.
+# A sweep job looks like this in a JSON job spec file:
+# {"name" : "RangeEnergy", "mode" : "s", "Initial kinetic energies" : [1e-4, 2e-4, 4e-4], "Initial particle numbers" : [20], "Materials" : "library", "Probability density function" : "basic", "Whether or not to seed" : "y", "Seed" : 0, "Number of simulation instances" : 2, "Checkpoint file" : "RangeEnergy_Checkpoint.csv"}
+# "Materials" can be "library" for every material in AttenuationQuiz_MaterialLibrary.csv, or a list of the names of some of them and/or of media given as {"Material name" : "Water", "Atomic number" : 7.2, "Atomic weight" : 18.015, "Mass density" : 1.0}. Instead of "Materials", a job can have "Atomic numbers", "Atomic weights" and "Mass densities", and every combination of them is used.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The SweepAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the SweepAdmin program needs.
+import csv
+import itertools
+import os
+
+# REFERENCES:
+    # Python Software Foundation (2020). csv — CSV File Reading and Writing, https://docs.python.org/3/library/csv.html.
+    # Python Software Foundation (2020). itertools.product, https://docs.python.org/3/library/itertools.html#itertools.product.
+
+PointColumns = ("Material", "Initial kinetic energy (MeV)", "Initial particle number", "Atomic number", "Atomic weight (g/mol)", "Mass density (g/cm^3)", "Number of simulation instances", "Seed") # The inputs of a point. Together, they say which point a row of the checkpoint file is for.
+ResultColumns = ("Mean range (m)", "Mean range uncertainty (m)", "Maximum range (m)", "Maximum range uncertainty (m)") # The uncertainties are 3 population standard deviations, as in the data file of the beam analysis.
+
+def get_Materials(job, MaterialLibrary): # The media of the sweep as (Material name, Atomic number, Atomic weight, Mass density) tuples. MaterialLibrary is the list of the media in AttenuationQuiz_MaterialLibrary.csv in the same form.
+    if "Materials" not in job: # Every combination of the atomic numbers, atomic weights and mass densities.
+        return [("Z={} A={} rho={}".format(AtomicNumber, AtomicWeight, MassDensity), AtomicNumber, AtomicWeight, MassDensity) for AtomicNumber, AtomicWeight, MassDensity in itertools.product(job["Atomic numbers"], job["Atomic weights"], job["Mass densities"])]
+
+    if job["Materials"] == "library":
+        return list(MaterialLibrary)
+
+    MaterialLibrary_Dict = {material[0] : material for material in MaterialLibrary}
+    Materials = []
+    for material in job["Materials"]:
+        if isinstance(material, dict):
+            Materials.append((str(material["Material name"]), material["Atomic number"], material["Atomic weight"], material["Mass density"]))
+
+        elif material in MaterialLibrary_Dict:
+            Materials.append(MaterialLibrary_Dict[material])
+
+        else:
+            raise KeyError("The material '{}' is not in AttenuationQuiz_MaterialLibrary.csv.".format(material))
+
+    return Materials
+
+
+def make_SweepPoints(job, Materials): # Every combination of the media, initial kinetic energies and initial particle numbers of the sweep, in that order.
+    return [dict(zip(PointColumns, (material[0], InitialKineticEnergy, InitialParticleNumber, material[1], material[2], material[3], job["Number of simulation instances"], job["Seed"] if job["Whether or not to seed"] in set(["y", "Y"]) else None))) for material, InitialKineticEnergy, InitialParticleNumber in itertools.product(Materials, job["Initial kinetic energies"], job["Initial particle numbers"])]
+
+
+def get_PointKey(sweep_point): # Compare the points as text, because that is how they are read back from the checkpoint file. The csv module writes None (the seed of an unseeded sweep) as an empty string, so it is compared as one too.
+    return tuple("" if sweep_point[Column] is None else str(sweep_point[Column]) for Column in PointColumns)
+
+
+def read_Checkpoint(FilePath): # The rows of the points that are already done, keyed by their points.
+    if not os.path.isfile(FilePath):
+        return {}
+
+    with open(FilePath, "r", newline = "") as CheckpointFile:
+        return {get_PointKey(Row) : Row for Row in csv.DictReader(CheckpointFile)}
+
+    # REFERENCES:
+        # Python Software Foundation (2020). csv.DictReader, https://docs.python.org/3/library/csv.html#csv.DictReader.
+
+
+def append_Checkpoint(FilePath, Row): # Add the row of a point that is done. The file is flushed straight away so that the row is kept even if the program is stopped.
+    WriteHeader = not os.path.isfile(FilePath)
+
+    with open(FilePath, "a", newline = "") as CheckpointFile:
+        csv_writer = csv.DictWriter(CheckpointFile, fieldnames = PointColumns + ResultColumns)
+        if WriteHeader:
+            csv_writer.writeheader()
+
+        csv_writer.writerow(Row)
+        CheckpointFile.flush()
+        os.fsync(CheckpointFile.fileno())
+
+    # REFERENCES:
+        # Python Software Foundation (2020). os.fsync, https://docs.python.org/3/library/os.html#os.fsync.
+
+
+def save_Table(FilePath, Rows): # Write the rows of all of the points to one table.
+    with open(FilePath, "w", newline = "") as TableFile:
+        csv_writer = csv.DictWriter(TableFile, fieldnames = PointColumns + ResultColumns)
+        csv_writer.writeheader()
+        csv_writer.writerows(Rows)
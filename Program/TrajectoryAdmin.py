@@ -0,0 +1,115 @@
+######################################################################################################################
+# The Alpha Particles 2.0 project was made by Kyrollos Iskandar.
+######################################################################################################################
+
+####################################### Notes about this program #########################################
+# NOTE: This program records the x-positions of the alpha particles for the Alpha Particles 2.0 program. By default, only the furthest x-position of each alpha particle is kept (DepthSummaryStore). The x-positions at every simulation step can be kept instead (TrajectoryStore). Before this program was made, the record_AlphaParticlePosition() method concatenated a new column onto the PositionXArray array at every simulation step, which copies the whole array every time. The TimingStudies/T1_Concatenation_numpy_pandas.py script measures how slow this gets. In the TrajectoryStore class, the array is made in advance and made larger only when it is full.
+# This program is meant to be run by the Alpha Particles 2.0 program. It is not supposed to be run directly, hence the if __name__ == "__main__" code block at the start of the script.
+##########################################################################################################
+if __name__ == "__main__": # This statement is put at the start of the script so that no time and resources are spent defining classes and functions when not needed.
+    print("Error: The TrajectoryAdmin program is supposed to be imported into the Alpha Particles 2.0 program and run inside it.")
+    exit() # The exit() function prevents the code below from being run in the case where the script is run directly.
+
+
+# Below are the modules that the TrajectoryAdmin program needs.
+import numpy as np
+
+# REFERENCES:
+    # NumPy. (2020). NumPy v1.19.0. Retrieved from https://numpy.org/
+
+class DepthSummaryStore: # This class keeps only what the analysis of the simulation needs from the x-positions: the furthest x-position that each alpha particle has reached. Its memory use grows with the number of alpha particles but not with the number of simulation steps. Each alpha particle always has the same row, which is found from its ID in the particle_store.ID array of the ParticleStore of the simulation (see the ParticleAdmin program).
+    def __init__(self, AlphaParticleIDs, InitialPositionX, RecordRemovals = False):
+        self.AlphaParticleIDs = np.array(AlphaParticleIDs, dtype = int) # The IDs of the alpha particles that this store keeps track of. In the radiotherapy game, each pooled process only has some of the alpha particles in the beam.
+
+        self.RowOfID = np.full(self.AlphaParticleIDs.max() + 1, -1, dtype = int) # Look-up array for finding the row of an alpha particle from its ID. IDs that are not kept track of have a row of -1.
+        self.RowOfID[self.AlphaParticleIDs] = np.arange(0, self.AlphaParticleIDs.shape[0])
+
+        self.MaximumPositionsX = np.full(self.AlphaParticleIDs.shape[0], float(InitialPositionX)) # The furthest x-position that each alpha particle has reached so far. Every alpha particle starts at the initial position.
+        self.SimulationStep = 0 # The number of simulation steps that have been recorded.
+
+        # The removal event log: the ID of each alpha particle that left the beam, the depth at which it left and the simulation step at which it did so, in the order in which the alpha particles left. This is optional because it is not needed for the mean range and maximum range.
+        self.RecordRemovals = RecordRemovals
+        if self.RecordRemovals:
+            self.RemovalIDs = np.zeros(self.AlphaParticleIDs.shape[0], dtype = int) # Each alpha particle leaves the beam once at most, so the log never has more events than there are alpha particles.
+            self.RemovalPositionsX = np.zeros(self.AlphaParticleIDs.shape[0])
+            self.RemovalSteps = np.zeros(self.AlphaParticleIDs.shape[0], dtype = int)
+            self.RemovalCount = 0 # The number of events in the log. They are the first RemovalCount entries of the arrays above.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.full, https://numpy.org/doc/stable/reference/generated/numpy.full.html.
+
+
+    def record_PositionsX(self, AlphaParticleIDs, PositionsX): # Record the x-positions of the alpha particles that are still in the beam for one simulation step.
+        Rows = self.RowOfID[AlphaParticleIDs] # The IDs are integers in the particle store (see the ParticleAdmin.py script), so they are used as indices without being converted.
+        self.MaximumPositionsX[Rows] = np.maximum(self.MaximumPositionsX[Rows], PositionsX) # Each alpha particle is only once in the beam, so the rows are all different from each other.
+        self.SimulationStep = self.SimulationStep + 1
+
+        return Rows
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.maximum, https://numpy.org/doc/stable/reference/generated/numpy.maximum.html.
+
+
+    def record_Removals(self, AlphaParticleIDs, PositionsX): # Add the alpha particles that left the beam at this simulation step to the removal event log. This method does nothing if the store was made with RecordRemovals = False.
+        if self.RecordRemovals:
+            NewRemovalCount = self.RemovalCount + len(AlphaParticleIDs)
+            self.RemovalIDs[self.RemovalCount:NewRemovalCount] = AlphaParticleIDs
+            self.RemovalPositionsX[self.RemovalCount:NewRemovalCount] = PositionsX
+            self.RemovalSteps[self.RemovalCount:NewRemovalCount] = self.SimulationStep
+            self.RemovalCount = NewRemovalCount
+
+
+    def get_RemovalEvents(self): # Give back the removal event log as three arrays: the IDs of the alpha particles that left the beam, the depths at which they left and the simulation steps at which they left. The depths are the ranges of the alpha particles, e.g., for range straggling statistics.
+        if not self.RecordRemovals:
+            return None
+
+        return self.RemovalIDs[0:self.RemovalCount], self.RemovalPositionsX[0:self.RemovalCount], self.RemovalSteps[0:self.RemovalCount]
+
+
+    def get_MaximumPositionsX(self): # Give back the furthest x-position that each alpha particle has reached.
+        return self.MaximumPositionsX
+
+
+    def get_PositionXArray(self): # Give back the furthest x-positions as an array with one row per alpha particle and one column. PositionXArray[particle, :].max() and PositionXArray.max().max() give the same results as they would for the full PositionXArray array. So the calculate_Data() and calculate_MaximumRange() methods work without changes.
+        return self.MaximumPositionsX[:, np.newaxis]
+
+        # REFERENCES:
+            # The SciPy community (2020). Indexing, https://numpy.org/doc/stable/reference/arrays.indexing.html.
+
+
+class TrajectoryStore(DepthSummaryStore): # This class keeps the x-position of each alpha particle at *each* simulation step, as well as what the DepthSummaryStore class keeps. It uses much more memory than the DepthSummaryStore class, so it is only used when the full trajectories are wanted.
+    def __init__(self, AlphaParticleIDs, InitialPositionX, RecordRemovals = False, InitialStepCapacity = 64):
+        super().__init__(AlphaParticleIDs, InitialPositionX, RecordRemovals)
+
+        # The buffer has one row per simulation step and one column per alpha particle so that the x-positions of each simulation step are written into memory that is next to each other. The get_PositionXArray() method transposes it back into the layout that PositionXArray always had: one row per alpha particle and one column per simulation step.
+        self.Buffer = np.zeros((max(int(InitialStepCapacity), 1), self.AlphaParticleIDs.shape[0])) # Alpha particles that have left the beam keep an x-position of 0 for the rest of the simulation steps, as they did when the array was padded with 0s.
+        self.Buffer[0, :] = InitialPositionX # The first column of PositionXArray is the initial position of the alpha particles.
+        self.StepsRecorded = 1 # The number of simulation steps that have been written into the buffer, including the initial position.
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.zeros, https://numpy.org/doc/stable/reference/generated/numpy.zeros.html.
+
+
+    def grow_Buffer(self): # Double the number of simulation steps that the buffer can hold. Doubling means that the buffer only has to be copied a few times over the whole simulation, so each simulation step costs the same on average.
+        LargerBuffer = np.zeros((2 * self.Buffer.shape[0], self.Buffer.shape[1]))
+        LargerBuffer[0:self.StepsRecorded, :] = self.Buffer[0:self.StepsRecorded, :]
+        self.Buffer = LargerBuffer
+
+
+    def record_PositionsX(self, AlphaParticleIDs, PositionsX): # Record the x-positions of the alpha particles that are still in the beam for one simulation step.
+        Rows = super().record_PositionsX(AlphaParticleIDs, PositionsX) # Keep the furthest x-positions up to date too.
+
+        if self.StepsRecorded == self.Buffer.shape[0]: # The buffer is full.
+            self.grow_Buffer()
+
+        self.Buffer[self.StepsRecorded, Rows] = PositionsX
+        self.StepsRecorded = self.StepsRecorded + 1
+
+        return Rows
+
+
+    def get_PositionXArray(self): # Give back the x-positions in the same layout as the old PositionXArray array. This is a view of the buffer rather than a copy, so it is cheap to get it at every simulation step.
+        return self.Buffer[0:self.StepsRecorded, :].T
+
+        # REFERENCES:
+            # The SciPy community (2020). numpy.ndarray.T, https://numpy.org/doc/stable/reference/generated/numpy.ndarray.T.html.